@@ -8,13 +8,17 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from app.core.settings import DATABASE_URL
 from app.infra import (  # noqa: F401
+    ai_usage_ledger,
     global_ai_quota,
     minutes_live_state,
+    minutes_transcript_archive,
+    minutes_transcript_chunk,
     reservation,
     reservation_attendee,
     reservation_label,
     room,
     timetable,
+    transcription_cache,
     user,
     user_ai_quota,
 )
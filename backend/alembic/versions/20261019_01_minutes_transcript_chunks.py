@@ -0,0 +1,41 @@
+"""add minutes transcript chunks
+
+Revision ID: 20261019_01
+Revises: 20260426_03
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import alembic.op as op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_01"
+down_revision: str | Sequence[str] | None = "20260426_03"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "minutes_transcript_chunks",
+        sa.Column("reservation_id", sa.String(length=50), nullable=False),
+        sa.Column("seq", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("created_by_user_id", sa.String(length=50), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.ForeignKeyConstraint(["reservation_id"], ["reservations.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["created_by_user_id"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("reservation_id", "seq"),
+    )
+    op.add_column(
+        "minutes_live_states",
+        sa.Column("transcript_seq", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("minutes_live_states", "transcript_seq")
+    op.drop_table("minutes_transcript_chunks")
@@ -0,0 +1,75 @@
+"""add minutes transcript archives
+
+Revision ID: 20261019_02
+Revises: 20261019_01
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+import zlib
+from collections.abc import Sequence
+
+import alembic.op as op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_02"
+down_revision: str | Sequence[str] | None = "20261019_01"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "minutes_transcript_archives",
+        sa.Column("reservation_id", sa.String(length=50), nullable=False),
+        sa.Column("codec", sa.String(length=20), nullable=False),
+        sa.Column("transcript_data", sa.LargeBinary(), nullable=False),
+        sa.Column("transcript_size", sa.Integer(), nullable=False),
+        sa.Column("transcript_seq", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("updated_by_user_id", sa.String(length=50), nullable=True),
+        sa.Column("updated_by_name", sa.String(length=100), nullable=True),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.ForeignKeyConstraint(["reservation_id"], ["reservations.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["updated_by_user_id"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("reservation_id"),
+    )
+
+
+def downgrade() -> None:
+    # 보관본을 지우기 전에 압축을 풀어 minutes_live_states로 되돌린다.
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text(
+            """
+            SELECT reservation_id, codec, transcript_data, transcript_seq, updated_by_user_id, updated_by_name
+            FROM minutes_transcript_archives
+            """
+        )
+    ).all()
+    for row in rows:
+        data = bytes(row.transcript_data)
+        transcript_text = (zlib.decompress(data) if row.codec == "zlib" else data).decode("utf-8")
+        connection.execute(
+            sa.text(
+                """
+                INSERT INTO minutes_live_states (
+                    reservation_id, transcript_text, is_recording, transcript_seq,
+                    updated_by_user_id, updated_by_name, updated_at
+                )
+                VALUES (
+                    :reservation_id, :transcript_text, false, :transcript_seq,
+                    :updated_by_user_id, :updated_by_name, now()
+                )
+                ON CONFLICT (reservation_id) DO NOTHING
+                """
+            ),
+            {
+                "reservation_id": row.reservation_id,
+                "transcript_text": transcript_text,
+                "transcript_seq": row.transcript_seq,
+                "updated_by_user_id": row.updated_by_user_id,
+                "updated_by_name": row.updated_by_name,
+            },
+        )
+    op.drop_table("minutes_transcript_archives")
@@ -0,0 +1,38 @@
+"""add transcription cache entries
+
+Revision ID: 20261019_04
+Revises: 20261019_03
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import alembic.op as op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_04"
+down_revision: str | Sequence[str] | None = "20261019_03"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transcription_cache_entries",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.PrimaryKeyConstraint("content_hash"),
+    )
+    op.create_index(
+        "ix_transcription_cache_entries_created_at",
+        "transcription_cache_entries",
+        ["created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transcription_cache_entries_created_at", table_name="transcription_cache_entries")
+    op.drop_table("transcription_cache_entries")
@@ -0,0 +1,43 @@
+"""add ai usage ledger entries
+
+Revision ID: 20261019_05
+Revises: 20261019_04
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import alembic.op as op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_05"
+down_revision: str | Sequence[str] | None = "20261019_04"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ai_usage_ledger_entries",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.String(length=50), nullable=False),
+        sa.Column("usd_cost", sa.Numeric(precision=12, scale=6), nullable=False),
+        sa.Column("period_month", sa.String(length=7), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("rolled_up_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_ai_usage_ledger_entries_pending",
+        "ai_usage_ledger_entries",
+        ["period_month", "user_id"],
+        postgresql_where=sa.text("rolled_up_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ai_usage_ledger_entries_pending", table_name="ai_usage_ledger_entries")
+    op.drop_table("ai_usage_ledger_entries")
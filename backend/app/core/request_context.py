@@ -0,0 +1,33 @@
+from contextvars import ContextVar
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# 요청 밖(스크립트, 테스트)에서 직접 지정하는 라우트 이름
+current_route: ContextVar[str | None] = ContextVar("current_route", default=None)
+_current_scope: ContextVar[Scope | None] = ContextVar("current_scope", default=None)
+
+
+class RequestContextMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in {"http", "websocket"}:
+            await self.app(scope, receive, send)
+            return
+
+        token = _current_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_scope.reset(token)
+
+
+def get_current_route() -> str | None:
+    scope = _current_scope.get()
+    if scope is None:
+        return current_route.get()
+    # 라우팅이 끝나면 scope에 라우트가 들어오므로, 경로 변수가 달라도 같은 엔드포인트는 한 이름으로 모은다.
+    route = scope.get("route")
+    path = getattr(route, "path", None) or scope.get("path", "")
+    return f"{scope.get('method', 'WS')} {path}"
@@ -21,4 +21,82 @@ SESSION_COOKIE_SECURE = os.getenv("SESSION_COOKIE_SECURE", "false").lower() == "
 SESSION_SIGNING_SECRET = os.getenv("SESSION_SIGNING_SECRET", "change-this-in-production")
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "").strip()
+# openai: 실제 API, fake: 비용 없이 정해진 응답을 돌려주는 로컬 대역(부하/회귀 테스트용)
+AI_PROVIDER = os.getenv("AI_PROVIDER", "openai").strip().lower()
 AI_GLOBAL_MONTHLY_LIMIT_USD = os.getenv("AI_GLOBAL_MONTHLY_LIMIT_USD", "5.0000").strip()
+# AI 호출 전에 한도에서 미리 잡아 두는 1회 예상 비용(USD). 호출이 끝나면 실제 비용으로 정산한다.
+AI_QUOTA_HOLD_TRANSCRIPTION_USD = os.getenv("AI_QUOTA_HOLD_TRANSCRIPTION_USD", "0.005000").strip()
+AI_QUOTA_HOLD_SUMMARY_USD = os.getenv("AI_QUOTA_HOLD_SUMMARY_USD", "0.010000").strip()
+
+
+def _get_int_env(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+SLOW_QUERY_THRESHOLD_MS = _get_int_env("SLOW_QUERY_THRESHOLD_MS", 500)
+SLOW_QUERY_LOG_SIZE = _get_int_env("SLOW_QUERY_LOG_SIZE", 100)
+SLOW_QUERY_EXPLAIN_ENABLED = os.getenv("SLOW_QUERY_EXPLAIN_ENABLED", "true").lower() == "true"
+
+# memory: 프로세스 내부 전달, postgres: LISTEN/NOTIFY로 워커 간 공유
+RESERVATION_EVENT_BACKEND = os.getenv("RESERVATION_EVENT_BACKEND", "memory").strip().lower()
+RESERVATION_EVENT_LOG_SIZE = _get_int_env("RESERVATION_EVENT_LOG_SIZE", 500)
+RESERVATION_EVENT_MAX_PENDING = _get_int_env("RESERVATION_EVENT_MAX_PENDING", 100)
+
+# 만료된 회의록 잠금 정리 주기(초). 0 이하이면 끈다.
+MINUTES_LOCK_SWEEP_INTERVAL_SECONDS = _get_int_env("MINUTES_LOCK_SWEEP_INTERVAL_SECONDS", 10)
+
+# OpenAI 공용 클라이언트 커넥션 풀/타임아웃
+OPENAI_TIMEOUT_SECONDS = _get_int_env("OPENAI_TIMEOUT_SECONDS", 60)
+OPENAI_CONNECT_TIMEOUT_SECONDS = _get_int_env("OPENAI_CONNECT_TIMEOUT_SECONDS", 5)
+OPENAI_MAX_CONNECTIONS = _get_int_env("OPENAI_MAX_CONNECTIONS", 20)
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = _get_int_env("OPENAI_MAX_KEEPALIVE_CONNECTIONS", 10)
+OPENAI_KEEPALIVE_EXPIRY_SECONDS = _get_int_env("OPENAI_KEEPALIVE_EXPIRY_SECONDS", 30)
+OPENAI_MAX_RETRIES = _get_int_env("OPENAI_MAX_RETRIES", 2)
+
+# 전사용 오디오 업로드 상한과, 이 크기까지는 메모리에 두고 넘으면 임시 파일로 넘기는 기준
+AI_AUDIO_UPLOAD_MAX_BYTES = _get_int_env("AI_AUDIO_UPLOAD_MAX_BYTES", 25 * 1024 * 1024)
+AI_AUDIO_SPOOL_MAX_BYTES = _get_int_env("AI_AUDIO_SPOOL_MAX_BYTES", 1024 * 1024)
+
+# 무음 청크 건너뛰기: WAV(16비트 PCM) 청크를 프레임(ms) 단위로 나눠 RMS가 기준(16비트 진폭, 0 이하이면 끈다)을 넘는
+# 프레임이 합쳐서 AI_SILENCE_MIN_VOICED_MS보다 짧으면 전사를 요청하지 않는다.
+AI_SILENCE_RMS_THRESHOLD = _get_int_env("AI_SILENCE_RMS_THRESHOLD", 300)
+AI_SILENCE_FRAME_MS = _get_int_env("AI_SILENCE_FRAME_MS", 30)
+AI_SILENCE_MIN_VOICED_MS = _get_int_env("AI_SILENCE_MIN_VOICED_MS", 150)
+
+# 전사 작업 큐: 동시에 전사를 요청하는 워커 수, 대기 가능한 작업 수, 재시도 횟수와 첫 재시도 대기(ms, 이후 2배씩)
+# 큐와 예약별 반영 순서는 프로세스 메모리에 있으므로 서버 워커 프로세스는 하나로 띄운다.
+TRANSCRIPTION_WORKER_COUNT = _get_int_env("TRANSCRIPTION_WORKER_COUNT", 4)
+TRANSCRIPTION_QUEUE_SIZE = _get_int_env("TRANSCRIPTION_QUEUE_SIZE", 100)
+TRANSCRIPTION_MAX_ATTEMPTS = _get_int_env("TRANSCRIPTION_MAX_ATTEMPTS", 3)
+TRANSCRIPTION_RETRY_BASE_MS = _get_int_env("TRANSCRIPTION_RETRY_BASE_MS", 500)
+
+# 같은 오디오 청크를 다시 보내면 전사를 다시 요청하지 않고 저장된 결과를 쓴다.
+# 메모리 LRU 항목 수와, 워커/재시작 간에 공유할 DB 캐시 사용 여부와 보관 시간
+TRANSCRIPTION_CACHE_SIZE = _get_int_env("TRANSCRIPTION_CACHE_SIZE", 512)
+TRANSCRIPTION_CACHE_DB_ENABLED = os.getenv("TRANSCRIPTION_CACHE_DB_ENABLED", "false").lower() == "true"
+TRANSCRIPTION_CACHE_DB_TTL_HOURS = _get_int_env("TRANSCRIPTION_CACHE_DB_TTL_HOURS", 24)
+
+# 회의록 초안 생성: 전사가 이 글자 수를 넘으면 화자 단위로 나눠 구간별로 요약한 뒤 합친다. 구간 요약 동시 요청 수
+AI_SUMMARY_CHUNK_CHARS = _get_int_env("AI_SUMMARY_CHUNK_CHARS", 12000)
+AI_SUMMARY_MAX_CONCURRENCY = _get_int_env("AI_SUMMARY_MAX_CONCURRENCY", 4)
+
+# AI 사용량 원장: 한도 확인용 전사 사용량 캐시 유지 시간(초),
+# 원장을 합계 행으로 옮기는 주기(초, 0 이하이면 끈다)와 한 번에 옮길 항목 수
+AI_USAGE_CACHE_TTL_SECONDS = _get_int_env("AI_USAGE_CACHE_TTL_SECONDS", 5)
+AI_USAGE_ROLLUP_INTERVAL_SECONDS = _get_int_env("AI_USAGE_ROLLUP_INTERVAL_SECONDS", 30)
+AI_USAGE_ROLLUP_BATCH_SIZE = _get_int_env("AI_USAGE_ROLLUP_BATCH_SIZE", 500)
+# 정산/취소되지 않은 예상 비용 예약을 버리는 시간(초). 예약은 워커 프로세스마다 따로 잡으므로
+# 동시에 한도를 넘을 수 있는 양은 최대 (워커 수 × 워커별 진행 중 예약 합)이다.
+AI_QUOTA_HOLD_TTL_SECONDS = _get_int_env("AI_QUOTA_HOLD_TTL_SECONDS", 600)
+
+# AI_PROVIDER=fake 일 때 응답 지연(ms), 실패 비율(0~1), 응답마다 보고할 토큰 수
+FAKE_AI_LATENCY_MS = _get_int_env("FAKE_AI_LATENCY_MS", 200)
+FAKE_AI_ERROR_RATE = os.getenv("FAKE_AI_ERROR_RATE", "0").strip()
+FAKE_AI_INPUT_TOKENS = _get_int_env("FAKE_AI_INPUT_TOKENS", 1000)
+FAKE_AI_OUTPUT_TOKENS = _get_int_env("FAKE_AI_OUTPUT_TOKENS", 200)
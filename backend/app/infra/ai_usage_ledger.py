@@ -0,0 +1,102 @@
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, String, func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infra.db import Base
+
+
+class AiUsageLedgerEntry(Base):
+    __tablename__ = "ai_usage_ledger_entries"
+    __table_args__ = (
+        # 롤업 전 항목만 자주 읽으므로 그 행들만 색인한다.
+        Index(
+            "ix_ai_usage_ledger_entries_pending",
+            "period_month",
+            "user_id",
+            postgresql_where=text("rolled_up_at IS NULL"),
+            sqlite_where=text("rolled_up_at IS NULL"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    usd_cost: Mapped[Decimal] = mapped_column(Numeric(12, 6), nullable=False)
+    period_month: Mapped[str] = mapped_column(String(7), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    # 사용자/전사 합계 행에 반영된 시각. 반영 전에는 NULL이다.
+    rolled_up_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+def add_ai_usage_ledger_entry(
+    db: AsyncSession,
+    user_id: str,
+    usd_cost: Decimal,
+    period_month: str,
+) -> AiUsageLedgerEntry:
+    entry = AiUsageLedgerEntry(user_id=user_id, usd_cost=usd_cost, period_month=period_month)
+    db.add(entry)
+    return entry
+
+
+async def sum_pending_user_ai_usage(db: AsyncSession, user_id: str, period_month: str) -> Decimal:
+    total = await db.scalar(
+        select(func.coalesce(func.sum(AiUsageLedgerEntry.usd_cost), 0)).where(
+            AiUsageLedgerEntry.period_month == period_month,
+            AiUsageLedgerEntry.user_id == user_id,
+            AiUsageLedgerEntry.rolled_up_at.is_(None),
+        )
+    )
+    return Decimal(str(total or 0))
+
+
+async def list_pending_ai_usage_by_user(
+    db: AsyncSession,
+    period_month: str,
+) -> list[tuple[str, Decimal, datetime]]:
+    rows = await db.execute(
+        select(
+            AiUsageLedgerEntry.user_id,
+            func.sum(AiUsageLedgerEntry.usd_cost),
+            func.max(AiUsageLedgerEntry.created_at),
+        )
+        .where(
+            AiUsageLedgerEntry.period_month == period_month,
+            AiUsageLedgerEntry.rolled_up_at.is_(None),
+        )
+        .group_by(AiUsageLedgerEntry.user_id)
+    )
+    return list(rows.tuples().all())
+
+
+async def list_pending_ai_usage_ledger_entries(db: AsyncSession, limit: int) -> list[AiUsageLedgerEntry]:
+    rows = await db.execute(
+        select(AiUsageLedgerEntry)
+        .where(AiUsageLedgerEntry.rolled_up_at.is_(None))
+        .order_by(AiUsageLedgerEntry.id.asc())
+        .limit(limit)
+    )
+    return list(rows.scalars().all())
+
+
+async def mark_ai_usage_ledger_entries_rolled_up(
+    db: AsyncSession,
+    entry_ids: list[int],
+    rolled_up_at: datetime,
+) -> None:
+    await db.execute(
+        update(AiUsageLedgerEntry)
+        .where(AiUsageLedgerEntry.id.in_(entry_ids))
+        .values(rolled_up_at=rolled_up_at)
+        .execution_options(synchronize_session=False)
+    )
@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.settings import DATABASE_URL
+from app.infra.slow_query_log import slow_query_log
 
 
 # Base 스캐폴딩
@@ -14,8 +15,14 @@ class Base(DeclarativeBase):
 # Engine과 SessionLocal 스캐폴딩 추가
 engine = create_async_engine(DATABASE_URL, future=True)
 SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+slow_query_log.install(engine)
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with SessionLocal() as session:
         yield session
+
+
+# 요청 하나보다 오래 사는 연결(WebSocket 등)은 이 팩토리로 메시지마다 짧은 세션을 연다.
+def get_db_session_factory() -> async_sessionmaker[AsyncSession]:
+    return SessionLocal
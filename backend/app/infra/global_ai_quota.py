@@ -5,6 +5,7 @@ from sqlalchemy import DateTime, Numeric, String, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.infra.ai_usage_ledger import AiUsageLedgerEntry
 from app.infra.db import Base
 
 
@@ -48,6 +49,27 @@ async def find_global_ai_quota(
     return row.scalar_one_or_none()
 
 
+async def find_global_ai_quota_with_pending_usd(
+    db: AsyncSession,
+    period_month: str,
+) -> tuple[GlobalAiQuota, Decimal] | None:
+    # 합계 행과 아직 롤업하지 않은 원장 합계를 한 문장으로 읽어, 그 사이 롤업이 끼어도 두 번 세거나 빠뜨리지 않는다.
+    pending_usd = (
+        select(func.coalesce(func.sum(AiUsageLedgerEntry.usd_cost), 0))
+        .where(
+            AiUsageLedgerEntry.period_month == period_month,
+            AiUsageLedgerEntry.rolled_up_at.is_(None),
+        )
+        .scalar_subquery()
+    )
+    rows = await db.execute(select(GlobalAiQuota, pending_usd).where(GlobalAiQuota.quota_key == GLOBAL_AI_QUOTA_KEY))
+    row = rows.tuples().first()
+    if row is None:
+        return None
+    quota, pending = row
+    return quota, Decimal(str(pending or 0))
+
+
 async def find_or_create_global_ai_quota(
     db: AsyncSession,
     period_month: str,
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func, select
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -17,6 +17,8 @@ class MinutesLiveState(Base):
     )
     transcript_text: Mapped[str] = mapped_column(Text, nullable=False, default="", server_default="")
     is_recording: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default="false")
+    # transcript_text에 이미 합쳐진 마지막 전사 조각 번호
+    transcript_seq: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     updated_by_user_id: Mapped[str | None] = mapped_column(
         String(50),
         ForeignKey("users.id", ondelete="SET NULL"),
@@ -61,3 +63,13 @@ async def add_or_update_minutes_live_state(
     state.updated_by_user_id = updated_by_user_id
     state.updated_by_name = updated_by_name
     return state
+
+
+async def list_idle_minutes_live_states(db: AsyncSession, limit: int) -> list[MinutesLiveState]:
+    rows = await db.execute(
+        select(MinutesLiveState)
+        .where(MinutesLiveState.is_recording.is_(False))
+        .order_by(MinutesLiveState.updated_at)
+        .limit(limit)
+    )
+    return list(rows.scalars())
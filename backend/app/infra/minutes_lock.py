@@ -1,10 +1,13 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, func, select
+from sqlalchemy import DateTime, ForeignKey, String, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infra.db import Base
+from app.infra.minutes_live_state import MinutesLiveState
 
 
 class MinutesLock(Base):
@@ -35,28 +38,35 @@ async def find_minutes_lock(db: AsyncSession, reservation_id: str) -> MinutesLoc
     return row.scalar_one_or_none()
 
 
-async def add_or_update_minutes_lock(
+async def upsert_minutes_lock_if_available(
     db: AsyncSession,
     reservation_id: str,
     holder_user_id: str,
     holder_name: str,
     expires_at: datetime,
-) -> MinutesLock:
-    lock = await find_minutes_lock(db, reservation_id)
-    if lock is None:
-        lock = MinutesLock(
-            reservation_id=reservation_id,
-            holder_user_id=holder_user_id,
-            holder_name=holder_name,
-            expires_at=expires_at,
-        )
-        db.add(lock)
-        return lock
-
-    lock.holder_user_id = holder_user_id
-    lock.holder_name = holder_name
-    lock.expires_at = expires_at
-    return lock
+    now: datetime,
+) -> MinutesLock | None:
+    # 잠금이 없거나, 만료됐거나, 본인 잠금일 때만 한 문장으로 획득/연장한다.
+    # 다른 사용자가 유효한 잠금을 갖고 있으면 아무 행도 돌려주지 않는다.
+    insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    statement = insert(MinutesLock).values(
+        reservation_id=reservation_id,
+        holder_user_id=holder_user_id,
+        holder_name=holder_name,
+        expires_at=expires_at,
+    )
+    upsert = statement.on_conflict_do_update(
+        index_elements=[MinutesLock.reservation_id],
+        set_={
+            "holder_user_id": statement.excluded.holder_user_id,
+            "holder_name": statement.excluded.holder_name,
+            "expires_at": statement.excluded.expires_at,
+            "updated_at": func.now(),
+        },
+        where=or_(MinutesLock.expires_at <= now, MinutesLock.holder_user_id == holder_user_id),
+    ).returning(MinutesLock)
+    rows = await db.scalars(upsert, execution_options={"populate_existing": True})
+    return rows.one_or_none()
 
 
 async def delete_minutes_lock(db: AsyncSession, reservation_id: str) -> bool:
@@ -65,3 +75,42 @@ async def delete_minutes_lock(db: AsyncSession, reservation_id: str) -> bool:
         return False
     await db.delete(lock)
     return True
+
+
+async def delete_expired_minutes_locks(db: AsyncSession, now: datetime) -> list[str]:
+    # 만료된 잠금을 지우고, 해당 예약의 녹음 상태도 함께 끈다.
+    if db.get_bind().dialect.name == "postgresql":
+        # PostgreSQL은 data-modifying CTE로 삭제와 녹음 해제를 한 문장에 처리한다.
+        expired = (
+            delete(MinutesLock)
+            .where(MinutesLock.expires_at <= now)
+            .returning(MinutesLock.reservation_id)
+            .cte("expired_minutes_locks")
+        )
+        stopped = (
+            update(MinutesLiveState)
+            .where(
+                MinutesLiveState.reservation_id.in_(select(expired.c.reservation_id)),
+                MinutesLiveState.is_recording.is_(True),
+            )
+            .values(is_recording=False, updated_at=func.now())
+            .returning(MinutesLiveState.reservation_id)
+            .cte("stopped_minutes_live_states")
+        )
+        rows = await db.execute(select(expired.c.reservation_id).add_cte(stopped))
+        return list(rows.scalars())
+
+    expired_ids = select(MinutesLock.reservation_id).where(MinutesLock.expires_at <= now)
+    await db.execute(
+        update(MinutesLiveState)
+        .where(MinutesLiveState.reservation_id.in_(expired_ids), MinutesLiveState.is_recording.is_(True))
+        .values(is_recording=False, updated_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+    rows = await db.execute(
+        delete(MinutesLock)
+        .where(MinutesLock.expires_at <= now)
+        .returning(MinutesLock.reservation_id)
+        .execution_options(synchronize_session=False)
+    )
+    return list(rows.scalars())
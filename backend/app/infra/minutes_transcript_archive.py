@@ -0,0 +1,83 @@
+import zlib
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, LargeBinary, String, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infra.db import Base
+
+TRANSCRIPT_CODEC_ZLIB = "zlib"
+TRANSCRIPT_CODEC_PLAIN = "plain"
+TRANSCRIPT_COMPRESSION_LEVEL = 6
+
+
+class MinutesTranscriptArchive(Base):
+    __tablename__ = "minutes_transcript_archives"
+
+    reservation_id: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("reservations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    codec: Mapped[str] = mapped_column(String(20), nullable=False)
+    transcript_data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    # 압축 전 UTF-8 바이트 수
+    transcript_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    transcript_seq: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    updated_by_user_id: Mapped[str | None] = mapped_column(
+        String(50),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    updated_by_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+
+def encode_transcript(text: str) -> tuple[str, bytes]:
+    raw = text.encode("utf-8")
+    compressed = zlib.compress(raw, TRANSCRIPT_COMPRESSION_LEVEL)
+    # 짧은 전사는 압축하면 오히려 커지므로 원문 그대로 둔다.
+    if len(compressed) >= len(raw):
+        return TRANSCRIPT_CODEC_PLAIN, raw
+    return TRANSCRIPT_CODEC_ZLIB, compressed
+
+
+def decode_transcript(codec: str, data: bytes) -> str:
+    if codec == TRANSCRIPT_CODEC_ZLIB:
+        return zlib.decompress(data).decode("utf-8")
+    return data.decode("utf-8")
+
+
+async def find_minutes_transcript_archive(db: AsyncSession, reservation_id: str) -> MinutesTranscriptArchive | None:
+    row = await db.execute(
+        select(MinutesTranscriptArchive).where(MinutesTranscriptArchive.reservation_id == reservation_id)
+    )
+    return row.scalar_one_or_none()
+
+
+async def add_or_update_minutes_transcript_archive(
+    db: AsyncSession,
+    reservation_id: str,
+    transcript_text: str,
+    transcript_seq: int,
+    updated_by_user_id: str | None,
+    updated_by_name: str | None,
+) -> MinutesTranscriptArchive:
+    codec, data = encode_transcript(transcript_text)
+    archive = await find_minutes_transcript_archive(db, reservation_id)
+    if archive is None:
+        archive = MinutesTranscriptArchive(reservation_id=reservation_id)
+        db.add(archive)
+    archive.codec = codec
+    archive.transcript_data = data
+    archive.transcript_size = len(transcript_text.encode("utf-8"))
+    archive.transcript_seq = transcript_seq
+    archive.updated_by_user_id = updated_by_user_id
+    archive.updated_by_name = updated_by_name
+    return archive
@@ -0,0 +1,74 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infra.db import Base
+
+
+class MinutesTranscriptChunk(Base):
+    __tablename__ = "minutes_transcript_chunks"
+
+    reservation_id: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("reservations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    created_by_user_id: Mapped[str | None] = mapped_column(
+        String(50),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+
+async def find_last_transcript_chunk_seq(db: AsyncSession, reservation_id: str) -> int | None:
+    row = await db.execute(
+        select(func.max(MinutesTranscriptChunk.seq)).where(MinutesTranscriptChunk.reservation_id == reservation_id)
+    )
+    return row.scalar_one_or_none()
+
+
+def add_minutes_transcript_chunk(
+    db: AsyncSession,
+    reservation_id: str,
+    seq: int,
+    text: str,
+    created_by_user_id: str | None,
+) -> MinutesTranscriptChunk:
+    chunk = MinutesTranscriptChunk(
+        reservation_id=reservation_id,
+        seq=seq,
+        text=text,
+        created_by_user_id=created_by_user_id,
+    )
+    db.add(chunk)
+    return chunk
+
+
+async def list_minutes_transcript_chunks(
+    db: AsyncSession,
+    reservation_id: str,
+    after_seq: int = 0,
+) -> list[MinutesTranscriptChunk]:
+    rows = await db.execute(
+        select(MinutesTranscriptChunk)
+        .where(MinutesTranscriptChunk.reservation_id == reservation_id, MinutesTranscriptChunk.seq > after_seq)
+        .order_by(MinutesTranscriptChunk.seq)
+    )
+    return list(rows.scalars())
+
+
+async def delete_minutes_transcript_chunks(db: AsyncSession, reservation_id: str, up_to_seq: int) -> None:
+    await db.execute(
+        delete(MinutesTranscriptChunk)
+        .where(MinutesTranscriptChunk.reservation_id == reservation_id, MinutesTranscriptChunk.seq <= up_to_seq)
+        .execution_options(synchronize_session=False)
+    )
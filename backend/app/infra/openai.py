@@ -1,8 +1,33 @@
+import asyncio
+import json
+import random
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from typing import IO, Protocol
 
-from openai import OpenAI
+import httpx
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    InternalServerError,
+    RateLimitError,
+)
 
-from app.core.settings import OPENAI_API_KEY
+from app.core.settings import (
+    AI_PROVIDER,
+    FAKE_AI_ERROR_RATE,
+    FAKE_AI_INPUT_TOKENS,
+    FAKE_AI_LATENCY_MS,
+    FAKE_AI_OUTPUT_TOKENS,
+    OPENAI_API_KEY,
+    OPENAI_CONNECT_TIMEOUT_SECONDS,
+    OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+    OPENAI_MAX_CONNECTIONS,
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+    OPENAI_MAX_RETRIES,
+    OPENAI_TIMEOUT_SECONDS,
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -18,68 +43,282 @@ class OpenAiChatResponse:
     usage: object | None
 
 
-def _client() -> OpenAI:
-    return OpenAI(api_key=OPENAI_API_KEY)
+@dataclass(frozen=True, slots=True)
+class OpenAiChatStreamChunk:
+    content: str
+    usage: object | None
+
+
+class AiProvider(Protocol):
+    async def transcribe_audio_chunk(
+        self,
+        audio: bytes | IO[bytes],
+        extension: str,
+        mime_type: str,
+        prompt: str | None,
+    ) -> OpenAiTranscriptionResponse: ...
+
+    async def suggest_minutes_json(self, system_instruction: str, user_prompt: str) -> OpenAiChatResponse: ...
+
+    def stream_minutes_json(
+        self, system_instruction: str, user_prompt: str
+    ) -> AsyncIterator[OpenAiChatStreamChunk]: ...
+
+    async def repair_minutes_json(self, raw_content: str) -> OpenAiChatResponse: ...
+
+
+class OpenAiClientHolder:
+    # 요청마다 클라이언트를 만들면 커넥션 풀과 TLS 핸드셰이크를 매번 새로 하므로 프로세스에서 하나만 쓴다.
+    def __init__(self) -> None:
+        self._client: AsyncOpenAI | None = None
+
+    def start(self) -> None:
+        # 키가 없으면 만들지 않는다. 서비스 계층이 키 누락을 먼저 응답한다.
+        if self._client is None and OPENAI_API_KEY and AI_PROVIDER == "openai":
+            self._client = _build_client()
+
+    async def stop(self) -> None:
+        client = self._client
+        self._client = None
+        if client is not None:
+            await client.close()
+
+    def get(self) -> AsyncOpenAI:
+        # lifespan 밖(스크립트 등)에서 호출돼도 같은 클라이언트를 재사용한다.
+        if self._client is None:
+            self._client = _build_client()
+        return self._client
+
+
+def _build_client() -> AsyncOpenAI:
+    timeout = httpx.Timeout(OPENAI_TIMEOUT_SECONDS, connect=OPENAI_CONNECT_TIMEOUT_SECONDS)
+    return AsyncOpenAI(
+        api_key=OPENAI_API_KEY,
+        timeout=timeout,
+        max_retries=OPENAI_MAX_RETRIES,
+        http_client=DefaultAsyncHttpxClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        ),
+    )
+
+
+openai_client = OpenAiClientHolder()
+
+
+def is_retryable_openai_error(exc: Exception) -> bool:
+    # 네트워크 오류/타임아웃, 요청 제한, 서버 오류는 잠시 뒤 다시 보내면 성공할 수 있다.
+    return isinstance(exc, APIConnectionError | RateLimitError | InternalServerError)
+
+
+class OpenAiProvider:
+    async def transcribe_audio_chunk(
+        self,
+        audio: bytes | IO[bytes],
+        extension: str,
+        mime_type: str,
+        prompt: str | None,
+    ) -> OpenAiTranscriptionResponse:
+        file_name = f"chunk.{extension.strip() or 'webm'}"
+        if prompt:
+            response = await openai_client.get().audio.transcriptions.create(
+                model="gpt-4o-mini-transcribe",
+                file=(file_name, audio, mime_type),
+                prompt=prompt,
+            )
+        else:
+            response = await openai_client.get().audio.transcriptions.create(
+                model="gpt-4o-mini-transcribe",
+                file=(file_name, audio, mime_type),
+            )
+        return OpenAiTranscriptionResponse(
+            text=(response.text or "").strip(),
+            usage=getattr(response, "usage", None),
+            raw=response,
+        )
+
+    async def suggest_minutes_json(self, system_instruction: str, user_prompt: str) -> OpenAiChatResponse:
+        response = await openai_client.get().chat.completions.create(
+            model="gpt-5-nano",
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": system_instruction},
+                {"role": "user", "content": user_prompt},
+            ],
+        )
+        content = response.choices[0].message.content or "{}"
+        return OpenAiChatResponse(content=content, usage=getattr(response, "usage", None))
+
+    async def stream_minutes_json(
+        self, system_instruction: str, user_prompt: str
+    ) -> AsyncIterator[OpenAiChatStreamChunk]:
+        # 응답을 조각으로 받는다. 사용량은 마지막 조각에만 실려 온다.
+        stream = await openai_client.get().chat.completions.create(
+            model="gpt-5-nano",
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": system_instruction},
+                {"role": "user", "content": user_prompt},
+            ],
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        try:
+            async for chunk in stream:
+                content = (chunk.choices[0].delta.content or "") if chunk.choices else ""
+                yield OpenAiChatStreamChunk(content=content, usage=chunk.usage)
+        finally:
+            await stream.close()
+
+    async def repair_minutes_json(self, raw_content: str) -> OpenAiChatResponse:
+        response = await openai_client.get().chat.completions.create(
+            model="gpt-5-nano",
+            response_format={"type": "json_object"},
+            messages=[
+                {
+                    "role": "system",
+                    "content": (
+                        "너는 JSON 복구기다. 반드시 JSON 객체만 반환한다. "
+                        "키는 agenda, meeting_content, meeting_result 3개만 사용한다. "
+                        "각 값은 문자열 배열이어야 한다."
+                    ),
+                },
+                {
+                    "role": "user",
+                    "content": (
+                        f"아래 모델 응답을 유효한 JSON 객체로 복구하라. 설명하지 말고 JSON만 반환하라.\n\n{raw_content}"
+                    ),
+                },
+            ],
+        )
+        content = response.choices[0].message.content or "{}"
+        return OpenAiChatResponse(content=content, usage=getattr(response, "usage", None))
 
 
-def transcribe_audio_chunk(
-    audio_bytes: bytes,
+FAKE_TRANSCRIPT_TEXT = "화자1: 로컬 대역 전사 결과입니다."
+FAKE_MINUTES = {
+    "agenda": ["로컬 대역 안건"],
+    "meeting_content": ["로컬 대역 회의 내용"],
+    "meeting_result": ["로컬 대역 회의 결과"],
+}
+_FAKE_STREAM_PIECE_CHARS = 16
+
+
+def _parse_error_rate(raw: str) -> float:
+    try:
+        return min(1.0, max(0.0, float(raw)))
+    except ValueError:
+        return 0.0
+
+
+class FakeAiProvider:
+    # 실제 API 없이 부하/회귀 테스트를 하기 위한 대역. 정해진 지연 뒤 고정 응답과 사용량을 돌려준다.
+    def __init__(
+        self,
+        latency_ms: int = FAKE_AI_LATENCY_MS,
+        error_rate: float = _parse_error_rate(FAKE_AI_ERROR_RATE),
+        input_tokens: int = FAKE_AI_INPUT_TOKENS,
+        output_tokens: int = FAKE_AI_OUTPUT_TOKENS,
+        transcript_text: str = FAKE_TRANSCRIPT_TEXT,
+        minutes: dict[str, list[str]] | None = None,
+        seed: int | None = None,
+    ) -> None:
+        self.latency_ms = max(0, latency_ms)
+        self.error_rate = error_rate
+        self.input_tokens = max(0, input_tokens)
+        self.output_tokens = max(0, output_tokens)
+        self.transcript_text = transcript_text
+        self.minutes_content = json.dumps(FAKE_MINUTES if minutes is None else minutes, ensure_ascii=False)
+        self.calls = 0
+        self._random = random.Random(seed)
+
+    async def transcribe_audio_chunk(
+        self,
+        audio: bytes | IO[bytes],
+        extension: str,
+        mime_type: str,
+        prompt: str | None,
+    ) -> OpenAiTranscriptionResponse:
+        await self._respond()
+        usage = self._usage("input_tokens", "output_tokens")
+        return OpenAiTranscriptionResponse(text=self.transcript_text, usage=usage, raw=None)
+
+    async def suggest_minutes_json(self, system_instruction: str, user_prompt: str) -> OpenAiChatResponse:
+        await self._respond()
+        return OpenAiChatResponse(
+            content=self.minutes_content,
+            usage=self._usage("prompt_tokens", "completion_tokens"),
+        )
+
+    async def stream_minutes_json(
+        self, system_instruction: str, user_prompt: str
+    ) -> AsyncIterator[OpenAiChatStreamChunk]:
+        await self._respond()
+        content = self.minutes_content
+        for start in range(0, len(content), _FAKE_STREAM_PIECE_CHARS):
+            yield OpenAiChatStreamChunk(content=content[start : start + _FAKE_STREAM_PIECE_CHARS], usage=None)
+            await asyncio.sleep(0)
+        yield OpenAiChatStreamChunk(content="", usage=self._usage("prompt_tokens", "completion_tokens"))
+
+    async def repair_minutes_json(self, raw_content: str) -> OpenAiChatResponse:
+        return await self.suggest_minutes_json("", raw_content)
+
+    async def _respond(self) -> None:
+        self.calls += 1
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        if self.error_rate and self._random.random() < self.error_rate:
+            # 실제 API의 일시적 오류와 같게 재시도 대상 예외를 낸다.
+            raise APIConnectionError(request=httpx.Request("POST", "http://fake-ai.local"))
+
+    def _usage(self, input_key: str, output_key: str) -> dict[str, int] | None:
+        # 토큰 수를 둘 다 0으로 두면 사용량이 빠진 응답을 흉내 낸다.
+        if self.input_tokens == 0 and self.output_tokens == 0:
+            return None
+        return {
+            input_key: self.input_tokens,
+            output_key: self.output_tokens,
+            "total_tokens": self.input_tokens + self.output_tokens,
+        }
+
+
+class AiProviderHolder:
+    def __init__(self) -> None:
+        self._provider: AiProvider | None = None
+
+    def get(self) -> AiProvider:
+        if self._provider is None:
+            self._provider = FakeAiProvider() if AI_PROVIDER == "fake" else OpenAiProvider()
+        return self._provider
+
+    def use(self, provider: AiProvider | None) -> None:
+        # 테스트/벤치마크에서 대역을 끼운다. None이면 다음 호출 때 설정값으로 다시 고른다.
+        self._provider = provider
+
+
+ai_provider = AiProviderHolder()
+
+
+async def transcribe_audio_chunk(
+    audio: bytes | IO[bytes],
     extension: str,
     mime_type: str,
     prompt: str | None,
 ) -> OpenAiTranscriptionResponse:
-    file_name = f"chunk.{extension.strip() or 'webm'}"
-    if prompt:
-        response = _client().audio.transcriptions.create(
-            model="gpt-4o-mini-transcribe",
-            file=(file_name, audio_bytes, mime_type),
-            prompt=prompt,
-        )
-    else:
-        response = _client().audio.transcriptions.create(
-            model="gpt-4o-mini-transcribe",
-            file=(file_name, audio_bytes, mime_type),
-        )
-    return OpenAiTranscriptionResponse(
-        text=(response.text or "").strip(),
-        usage=getattr(response, "usage", None),
-        raw=response,
-    )
+    return await ai_provider.get().transcribe_audio_chunk(audio, extension, mime_type, prompt)
 
 
-def suggest_minutes_json(system_instruction: str, user_prompt: str) -> OpenAiChatResponse:
-    response = _client().chat.completions.create(
-        model="gpt-5-nano",
-        response_format={"type": "json_object"},
-        messages=[
-            {"role": "system", "content": system_instruction},
-            {"role": "user", "content": user_prompt},
-        ],
-    )
-    content = response.choices[0].message.content or "{}"
-    return OpenAiChatResponse(content=content, usage=getattr(response, "usage", None))
-
-
-def repair_minutes_json(raw_content: str) -> OpenAiChatResponse:
-    response = _client().chat.completions.create(
-        model="gpt-5-nano",
-        response_format={"type": "json_object"},
-        messages=[
-            {
-                "role": "system",
-                "content": (
-                    "너는 JSON 복구기다. 반드시 JSON 객체만 반환한다. "
-                    "키는 agenda, meeting_content, meeting_result 3개만 사용한다. "
-                    "각 값은 문자열 배열이어야 한다."
-                ),
-            },
-            {
-                "role": "user",
-                "content": (
-                    f"아래 모델 응답을 유효한 JSON 객체로 복구하라. 설명하지 말고 JSON만 반환하라.\n\n{raw_content}"
-                ),
-            },
-        ],
-    )
-    content = response.choices[0].message.content or "{}"
-    return OpenAiChatResponse(content=content, usage=getattr(response, "usage", None))
+async def suggest_minutes_json(system_instruction: str, user_prompt: str) -> OpenAiChatResponse:
+    return await ai_provider.get().suggest_minutes_json(system_instruction, user_prompt)
+
+
+def stream_minutes_json(system_instruction: str, user_prompt: str) -> AsyncIterator[OpenAiChatStreamChunk]:
+    return ai_provider.get().stream_minutes_json(system_instruction, user_prompt)
+
+
+async def repair_minutes_json(raw_content: str) -> OpenAiChatResponse:
+    return await ai_provider.get().repair_minutes_json(raw_content)
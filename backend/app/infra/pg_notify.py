@@ -0,0 +1,86 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+PayloadHandler = Callable[[str], Awaitable[None]]
+ListenHandler = Callable[[], Awaitable[None]]
+
+RECONNECT_DELAY_SECONDS = 1.0
+MAX_RECONNECT_DELAY_SECONDS = 30.0
+
+
+class PgNotifyChannel:
+    def __init__(self, channel: str, database_url: str, engine: AsyncEngine) -> None:
+        self.channel = channel
+        self._dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self._engine = engine
+        self._handler: PayloadHandler | None = None
+        self._on_listen: ListenHandler | None = None
+        self._listener_task: asyncio.Task[None] | None = None
+
+    async def notify(self, payload: str) -> None:
+        async with self._engine.connect() as connection:
+            await connection.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": self.channel, "payload": payload},
+            )
+            await connection.commit()
+
+    async def start(self, handler: PayloadHandler, on_listen: ListenHandler | None = None) -> None:
+        # on_listen은 LISTEN을 (다시) 건 직후마다 불린다. 끊긴 동안 놓친 알림을 보충할 때 쓴다.
+        self._handler = handler
+        self._on_listen = on_listen
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._listen_forever())
+
+    async def stop(self) -> None:
+        task = self._listener_task
+        self._listener_task = None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _listen_forever(self) -> None:
+        # 프로세스당 LISTEN 연결은 하나만 유지하고, 끊기면 지수 백오프로 재연결한다.
+        delay = RECONNECT_DELAY_SECONDS
+        while True:
+            connection: asyncpg.Connection | None = None
+            try:
+                connection = await asyncpg.connect(self._dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _connection: closed.set())
+                await connection.add_listener(self.channel, self._on_notification)
+                delay = RECONNECT_DELAY_SECONDS
+                if self._on_listen is not None:
+                    await self._on_listen()
+                await closed.wait()
+                logger.warning("pg_notify listener connection closed channel=%s", self.channel)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("pg_notify listener failed channel=%s error=%s", self.channel, exc)
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY_SECONDS)
+
+    async def _on_notification(self, connection: object, pid: int, channel: str, payload: str) -> None:
+        del connection, pid, channel
+        if self._handler is None:
+            return
+        try:
+            await self._handler(payload)
+        except Exception as exc:
+            logger.warning("pg_notify payload handling failed channel=%s error=%s", self.channel, exc)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, func, select
+from sqlalchemy import DateTime, ForeignKey, Integer, String, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -47,6 +47,10 @@ class Reservation(Base):
         onupdate=func.now(),
         nullable=False,
     )
+    # 저장할 때마다 1씩 올라가는 버전. UPDATE 문이 읽었던 버전을 WHERE로 함께 확인한다.
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+
+    __mapper_args__ = {"version_id_col": version}
 
 
 def add_reservation(db: AsyncSession, reservation: Reservation) -> None:
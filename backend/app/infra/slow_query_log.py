@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.request_context import get_current_route
+from app.core.settings import SLOW_QUERY_EXPLAIN_ENABLED, SLOW_QUERY_LOG_SIZE, SLOW_QUERY_THRESHOLD_MS
+
+logger = logging.getLogger(__name__)
+
+SKIP_SLOW_QUERY_LOG_OPTION = "skip_slow_query_log"
+# 실패한 구문은 after_cursor_execute가 불리지 않으므로, 연결이 아닌 구문별 실행 컨텍스트에 시작 시각을 둔다.
+_QUERY_STARTED_AT_ATTR = "_slow_query_started_at"
+_EXPLAINABLE_PREFIXES = ("select", "insert", "update", "delete", "with")
+
+
+@dataclass(slots=True)
+class SlowQueryEntry:
+    recorded_at: datetime
+    route: str | None
+    statement: str
+    parameters: list[str]
+    duration_ms: float
+    explain_plan: str | None = None
+
+
+class SlowQueryLog:
+    def __init__(self, threshold_ms: int, max_entries: int, explain_enabled: bool) -> None:
+        self.threshold_ms = threshold_ms
+        self.explain_enabled = explain_enabled
+        self._entries: deque[SlowQueryEntry] = deque(maxlen=max(1, max_entries))
+        self._pending_explains: set[str] = set()
+        self._explain_tasks: set[asyncio.Task[None]] = set()
+        self._listeners: list[tuple[str, Callable[..., None]]] = []
+
+    def install(self, engine: AsyncEngine) -> None:
+        # 임계값이 음수이면 슬로우 쿼리 기록을 끈다.
+        if self.threshold_ms < 0:
+            return
+
+        def before_cursor_execute(
+            conn: Connection,
+            cursor: object,
+            statement: str,
+            parameters: Any,
+            context: ExecutionContext | None,
+            executemany: bool,
+        ) -> None:
+            if context is not None:
+                setattr(context, _QUERY_STARTED_AT_ATTR, time.perf_counter())
+
+        def after_cursor_execute(
+            conn: Connection,
+            cursor: object,
+            statement: str,
+            parameters: Any,
+            context: ExecutionContext | None,
+            executemany: bool,
+        ) -> None:
+            started = getattr(context, _QUERY_STARTED_AT_ATTR, None)
+            if started is None:
+                return
+            duration_ms = (time.perf_counter() - started) * 1000
+            if duration_ms < self.threshold_ms:
+                return
+            if context is not None and context.execution_options.get(SKIP_SLOW_QUERY_LOG_OPTION):
+                return
+
+            entry = SlowQueryEntry(
+                recorded_at=datetime.now(UTC),
+                route=get_current_route(),
+                statement=statement,
+                parameters=_redact_parameters(parameters, executemany),
+                duration_ms=round(duration_ms, 3),
+            )
+            self._entries.append(entry)
+            logger.warning(
+                "slow query route=%s duration_ms=%.3f statement=%s parameters=%s",
+                entry.route,
+                entry.duration_ms,
+                " ".join(statement.split()),
+                entry.parameters,
+            )
+            if (
+                self.explain_enabled
+                and not executemany
+                and conn.dialect.name == "postgresql"
+                and statement.lstrip().lower().startswith(_EXPLAINABLE_PREFIXES)
+            ):
+                self._schedule_explain(engine, entry, statement, parameters)
+
+        self._listeners = [
+            ("before_cursor_execute", before_cursor_execute),
+            ("after_cursor_execute", after_cursor_execute),
+        ]
+        for name, listener in self._listeners:
+            event.listen(engine.sync_engine, name, listener)
+
+    def uninstall(self, engine: AsyncEngine) -> None:
+        for name, listener in self._listeners:
+            event.remove(engine.sync_engine, name, listener)
+        self._listeners = []
+
+    def entries(self) -> list[SlowQueryEntry]:
+        return list(reversed(self._entries))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _schedule_explain(self, engine: AsyncEngine, entry: SlowQueryEntry, statement: str, parameters: Any) -> None:
+        # 같은 구문의 실행계획은 동시에 한 번만 수집한다.
+        if statement in self._pending_explains:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._pending_explains.add(statement)
+        task = loop.create_task(self._capture_explain(engine, entry, statement, parameters))
+        self._explain_tasks.add(task)
+        task.add_done_callback(self._explain_tasks.discard)
+
+    async def _capture_explain(
+        self,
+        engine: AsyncEngine,
+        entry: SlowQueryEntry,
+        statement: str,
+        parameters: Any,
+    ) -> None:
+        try:
+            async with engine.connect() as connection:
+                await connection.execution_options(**{SKIP_SLOW_QUERY_LOG_OPTION: True})
+                result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+                entry.explain_plan = "\n".join(str(row[0]) for row in result)
+        except Exception as exc:
+            logger.warning("slow query explain failed route=%s error=%s", entry.route, exc)
+        finally:
+            self._pending_explains.discard(statement)
+
+
+def _redact_parameters(parameters: Any, executemany: bool) -> list[str]:
+    if executemany:
+        return [f"<{len(parameters)} rows>"]
+    if isinstance(parameters, dict):
+        return [f"{key}=<{type(value).__name__}>" for key, value in parameters.items()]
+    if isinstance(parameters, list | tuple):
+        return [f"<{type(value).__name__}>" for value in parameters]
+    return []
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=SLOW_QUERY_THRESHOLD_MS,
+    max_entries=SLOW_QUERY_LOG_SIZE,
+    explain_enabled=SLOW_QUERY_EXPLAIN_ENABLED,
+)
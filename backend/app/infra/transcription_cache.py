@@ -0,0 +1,57 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, Text, delete, func, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infra.db import Base
+
+
+class TranscriptionCacheEntry(Base):
+    __tablename__ = "transcription_cache_entries"
+
+    # 오디오 바이트와 전사 힌트(형식, 직전 전사)의 SHA-256
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
+
+
+async def find_transcription_cache_entry(
+    db: AsyncSession,
+    content_hash: str,
+    created_after: datetime,
+) -> TranscriptionCacheEntry | None:
+    row = await db.execute(
+        select(TranscriptionCacheEntry).where(
+            TranscriptionCacheEntry.content_hash == content_hash,
+            TranscriptionCacheEntry.created_at > created_after,
+        )
+    )
+    return row.scalar_one_or_none()
+
+
+async def upsert_transcription_cache_entry(db: AsyncSession, content_hash: str, text: str) -> None:
+    # 만료됐지만 아직 정리되지 않은 행이 있어도 새 결과와 저장 시각으로 덮어쓴다.
+    insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    statement = insert(TranscriptionCacheEntry).values(content_hash=content_hash, text=text)
+    await db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[TranscriptionCacheEntry.content_hash],
+            set_={"text": statement.excluded.text, "created_at": func.now()},
+        )
+    )
+
+
+async def delete_transcription_cache_entries_before(db: AsyncSession, created_before: datetime) -> None:
+    await db.execute(
+        delete(TranscriptionCacheEntry)
+        .where(TranscriptionCacheEntry.created_at <= created_before)
+        .execution_options(synchronize_session=False)
+    )
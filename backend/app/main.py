@@ -1,20 +1,58 @@
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.release import get_current_version
+from app.core.request_context import RequestContextMiddleware
+from app.infra.db import get_db_session_factory
+from app.infra.openai import openai_client
 from app.router.ai import router as ai_router
 from app.router.auth import router as auth_router
+from app.router.diagnostics import router as diagnostics_router
 from app.router.labels import router as labels_router
 from app.router.release import router as release_router
 from app.router.reservation import router as reservation_router
 from app.router.rooms import router as rooms_router
 from app.router.timetable import router as timetable_router
 from app.router.users import router as users_router
+from app.service.ai_usage_rollup import ai_usage_rollup
+from app.service.minutes_lock_sweeper import minutes_lock_sweeper
+from app.service.minutes_room_service import minutes_room_hub
+from app.service.reservation_event_service import reservation_event_broker
+from app.service.transcription_cache_service import transcription_cache
+from app.service.transcription_job_service import transcription_job_queue
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # 테스트에서 세션 팩토리를 바꿔 끼운 경우에도 같은 DB를 쓰도록 override를 따른다.
+    session_factory = app.dependency_overrides.get(get_db_session_factory, get_db_session_factory)()
+    # 시작한 서비스만 역순으로 멈춘다. 중간에 시작이 실패해도 앞서 띄운 서비스가 남지 않는다.
+    async with AsyncExitStack() as services:
+        await reservation_event_broker.start()
+        services.push_async_callback(reservation_event_broker.stop)
+        await minutes_room_hub.start()
+        services.push_async_callback(minutes_room_hub.stop)
+        await minutes_lock_sweeper.start(session_factory)
+        services.push_async_callback(minutes_lock_sweeper.stop)
+        await ai_usage_rollup.start(session_factory)
+        services.push_async_callback(ai_usage_rollup.stop)
+        openai_client.start()
+        services.push_async_callback(openai_client.stop)
+        await transcription_cache.start(session_factory)
+        services.push_async_callback(transcription_cache.stop)
+        await transcription_job_queue.start(session_factory)
+        services.push_async_callback(transcription_job_queue.stop)
+        yield
+
 
 app = FastAPI(
     title="Roombook API",
     description="회의실 예약 시스템 API",
     version=get_current_version(),
+    lifespan=lifespan,
 )
 
 # 프론트와 백엔드의 오리진이 다르기때문에
@@ -26,9 +64,12 @@ app.add_middleware(
     allow_methods=["*"],  # HTTP 메서드 전부 허용 (GET, POST, etc)
     allow_headers=["*"],  # 요청헤더 전부 허용 (Authorization, Content-Type, etc)
 )
+# 슬로우 쿼리 로그에 호출 라우트를 남기기 위한 요청 컨텍스트
+app.add_middleware(RequestContextMiddleware)
 
 app.include_router(auth_router)
 app.include_router(ai_router)
+app.include_router(diagnostics_router)
 app.include_router(labels_router)
 app.include_router(release_router)
 app.include_router(rooms_router)
@@ -1,23 +1,47 @@
 import asyncio
+import base64
+import binascii
+import json
 import logging
 import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
+from decimal import Decimal
+from tempfile import SpooledTemporaryFile
 
-from fastapi import APIRouter, Depends, Request, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.core.settings import SESSION_COOKIE_NAME
-from app.infra.db import get_db_session
-from app.service.ai_quota_service import apply_ai_usage_cost, ensure_quota_available
+from app.core.settings import AI_AUDIO_SPOOL_MAX_BYTES, AI_AUDIO_UPLOAD_MAX_BYTES, SESSION_COOKIE_NAME
+from app.infra.db import get_db_session, get_db_session_factory
+from app.service.ai_quota_service import (
+    SUMMARY_HOLD_USD,
+    TRANSCRIPTION_HOLD_USD,
+    AiQuotaReservation,
+    release_ai_quota,
+    reserve_ai_quota,
+    settle_ai_quota,
+)
 from app.service.ai_service import (
+    MinutesSuggestionFailure,
+    MinutesSuggestionItem,
+    MinutesUsageMeter,
+    audio_too_large_error,
+    stream_minutes_suggestion,
     suggest_minutes_bullets,
+    transcribe_audio,
     transcribe_audio_chunk,
 )
 from app.service.auth_service import AuthUser, get_user_from_session_token
 from app.service.domain import DomainError
+from app.service.reservation_service import ensure_minutes_transcript_writer
+from app.service.transcription_job_service import transcription_job_queue
 
 router = APIRouter(prefix="/api/ai", tags=["ai"])
+# 직전 전사는 한글 퍼센트 인코딩이 요청 줄 한도(nginx 8KB)를 넘기지 않도록 base64(UTF-8) 헤더로 받는다.
+PREVIOUS_TEXT_HEADER = "X-Previous-Text"
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +67,12 @@ class TranscribeChunkResponse(BaseModel):
     user_used_usd: float
 
 
+class TranscriptionJobResponse(BaseModel):
+    reservation_id: str
+    seq: int
+    pending: int
+
+
 class SuggestMinutesRequest(BaseModel):
     transcript: str
     existing_agenda: str | None = None
@@ -73,21 +103,70 @@ async def transcribe_chunk_api(
     if auth_user is None:
         return _error_response(status.HTTP_401_UNAUTHORIZED, "UNAUTHORIZED", "로그인이 필요합니다.")
 
-    quota = await ensure_quota_available(auth_user.id, db)
+    quota = await reserve_ai_quota(auth_user.id, TRANSCRIPTION_HOLD_USD, db)
     if isinstance(quota, DomainError):
         return _error_response(_error_status(quota.code), quota.code, quota.message)
 
-    result = await asyncio.to_thread(
-        transcribe_audio_chunk,
-        payload.audio_base64,
-        payload.mime_type,
-        payload.previous_text,
+    try:
+        result = await transcribe_audio_chunk(
+            payload.audio_base64,
+            payload.mime_type,
+            payload.previous_text,
+        )
+        if isinstance(result, DomainError):
+            return _error_response(_error_status(result.code), result.code, result.message)
+        applied = await settle_ai_quota(quota, result.usd_cost, db)
+    finally:
+        release_ai_quota(quota)
+    return TranscribeChunkResponse(
+        text=result.text,
+        used_usd=float(applied.global_used_usd),
+        remaining_usd=float(applied.global_remaining_usd),
+        user_used_usd=float(applied.user_used_usd),
     )
-    if isinstance(result, DomainError):
-        return _error_response(_error_status(result.code), result.code, result.message)
-    applied = await apply_ai_usage_cost(auth_user.id, result.usd_cost, db)
-    if isinstance(applied, DomainError):
-        return _error_response(_error_status(applied.code), applied.code, applied.message)
+
+
+@router.post(
+    "/transcribe-audio",
+    response_model=TranscribeChunkResponse,
+    responses={
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+    },
+)
+async def transcribe_audio_api(
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+) -> TranscribeChunkResponse | JSONResponse:
+    auth_user = await _require_auth_user(request, db)
+    if auth_user is None:
+        return _error_response(status.HTTP_401_UNAUTHORIZED, "UNAUTHORIZED", "로그인이 필요합니다.")
+    previous_text = _read_previous_text(request)
+    if isinstance(previous_text, DomainError):
+        return _error_response(_error_status(previous_text.code), previous_text.code, previous_text.message)
+
+    quota = await reserve_ai_quota(auth_user.id, TRANSCRIPTION_HOLD_USD, db)
+    if isinstance(quota, DomainError):
+        return _error_response(_error_status(quota.code), quota.code, quota.message)
+
+    try:
+        received = await _receive_audio_body(request)
+        if isinstance(received, DomainError):
+            return _error_response(_error_status(received.code), received.code, received.message)
+        audio_file, audio_size = received
+        with audio_file:
+            result = await transcribe_audio(
+                audio_file,
+                audio_size,
+                request.headers.get("content-type"),
+                previous_text,
+            )
+        if isinstance(result, DomainError):
+            return _error_response(_error_status(result.code), result.code, result.message)
+        applied = await settle_ai_quota(quota, result.usd_cost, db)
+    finally:
+        release_ai_quota(quota)
     return TranscribeChunkResponse(
         text=result.text,
         used_usd=float(applied.global_used_usd),
@@ -96,6 +175,65 @@ async def transcribe_chunk_api(
     )
 
 
+@router.post(
+    "/transcription-jobs",
+    response_model=TranscriptionJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+        403: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
+    },
+)
+async def submit_transcription_job_api(
+    request: Request,
+    reservation_id: str = Query(...),
+    paragraph_break: bool = Query(False),
+    db: AsyncSession = Depends(get_db_session),
+) -> TranscriptionJobResponse | JSONResponse:
+    auth_user = await _require_auth_user(request, db)
+    if auth_user is None:
+        return _error_response(status.HTTP_401_UNAUTHORIZED, "UNAUTHORIZED", "로그인이 필요합니다.")
+    previous_text = _read_previous_text(request)
+    if isinstance(previous_text, DomainError):
+        return _error_response(_error_status(previous_text.code), previous_text.code, previous_text.message)
+
+    writer_error = await ensure_minutes_transcript_writer(reservation_id, auth_user, db)
+    if writer_error is not None:
+        return _error_response(_error_status(writer_error.code), writer_error.code, writer_error.message)
+    quota = await reserve_ai_quota(auth_user.id, TRANSCRIPTION_HOLD_USD, db)
+    if isinstance(quota, DomainError):
+        return _error_response(_error_status(quota.code), quota.code, quota.message)
+
+    received = await _receive_audio_body(request)
+    if isinstance(received, DomainError):
+        release_ai_quota(quota)
+        return _error_response(_error_status(received.code), received.code, received.message)
+    audio_file, audio_size = received
+    # 접수만 하고 바로 응답한다. 결과는 회의록 협업 채널(WS/SSE)로 순서대로 전달되고, 정산은 작업이 끝날 때 한다.
+    submitted = transcription_job_queue.submit(
+        reservation_id=reservation_id,
+        holder=auth_user,
+        quota=quota,
+        audio=audio_file,
+        audio_size=audio_size,
+        mime_type=request.headers.get("content-type"),
+        previous_text=previous_text,
+        paragraph_break=paragraph_break,
+    )
+    if isinstance(submitted, DomainError):
+        audio_file.close()
+        release_ai_quota(quota)
+        return _error_response(_error_status(submitted.code), submitted.code, submitted.message)
+    return TranscriptionJobResponse(
+        reservation_id=submitted.reservation_id,
+        seq=submitted.seq,
+        pending=submitted.pending,
+    )
+
+
 @router.post(
     "/suggest-minutes",
     response_model=SuggestMinutesResponse,
@@ -110,7 +248,7 @@ async def suggest_minutes_api(
     if auth_user is None:
         return _error_response(status.HTTP_401_UNAUTHORIZED, "UNAUTHORIZED", "로그인이 필요합니다.")
 
-    quota = await ensure_quota_available(auth_user.id, db)
+    quota = await reserve_ai_quota(auth_user.id, SUMMARY_HOLD_USD, db)
     if isinstance(quota, DomainError):
         return _error_response(_error_status(quota.code), quota.code, quota.message)
 
@@ -121,26 +259,30 @@ async def suggest_minutes_api(
         auth_user.id,
         transcript_length,
     )
-    result = await asyncio.to_thread(
-        suggest_minutes_bullets,
-        payload.transcript,
-        payload.existing_agenda or "",
-        payload.existing_meeting_content or "",
-        payload.existing_meeting_result or "",
-    )
-    elapsed_ms = round((time.perf_counter() - start) * 1000)
-    if isinstance(result, DomainError):
-        logger.warning(
-            "suggest-minutes failed user_id=%s transcript_length=%s elapsed_ms=%s code=%s",
-            auth_user.id,
-            transcript_length,
-            elapsed_ms,
-            result.code,
+    try:
+        result = await suggest_minutes_bullets(
+            payload.transcript,
+            payload.existing_agenda or "",
+            payload.existing_meeting_content or "",
+            payload.existing_meeting_result or "",
         )
-        return _error_response(_error_status(result.code), result.code, result.message)
-    applied = await apply_ai_usage_cost(auth_user.id, result.usd_cost, db)
-    if isinstance(applied, DomainError):
-        return _error_response(_error_status(applied.code), applied.code, applied.message)
+        elapsed_ms = round((time.perf_counter() - start) * 1000)
+        if isinstance(result, MinutesSuggestionFailure):
+            logger.warning(
+                "suggest-minutes failed user_id=%s transcript_length=%s elapsed_ms=%s code=%s used_usd=%.4f",
+                auth_user.id,
+                transcript_length,
+                elapsed_ms,
+                result.error.code,
+                result.usd_cost,
+            )
+            # 실패 전에 끝난 구간 요약 호출의 비용은 정산한다.
+            if result.usd_cost > 0:
+                await settle_ai_quota(quota, result.usd_cost, db)
+            return _error_response(_error_status(result.error.code), result.error.code, result.error.message)
+        applied = await settle_ai_quota(quota, result.usd_cost, db)
+    finally:
+        release_ai_quota(quota)
     logger.info(
         (
             "suggest-minutes completed user_id=%s transcript_length=%s elapsed_ms=%s "
@@ -164,6 +306,136 @@ async def suggest_minutes_api(
     )
 
 
+# 회의록 초안을 NDJSON으로 흘려보낸다. 항목은 모델 응답에서 파싱되는 대로 item 줄로 보내고,
+# 사용량 정산은 끝에 한 번만 해서 done 줄에 담는다.
+@router.post(
+    "/suggest-minutes/stream",
+    response_model=None,
+    responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}, 429: {"model": ErrorResponse}},
+)
+async def stream_suggest_minutes_api(
+    payload: SuggestMinutesRequest,
+    request: Request,
+    # 인증/한도 확인에만 쓰고 스트리밍 전에 세션을 반납한다. 정산은 끝에 짧은 세션으로 한다.
+    db: AsyncSession = Depends(get_db_session, scope="function"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_db_session_factory),
+) -> StreamingResponse | JSONResponse:
+    auth_user = await _require_auth_user(request, db)
+    if auth_user is None:
+        return _error_response(status.HTTP_401_UNAUTHORIZED, "UNAUTHORIZED", "로그인이 필요합니다.")
+
+    quota = await reserve_ai_quota(auth_user.id, SUMMARY_HOLD_USD, db)
+    if isinstance(quota, DomainError):
+        return _error_response(_error_status(quota.code), quota.code, quota.message)
+
+    async def event_stream() -> AsyncIterator[str]:
+        # 클라이언트가 끊겨 이 제너레이터가 닫히면 안쪽 제너레이터도 바로 닫아 예약을 정리한다.
+        # 본문을 보내기 전에 끊겨 여기까지 오지 못한 예약은 AI_QUOTA_HOLD_TTL_SECONDS가 지나면 버려진다.
+        async with aclosing(_suggest_minutes_stream_lines(auth_user, quota, payload, session_factory)) as lines:
+            async for line in lines:
+                yield line
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="application/x-ndjson",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+async def _suggest_minutes_stream_lines(
+    auth_user: AuthUser,
+    quota: AiQuotaReservation,
+    payload: SuggestMinutesRequest,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[str, None]:
+    usage_meter = MinutesUsageMeter()
+    settled = False
+    try:
+        start = time.perf_counter()
+        first_item_ms: int | None = None
+        transcript_length = len(payload.transcript.strip())
+        logger.info(
+            "suggest-minutes stream started user_id=%s transcript_length=%s",
+            auth_user.id,
+            transcript_length,
+        )
+        async for event in stream_minutes_suggestion(
+            payload.transcript,
+            payload.existing_agenda or "",
+            payload.existing_meeting_content or "",
+            payload.existing_meeting_result or "",
+            usage_meter,
+        ):
+            if isinstance(event, MinutesSuggestionItem):
+                if first_item_ms is None:
+                    first_item_ms = round((time.perf_counter() - start) * 1000)
+                yield _format_ndjson({"type": "item", "section": event.section, "text": event.text})
+                continue
+            if isinstance(event, MinutesSuggestionFailure):
+                logger.warning(
+                    "suggest-minutes stream failed user_id=%s transcript_length=%s elapsed_ms=%s code=%s used_usd=%.4f",
+                    auth_user.id,
+                    transcript_length,
+                    round((time.perf_counter() - start) * 1000),
+                    event.error.code,
+                    event.usd_cost,
+                )
+                # 실패 전에 쓴 비용은 아래 finally에서 정산한다.
+                yield _format_ndjson_error(event.error)
+                return
+            async with session_factory() as settle_db:
+                applied = await settle_ai_quota(quota, event.usd_cost, settle_db)
+            settled = True
+            logger.info(
+                (
+                    "suggest-minutes stream completed user_id=%s transcript_length=%s elapsed_ms=%s "
+                    "first_item_ms=%s used_usd=%.4f agenda_count=%s content_count=%s result_count=%s"
+                ),
+                auth_user.id,
+                transcript_length,
+                round((time.perf_counter() - start) * 1000),
+                first_item_ms,
+                event.usd_cost,
+                len(event.agenda),
+                len(event.meeting_content),
+                len(event.meeting_result),
+            )
+            done = SuggestMinutesResponse(
+                agenda=event.agenda,
+                meeting_content=event.meeting_content,
+                meeting_result=event.meeting_result,
+                used_usd=float(applied.global_used_usd),
+                remaining_usd=float(applied.global_remaining_usd),
+                user_used_usd=float(applied.user_used_usd),
+            )
+            yield _format_ndjson({"type": "done", **done.model_dump()})
+    finally:
+        # done 줄 전에 실패하거나 끊기거나 예외로 끝나면, 그때까지 쓴 비용을 짧은 세션으로 정산한다.
+        # 예약 만료 여부와 관계없이 done에서 정산하지 않은 경우에만 정산해 비용을 두 번 기록하지 않는다.
+        release_ai_quota(quota)
+        partial_usd = usage_meter.usd_cost
+        if not settled and partial_usd > 0:
+            # 끊긴 요청은 취소된 상태라 정산을 따로 떼어 끝까지 돌린다.
+            await asyncio.shield(_settle_partial_minutes_usage(quota, partial_usd, session_factory))
+
+
+async def _settle_partial_minutes_usage(
+    quota: AiQuotaReservation,
+    usd_cost: Decimal,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as settle_db:
+        await settle_ai_quota(quota, usd_cost, settle_db)
+    logger.info(
+        "suggest-minutes stream settled partial usage user_id=%s used_usd=%.4f",
+        quota.user_id,
+        usd_cost,
+    )
+
+
 async def _require_auth_user(request: Request, db: AsyncSession) -> AuthUser | None:
     token = request.cookies.get(SESSION_COOKIE_NAME)
     if token is None:
@@ -176,11 +448,62 @@ def _error_status(code: str) -> int:
         return status.HTTP_401_UNAUTHORIZED
     if code == "INVALID_ARGUMENT":
         return status.HTTP_400_BAD_REQUEST
+    if code == "FORBIDDEN":
+        return status.HTTP_403_FORBIDDEN
+    if code == "PAYLOAD_TOO_LARGE":
+        return status.HTTP_413_CONTENT_TOO_LARGE
     if code == "QUOTA_EXCEEDED":
         return status.HTTP_429_TOO_MANY_REQUESTS
+    if code in {"UNAVAILABLE", "UPSTREAM_UNAVAILABLE"}:
+        return status.HTTP_503_SERVICE_UNAVAILABLE
     return status.HTTP_500_INTERNAL_SERVER_ERROR
 
 
+async def _receive_audio_body(request: Request) -> tuple[SpooledTemporaryFile[bytes], int] | DomainError:
+    declared_size = _parse_content_length(request.headers.get("content-length"))
+    if declared_size is not None and declared_size > AI_AUDIO_UPLOAD_MAX_BYTES:
+        return audio_too_large_error()
+
+    # base64/JSON 파싱 없이 받은 바이트를 그대로 버퍼에 쌓고, 큰 업로드는 임시 파일로 넘긴다.
+    audio_file: SpooledTemporaryFile[bytes] = SpooledTemporaryFile(max_size=AI_AUDIO_SPOOL_MAX_BYTES)
+    audio_size = 0
+    async for chunk in request.stream():
+        audio_size += len(chunk)
+        if audio_size > AI_AUDIO_UPLOAD_MAX_BYTES:
+            audio_file.close()
+            return audio_too_large_error()
+        audio_file.write(chunk)
+    audio_file.seek(0)
+    return audio_file, audio_size
+
+
+def _read_previous_text(request: Request) -> str | None | DomainError:
+    raw_value = request.headers.get(PREVIOUS_TEXT_HEADER)
+    if not raw_value:
+        return None
+    try:
+        return base64.b64decode(raw_value, validate=True).decode("utf-8")
+    except (binascii.Error, UnicodeDecodeError):
+        return DomainError(code="INVALID_ARGUMENT", message=f"{PREVIOUS_TEXT_HEADER} 헤더 형식이 올바르지 않습니다.")
+
+
+def _parse_content_length(value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _format_ndjson(payload: dict[str, object]) -> str:
+    return json.dumps(payload, ensure_ascii=False) + "\n"
+
+
+def _format_ndjson_error(error: DomainError) -> str:
+    return _format_ndjson({"type": "error", "error": {"code": error.code, "message": error.message}})
+
+
 def _error_response(status_code: int, code: str, message: str) -> JSONResponse:
     return JSONResponse(
         status_code=status_code,
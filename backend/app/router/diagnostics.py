@@ -0,0 +1,81 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.settings import SESSION_COOKIE_NAME
+from app.infra.db import get_db_session
+from app.service.auth_service import AuthUser, get_user_from_session_token
+from app.service.diagnostics_service import list_slow_queries_by_admin
+from app.service.domain import DomainError
+
+router = APIRouter(prefix="/api/diagnostics", tags=["diagnostics"])
+
+
+class ErrorDetail(BaseModel):
+    code: str
+    message: str
+
+
+class ErrorResponse(BaseModel):
+    error: ErrorDetail
+
+
+class SlowQueryResponse(BaseModel):
+    recorded_at: datetime
+    route: str | None
+    statement: str
+    parameters: list[str]
+    duration_ms: float
+    explain_plan: str | None
+
+
+@router.get(
+    "/slow-queries",
+    response_model=list[SlowQueryResponse],
+    responses={401: {"model": ErrorResponse}, 403: {"model": ErrorResponse}},
+)
+async def get_slow_queries(
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+) -> list[SlowQueryResponse] | JSONResponse:
+    auth_user = await _require_auth_user(request, db)
+    if auth_user is None:
+        return _error_response(status.HTTP_401_UNAUTHORIZED, "UNAUTHORIZED", "로그인이 필요합니다.")
+
+    result = list_slow_queries_by_admin(auth_user)
+    if isinstance(result, DomainError):
+        return _error_response(status.HTTP_403_FORBIDDEN, result.code, result.message)
+
+    return [
+        SlowQueryResponse(
+            recorded_at=item.recorded_at,
+            route=item.route,
+            statement=item.statement,
+            parameters=item.parameters,
+            duration_ms=item.duration_ms,
+            explain_plan=item.explain_plan,
+        )
+        for item in result
+    ]
+
+
+async def _require_auth_user(request: Request, db: AsyncSession) -> AuthUser | None:
+    token = request.cookies.get(SESSION_COOKIE_NAME)
+    if token is None:
+        return None
+    return await get_user_from_session_token(token, db)
+
+
+def _error_response(status_code: int, code: str, message: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={
+            "error": {
+                "code": code,
+                "message": message,
+            }
+        },
+    )
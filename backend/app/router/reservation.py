@@ -1,29 +1,47 @@
 import asyncio
 import json
 from collections.abc import AsyncIterator
+from contextlib import suppress
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, WebSocket, WebSocketDisconnect, status
 from fastapi.responses import JSONResponse, StreamingResponse
-from pydantic import BaseModel
-from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.settings import SESSION_COOKIE_NAME
-from app.infra.db import get_db_session
+from app.infra.db import get_db_session, get_db_session_factory
 from app.service.auth_service import AuthUser, get_user_from_session_token
 from app.service.domain import DomainError
-from app.service.reservation_event_service import ReservationEvent, reservation_event_broker
+from app.service.minutes_room_service import (
+    MinutesRoomConnection,
+    MinutesRoomMessage,
+    minutes_room_hub,
+)
+from app.service.reservation_event_service import (
+    ReservationEvent,
+    ReservationEventFilter,
+    coalesce_reservation_events,
+    reservation_event_broker,
+    reservation_event_to_dict,
+)
 from app.service.reservation_service import (
     CreateReservationInput,
+    CreateReservationResult,
+    DeletedReservationResult,
     MinutesLiveStateResult,
     MinutesLockResult,
+    MinutesTranscriptChunkResult,
     ReservationDetailResult,
+    UpdatedReservationResult,
     UpdateReservationInput,
     acquire_minutes_lock,
+    append_minutes_transcript_chunk,
     create_reservation,
     delete_reservation,
     get_minutes_live_state,
     get_minutes_lock,
+    get_minutes_transcript_delta,
     get_reservation_detail,
     get_reservation_minutes_detail,
     list_reservations_for_wiki,
@@ -106,6 +124,11 @@ class ReservationDetailResponse(BaseModel):
     minutes_attachment: str | None = None
     created_by: CreatedByResponse
     attendees: list[AttendeeResponse]
+    version: int
+
+
+class VersionConflictResponse(ErrorResponse):
+    current: ReservationDetailResponse | None = None
 
 
 class UpdateReservationRequest(BaseModel):
@@ -124,6 +147,7 @@ class UpdateReservationRequest(BaseModel):
     meeting_result: str | None = None
     other_notes: str | None = None
     minutes_attachment: str | None = None
+    version: int | None = None
 
 
 class MinutesLockAcquireRequest(BaseModel):
@@ -144,6 +168,7 @@ class MinutesLiveStateResponse(BaseModel):
     updated_by_user_id: str | None = None
     updated_by_name: str | None = None
     updated_at: datetime
+    transcript_seq: int = 0
 
 
 class UpdateMinutesLiveStateRequest(BaseModel):
@@ -151,37 +176,68 @@ class UpdateMinutesLiveStateRequest(BaseModel):
     is_recording: bool | None = None
 
 
+class AppendMinutesTranscriptChunkRequest(BaseModel):
+    text: str
+
+
+class MinutesTranscriptChunkResponse(BaseModel):
+    reservation_id: str
+    seq: int
+    text: str
+    created_at: datetime
+
+
 @router.get(
     "/events",
     response_model=None,
-    responses={401: {"model": ErrorResponse}},
+    responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}},
 )
 async def stream_reservation_events(
     request: Request,
-    db: AsyncSession = Depends(get_db_session),
+    room_id: list[str] | None = Query(None),
+    start_at: datetime | None = Query(None),
+    end_at: datetime | None = Query(None),
+    # 인증에만 쓰고 스트리밍 전에 세션을 반납해 긴 SSE 연결이 커넥션 풀을 점유하지 않게 한다.
+    db: AsyncSession = Depends(get_db_session, scope="function"),
 ) -> StreamingResponse | JSONResponse:
     auth_user = await _require_auth_user(request, db)
     if auth_user is None:
         return _error_response(status.HTTP_401_UNAUTHORIZED, "UNAUTHORIZED", "로그인이 필요합니다.")
+    if start_at is not None and end_at is not None and end_at <= start_at:
+        return _error_response(status.HTTP_400_BAD_REQUEST, "INVALID_ARGUMENT", "종료시간은 시작시간보다 커야 합니다.")
 
-    subscriber = await reservation_event_broker.subscribe()
+    event_filter = ReservationEventFilter(
+        room_ids=frozenset(room_id) if room_id else None,
+        start_at=start_at,
+        end_at=end_at,
+    )
+    last_event_id = request.headers.get("last-event-id")
 
     async def event_stream() -> AsyncIterator[str]:
+        # 구독은 스트림이 실제로 시작될 때 연다. 본문을 보내기 전에 끊기면 제너레이터가 돌지 않아
+        # finally도 불리지 않으므로, 바깥에서 열면 구독자와 메일함이 브로커에 남는다.
+        subscription = await reservation_event_broker.open_subscription(event_filter, last_event_id=last_event_id)
+        subscriber = subscription.queue
         try:
             yield "retry: 3000\n\n"
+            # 재연결 시 버퍼로 메우지 못한 구간이 있으면 reset으로 전체 재조회를 요청한다.
+            if subscription.reset:
+                yield f"id: {subscription.last_event_id}\nevent: reset\ndata: {{}}\n\n"
+            if subscription.replay:
+                yield _format_reservation_events(
+                    coalesce_reservation_events(subscription.replay),
+                    subscription.replay[-1].event_id,
+                )
+            yield f"id: {subscription.last_event_id}\n\n"
+            # 연결 종료는 StreamingResponse가 감지해 스트림을 취소하므로 여기서 폴링하지 않는다.
             while True:
-                if await request.is_disconnected():
-                    break
-                try:
-                    event = await asyncio.wait_for(subscriber.get(), timeout=25)
-                except TimeoutError:
+                batch = await subscriber.get_batch()
+                if batch.resync:
+                    yield f"id: {batch.last_event_id}\nevent: resync\ndata: {{}}\n\n"
+                elif batch.events:
+                    yield _format_reservation_events(batch.events, batch.last_event_id)
+                else:
                     yield ": keep-alive\n\n"
-                    continue
-                payload = json.dumps(
-                    {"action": event.action, "reservation_id": event.reservation_id},
-                    ensure_ascii=False,
-                )
-                yield f"event: reservation\ndata: {payload}\n\n"
         finally:
             await reservation_event_broker.unsubscribe(subscriber)
 
@@ -234,7 +290,7 @@ async def create_reservation_api(
     )
     if isinstance(result, DomainError):
         return _error_response(_error_status(result.code), result.code, result.message)
-    await reservation_event_broker.publish(ReservationEvent(action="created", reservation_id=result.id))
+    await reservation_event_broker.publish(_created_event(result))
 
     return CreateReservationResponse(
         id=result.id,
@@ -331,18 +387,22 @@ async def get_reservation_minutes_api(
         401: {"model": ErrorResponse},
         403: {"model": ErrorResponse},
         404: {"model": ErrorResponse},
-        409: {"model": ErrorResponse},
+        409: {"model": VersionConflictResponse},
     },
 )
 async def update_reservation_api(
     reservation_id: str,
     payload: UpdateReservationRequest,
     request: Request,
+    if_match: str | None = Header(None),
     db: AsyncSession = Depends(get_db_session),
 ) -> ReservationDetailResponse | JSONResponse:
     auth_user = await _require_auth_user(request, db)
     if auth_user is None:
         return _error_response(status.HTTP_401_UNAUTHORIZED, "UNAUTHORIZED", "로그인이 필요합니다.")
+    expected_version = _resolve_expected_version(payload.version, if_match)
+    if isinstance(expected_version, DomainError):
+        return _error_response(_error_status(expected_version.code), expected_version.code, expected_version.message)
 
     result = await update_reservation(
         reservation_id=reservation_id,
@@ -362,13 +422,17 @@ async def update_reservation_api(
             meeting_result=payload.meeting_result,
             other_notes=payload.other_notes,
             minutes_attachment=payload.minutes_attachment,
+            version=expected_version,
         ),
         auth_user=auth_user,
         db=db,
     )
     if isinstance(result, DomainError):
+        if result.code == "VERSION_CONFLICT":
+            return await _version_conflict_response(reservation_id, result, db)
         return _error_response(_error_status(result.code), result.code, result.message)
-    await reservation_event_broker.publish(ReservationEvent(action="updated", reservation_id=result.id))
+    if result.changed:
+        await reservation_event_broker.publish(_updated_event(result))
 
     return _to_reservation_detail_response(result)
 
@@ -381,18 +445,22 @@ async def update_reservation_api(
         401: {"model": ErrorResponse},
         403: {"model": ErrorResponse},
         404: {"model": ErrorResponse},
-        409: {"model": ErrorResponse},
+        409: {"model": VersionConflictResponse},
     },
 )
 async def update_reservation_minutes_api(
     reservation_id: str,
     payload: UpdateReservationRequest,
     request: Request,
+    if_match: str | None = Header(None),
     db: AsyncSession = Depends(get_db_session),
 ) -> ReservationDetailResponse | JSONResponse:
     auth_user = await _require_auth_user(request, db)
     if auth_user is None:
         return _error_response(status.HTTP_401_UNAUTHORIZED, "UNAUTHORIZED", "로그인이 필요합니다.")
+    expected_version = _resolve_expected_version(payload.version, if_match)
+    if isinstance(expected_version, DomainError):
+        return _error_response(_error_status(expected_version.code), expected_version.code, expected_version.message)
 
     result = await update_reservation_minutes(
         reservation_id=reservation_id,
@@ -412,13 +480,17 @@ async def update_reservation_minutes_api(
             meeting_result=payload.meeting_result,
             other_notes=payload.other_notes,
             minutes_attachment=payload.minutes_attachment,
+            version=expected_version,
         ),
         auth_user=auth_user,
         db=db,
     )
     if isinstance(result, DomainError):
+        if result.code == "VERSION_CONFLICT":
+            return await _version_conflict_response(reservation_id, result, db)
         return _error_response(_error_status(result.code), result.code, result.message)
-    await reservation_event_broker.publish(ReservationEvent(action="updated", reservation_id=result.id))
+    if result.changed:
+        await reservation_event_broker.publish(_updated_event(result))
 
     return _to_reservation_detail_response(result)
 
@@ -467,6 +539,7 @@ async def acquire_minutes_lock_api(
     )
     if isinstance(result, DomainError):
         return _error_response(_error_status(result.code), result.code, result.message)
+    minutes_room_hub.broadcast(reservation_id, _minutes_lock_message(result))
     return _to_minutes_lock_response(result)
 
 
@@ -490,6 +563,7 @@ async def release_minutes_lock_api(
     )
     if isinstance(result, DomainError):
         return _error_response(_error_status(result.code), result.code, result.message)
+    await _broadcast_minutes_lock_released(reservation_id, db)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -535,9 +609,193 @@ async def update_minutes_live_state_api(
     )
     if isinstance(result, DomainError):
         return _error_response(_error_status(result.code), result.code, result.message)
+    minutes_room_hub.broadcast(reservation_id, _minutes_live_state_message(result))
     return _to_minutes_live_state_response(result)
 
 
+@router.post(
+    "/{reservation_id}/minutes-transcript-chunks",
+    response_model=MinutesTranscriptChunkResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+        403: {"model": ErrorResponse},
+        409: {"model": ErrorResponse},
+    },
+)
+async def append_minutes_transcript_chunk_api(
+    reservation_id: str,
+    payload: AppendMinutesTranscriptChunkRequest,
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+) -> MinutesTranscriptChunkResponse | JSONResponse:
+    auth_user = await _require_auth_user(request, db)
+    if auth_user is None:
+        return _error_response(status.HTTP_401_UNAUTHORIZED, "UNAUTHORIZED", "로그인이 필요합니다.")
+    result = await append_minutes_transcript_chunk(
+        reservation_id=reservation_id,
+        holder=auth_user,
+        text=payload.text,
+        db=db,
+    )
+    if isinstance(result, DomainError):
+        return _error_response(_error_status(result.code), result.code, result.message)
+    minutes_room_hub.broadcast(reservation_id, _minutes_transcript_chunk_message(result))
+    return _to_minutes_transcript_chunk_response(result)
+
+
+# 회의록 뷰어용 SSE. 전체 전사를 다시 받지 않고, 뷰어가 가진 마지막 조각 번호 이후의
+# 추가분과 녹음 상태 변화만 보낸다. 이벤트 id가 조각 번호라 재연결 시 Last-Event-ID로 이어 받는다.
+@router.get(
+    "/{reservation_id}/minutes-live-events",
+    response_model=None,
+    responses={401: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
+)
+async def stream_minutes_live_events(
+    reservation_id: str,
+    request: Request,
+    after_seq: int | None = Query(None, ge=0),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
+) -> StreamingResponse | JSONResponse:
+    auth_user = await _require_auth_user(request, db)
+    if auth_user is None:
+        return _error_response(status.HTTP_401_UNAUTHORIZED, "UNAUTHORIZED", "로그인이 필요합니다.")
+    if after_seq is None:
+        after_seq = _parse_transcript_seq(request.headers.get("last-event-id"))
+
+    # 조회와 구독 사이에 붙은 조각을 놓치지 않게 먼저 구독하고, 겹치는 조각은 번호로 거른다.
+    connection = minutes_room_hub.subscribe(reservation_id, auth_user.id, auth_user.name)
+    result = await get_minutes_transcript_delta(reservation_id=reservation_id, after_seq=after_seq, db=db)
+    if isinstance(result, DomainError):
+        minutes_room_hub.leave(connection)
+        return _error_response(_error_status(result.code), result.code, result.message)
+
+    async def event_stream() -> AsyncIterator[str]:
+        last_seq = result.transcript_seq
+        recording: dict[str, object] = {
+            "is_recording": result.is_recording,
+            "updated_by_user_id": result.updated_by_user_id,
+            "updated_by_name": result.updated_by_name,
+        }
+        try:
+            yield "retry: 3000\n\n"
+            if result.snapshot is not None:
+                snapshot = _to_minutes_live_state_response(result.snapshot).model_dump(mode="json")
+                yield _format_minutes_live_event("snapshot", last_seq, snapshot)
+            else:
+                for chunk in result.chunks:
+                    yield _format_minutes_live_event("transcript", chunk.seq, {"seq": chunk.seq, "text": chunk.text})
+                yield _format_minutes_live_event("recording", last_seq, recording)
+            while True:
+                message = await connection.get()
+                if message is None:
+                    # 너무 밀린 뷰어는 끊는다. 재연결하면 Last-Event-ID 이후부터 다시 받는다.
+                    return
+                if message["type"] == "heartbeat":
+                    # 허브의 공용 하트비트 태스크가 깨운 경우
+                    yield ": keep-alive\n\n"
+                elif message["type"] == "transcript_chunk":
+                    chunk_payload = message["chunk"]
+                    if chunk_payload["seq"] <= last_seq:
+                        continue
+                    last_seq = chunk_payload["seq"]
+                    yield _format_minutes_live_event(
+                        "transcript",
+                        last_seq,
+                        {"seq": last_seq, "text": chunk_payload["text"]},
+                    )
+                elif message["type"] == "live_state":
+                    live_state = message["live_state"]
+                    next_recording = {key: live_state[key] for key in recording}
+                    if live_state["transcript_seq"] > last_seq:
+                        # 전사 교체처럼 조각으로 이어 붙일 수 없는 변경은 전체 상태로 보낸다.
+                        last_seq = live_state["transcript_seq"]
+                        recording = next_recording
+                        yield _format_minutes_live_event("snapshot", last_seq, live_state)
+                    elif next_recording["is_recording"] != recording["is_recording"]:
+                        recording = next_recording
+                        yield _format_minutes_live_event("recording", last_seq, recording)
+                elif message["type"] == "lock" and message["lock"] is None and recording["is_recording"]:
+                    # 만료 잠금을 sweeper가 정리하면 녹음도 함께 꺼진다.
+                    recording = {**recording, "is_recording": False}
+                    yield _format_minutes_live_event("recording", last_seq, recording)
+                elif message["type"] == "transcription":
+                    # 전사 작업 결과(완료/실패). 전사 내용 자체는 transcript 이벤트로 따로 온다.
+                    yield _format_minutes_live_event("transcription", last_seq, message["job"])
+        finally:
+            minutes_room_hub.leave(connection)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+# 회의록 협업 채널. 잠금/하트비트/전사 갱신/접속자 목록을 연결 하나로 주고받고,
+# 변경은 같은 예약 방의 모든 접속자에게 바로 전달한다.
+@router.websocket("/{reservation_id}/minutes-ws")
+async def minutes_room_ws(
+    websocket: WebSocket,
+    reservation_id: str,
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_db_session_factory),
+) -> None:
+    # 연결이 열려 있는 동안 DB 세션을 붙잡지 않도록 메시지마다 짧은 세션을 연다.
+    async with session_factory() as db:
+        auth_user = await _require_ws_auth_user(websocket, db)
+        if auth_user is None:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="UNAUTHORIZED")
+            return
+        connection = minutes_room_hub.join(reservation_id, auth_user.id, auth_user.name)
+        live_state = await get_minutes_live_state(reservation_id=reservation_id, db=db)
+        lock = await get_minutes_lock(reservation_id=reservation_id, db=db)
+    if isinstance(live_state, DomainError):
+        minutes_room_hub.leave(connection)
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=live_state.code)
+        return
+
+    await websocket.accept()
+    connection.push(
+        {
+            "type": "snapshot",
+            "lock": _to_minutes_lock_response(lock).model_dump(mode="json") if lock is not None else None,
+            "live_state": _to_minutes_live_state_response(live_state).model_dump(mode="json"),
+        }
+    )
+    minutes_room_hub.broadcast_presence(reservation_id)
+    sender = asyncio.create_task(_send_minutes_room_messages(websocket, connection))
+    try:
+        while True:
+            raw_message = await websocket.receive_text()
+            async with session_factory() as db:
+                await _handle_minutes_room_message(reservation_id, auth_user, raw_message, connection, db)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        with suppress(asyncio.CancelledError):
+            await sender
+        minutes_room_hub.leave(connection)
+        if connection.holds_lock and not minutes_room_hub.is_user_connected(reservation_id, auth_user.id):
+            # 이 연결로 잡은 잠금은 보유자의 마지막 연결이 끊기면 TTL 만료를 기다리지 않고 바로 푼다.
+            async with session_factory() as db:
+                current_lock = await get_minutes_lock(reservation_id=reservation_id, db=db)
+                if current_lock is not None and current_lock.holder_user_id == auth_user.id:
+                    released = await release_minutes_lock(
+                        reservation_id=reservation_id,
+                        holder_user_id=auth_user.id,
+                        db=db,
+                    )
+                    if not isinstance(released, DomainError):
+                        await _broadcast_minutes_lock_released(reservation_id, db)
+        minutes_room_hub.broadcast_presence(reservation_id)
+
+
 @router.delete(
     "/{reservation_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -555,7 +813,7 @@ async def delete_reservation_api(
     result = await delete_reservation(reservation_id, auth_user, db)
     if isinstance(result, DomainError):
         return _error_response(_error_status(result.code), result.code, result.message)
-    await reservation_event_broker.publish(ReservationEvent(action="deleted", reservation_id=reservation_id))
+    await reservation_event_broker.publish(_deleted_event(result))
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -567,6 +825,179 @@ async def _require_auth_user(request: Request, db: AsyncSession) -> AuthUser | N
     return await get_user_from_session_token(token, db)
 
 
+async def _require_ws_auth_user(websocket: WebSocket, db: AsyncSession) -> AuthUser | None:
+    token = websocket.cookies.get(SESSION_COOKIE_NAME)
+    if token is None:
+        return None
+    return await get_user_from_session_token(token, db)
+
+
+async def _send_minutes_room_messages(websocket: WebSocket, connection: MinutesRoomConnection) -> None:
+    while True:
+        message = await connection.get()
+        if message is None:
+            # 송신 큐가 넘친 연결은 닫고, 클라이언트가 재접속해 스냅샷을 다시 받게 한다.
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+            return
+        await websocket.send_json(message)
+
+
+async def _handle_minutes_room_message(
+    reservation_id: str,
+    auth_user: AuthUser,
+    raw_message: str,
+    connection: MinutesRoomConnection,
+    db: AsyncSession,
+) -> None:
+    try:
+        message = json.loads(raw_message)
+    except ValueError:
+        message = None
+    if not isinstance(message, dict):
+        connection.push(_minutes_room_error("INVALID_ARGUMENT", "메시지 형식이 올바르지 않습니다."))
+        return
+
+    message_type = message.get("type")
+    try:
+        if message_type in {"acquire_lock", "heartbeat"}:
+            lock_payload = MinutesLockAcquireRequest.model_validate(message)
+            lock_result = await acquire_minutes_lock(
+                reservation_id=reservation_id,
+                holder=auth_user,
+                db=db,
+                ttl_seconds=lock_payload.ttl_seconds,
+            )
+            if isinstance(lock_result, DomainError):
+                connection.push(_minutes_room_error(lock_result.code, lock_result.message))
+                return
+            connection.holds_lock = True
+            minutes_room_hub.broadcast(reservation_id, _minutes_lock_message(lock_result))
+        elif message_type == "release_lock":
+            release_result = await release_minutes_lock(
+                reservation_id=reservation_id,
+                holder_user_id=auth_user.id,
+                db=db,
+            )
+            if isinstance(release_result, DomainError):
+                connection.push(_minutes_room_error(release_result.code, release_result.message))
+                return
+            connection.holds_lock = False
+            await _broadcast_minutes_lock_released(reservation_id, db)
+        elif message_type == "live_state":
+            state_payload = UpdateMinutesLiveStateRequest.model_validate(message)
+            state_result = await update_minutes_live_state(
+                reservation_id=reservation_id,
+                holder=auth_user,
+                transcript_text=state_payload.transcript_text,
+                is_recording=state_payload.is_recording,
+                db=db,
+            )
+            if isinstance(state_result, DomainError):
+                connection.push(_minutes_room_error(state_result.code, state_result.message))
+                return
+            minutes_room_hub.broadcast(reservation_id, _minutes_live_state_message(state_result))
+        elif message_type == "transcript_chunk":
+            chunk_payload = AppendMinutesTranscriptChunkRequest.model_validate(message)
+            chunk_result = await append_minutes_transcript_chunk(
+                reservation_id=reservation_id,
+                holder=auth_user,
+                text=chunk_payload.text,
+                db=db,
+            )
+            if isinstance(chunk_result, DomainError):
+                connection.push(_minutes_room_error(chunk_result.code, chunk_result.message))
+                return
+            minutes_room_hub.broadcast(reservation_id, _minutes_transcript_chunk_message(chunk_result))
+        else:
+            connection.push(_minutes_room_error("INVALID_ARGUMENT", "지원하지 않는 메시지 타입입니다."))
+    except ValidationError:
+        connection.push(_minutes_room_error("INVALID_ARGUMENT", "메시지 형식이 올바르지 않습니다."))
+
+
+async def _broadcast_minutes_lock_released(reservation_id: str, db: AsyncSession) -> None:
+    # 잠금 해제 시 녹음 상태도 함께 꺼지므로 전사 상태를 같이 보낸다.
+    minutes_room_hub.broadcast(reservation_id, {"type": "lock", "lock": None})
+    live_state = await get_minutes_live_state(reservation_id=reservation_id, db=db)
+    if not isinstance(live_state, DomainError):
+        minutes_room_hub.broadcast(reservation_id, _minutes_live_state_message(live_state))
+
+
+def _minutes_lock_message(result: MinutesLockResult) -> MinutesRoomMessage:
+    return {"type": "lock", "lock": _to_minutes_lock_response(result).model_dump(mode="json")}
+
+
+def _minutes_live_state_message(result: MinutesLiveStateResult) -> MinutesRoomMessage:
+    return {"type": "live_state", "live_state": _to_minutes_live_state_response(result).model_dump(mode="json")}
+
+
+def _minutes_transcript_chunk_message(result: MinutesTranscriptChunkResult) -> MinutesRoomMessage:
+    return {"type": "transcript_chunk", "chunk": _to_minutes_transcript_chunk_response(result).model_dump(mode="json")}
+
+
+def _format_minutes_live_event(event: str, seq: int, payload: dict[str, object]) -> str:
+    return f"id: {seq}\nevent: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+def _parse_transcript_seq(value: str | None) -> int | None:
+    if value is None or not value.isdigit():
+        return None
+    return int(value)
+
+
+def _minutes_room_error(code: str, message: str) -> MinutesRoomMessage:
+    return {"type": "error", "error": {"code": code, "message": message}}
+
+
+def _format_reservation_events(events: list[ReservationEvent], last_event_id: str | None) -> str:
+    # 한 건이면 기존 reservation 이벤트, 여러 건이면 하나의 reservations 배치 프레임으로 보낸다.
+    if len(events) == 1:
+        payload = json.dumps(reservation_event_to_dict(events[0]), ensure_ascii=False)
+        return f"id: {last_event_id}\nevent: reservation\ndata: {payload}\n\n"
+    payload = json.dumps([reservation_event_to_dict(event) for event in events], ensure_ascii=False)
+    return f"id: {last_event_id}\nevent: reservations\ndata: {payload}\n\n"
+
+
+def _created_event(result: CreateReservationResult) -> ReservationEvent:
+    return ReservationEvent(
+        action="created",
+        reservation_id=result.id,
+        room_id=result.room_id,
+        start_at=result.start_at,
+        end_at=result.end_at,
+        room_name=result.room_name,
+        title=result.title,
+        label=result.label,
+        created_by_name=result.created_by_name,
+    )
+
+
+def _updated_event(result: UpdatedReservationResult) -> ReservationEvent:
+    return ReservationEvent(
+        action="updated",
+        reservation_id=result.id,
+        room_id=result.room_id,
+        start_at=result.start_at,
+        end_at=result.end_at,
+        previous_room_id=result.previous_room_id,
+        previous_start_at=result.previous_start_at,
+        previous_end_at=result.previous_end_at,
+        room_name=result.room_name,
+        title=result.title,
+        label=result.label,
+        created_by_name=result.created_by_name,
+    )
+
+
+def _deleted_event(result: DeletedReservationResult) -> ReservationEvent:
+    return ReservationEvent(
+        action="deleted",
+        reservation_id=result.id,
+        previous_room_id=result.room_id,
+        previous_start_at=result.start_at,
+        previous_end_at=result.end_at,
+    )
+
+
 def _to_reservation_detail_response(result: ReservationDetailResult) -> ReservationDetailResponse:
     return ReservationDetailResponse(
         id=result.id,
@@ -587,6 +1018,7 @@ def _to_reservation_detail_response(result: ReservationDetailResult) -> Reservat
         minutes_attachment=result.minutes_attachment,
         created_by=CreatedByResponse(name=result.created_by_name, email=result.created_by_email),
         attendees=[AttendeeResponse(id=item.id, name=item.name, email=item.email) for item in result.attendees],
+        version=result.version,
     )
 
 
@@ -607,6 +1039,16 @@ def _to_minutes_live_state_response(result: MinutesLiveStateResult) -> MinutesLi
         updated_by_user_id=result.updated_by_user_id,
         updated_by_name=result.updated_by_name,
         updated_at=result.updated_at,
+        transcript_seq=result.transcript_seq,
+    )
+
+
+def _to_minutes_transcript_chunk_response(result: MinutesTranscriptChunkResult) -> MinutesTranscriptChunkResponse:
+    return MinutesTranscriptChunkResponse(
+        reservation_id=result.reservation_id,
+        seq=result.seq,
+        text=result.text,
+        created_at=result.created_at,
     )
 
 
@@ -619,11 +1061,35 @@ def _error_status(code: str) -> int:
         return status.HTTP_400_BAD_REQUEST
     if code == "NOT_FOUND":
         return status.HTTP_404_NOT_FOUND
-    if code in {"RESERVATION_CONFLICT", "LOCKED"}:
+    if code in {"RESERVATION_CONFLICT", "LOCKED", "VERSION_CONFLICT"}:
         return status.HTTP_409_CONFLICT
     return status.HTTP_500_INTERNAL_SERVER_ERROR
 
 
+def _resolve_expected_version(body_version: int | None, if_match: str | None) -> int | None | DomainError:
+    # 본문 version을 우선하고, 없으면 If-Match(`"3"`, `W/"3"`, `*`)를 쓴다.
+    if body_version is not None:
+        return body_version
+    if if_match is None or if_match.strip() == "*":
+        return None
+    value = if_match.strip().removeprefix("W/").strip('"')
+    if not value.isdigit():
+        return DomainError(code="INVALID_ARGUMENT", message="If-Match 값이 올바르지 않습니다.")
+    return int(value)
+
+
+async def _version_conflict_response(reservation_id: str, error: DomainError, db: AsyncSession) -> JSONResponse:
+    # 충돌한 편집자가 다시 조회하지 않고 바로 병합할 수 있게 현재 상태를 함께 보낸다.
+    current = await get_reservation_minutes_detail(reservation_id, db)
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content=VersionConflictResponse(
+            error=ErrorDetail(code=error.code, message=error.message),
+            current=_to_reservation_detail_response(current) if not isinstance(current, DomainError) else None,
+        ).model_dump(mode="json"),
+    )
+
+
 def _error_response(status_code: int, code: str, message: str) -> JSONResponse:
     return JSONResponse(
         status_code=status_code,
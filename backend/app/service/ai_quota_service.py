@@ -1,15 +1,37 @@
+import time
+from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 from decimal import ROUND_HALF_UP, Decimal
+from itertools import count
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.settings import AI_GLOBAL_MONTHLY_LIMIT_USD
-from app.infra.global_ai_quota import find_or_create_global_ai_quota
+from app.core.settings import (
+    AI_GLOBAL_MONTHLY_LIMIT_USD,
+    AI_QUOTA_HOLD_SUMMARY_USD,
+    AI_QUOTA_HOLD_TRANSCRIPTION_USD,
+    AI_QUOTA_HOLD_TTL_SECONDS,
+    AI_USAGE_CACHE_TTL_SECONDS,
+    AI_USAGE_ROLLUP_BATCH_SIZE,
+)
+from app.infra.ai_usage_ledger import (
+    add_ai_usage_ledger_entry,
+    list_pending_ai_usage_by_user,
+    list_pending_ai_usage_ledger_entries,
+    mark_ai_usage_ledger_entries_rolled_up,
+    sum_pending_user_ai_usage,
+)
+from app.infra.global_ai_quota import (
+    GlobalAiQuota,
+    find_global_ai_quota_with_pending_usd,
+    find_or_create_global_ai_quota,
+)
 from app.infra.user_ai_quota import (
+    UserAiQuota,
     find_or_create_user_ai_quota,
+    find_user_ai_quota,
     list_user_ai_quotas_with_users,
-    sum_user_ai_usage_by_period,
 )
 from app.service.admin_service import is_admin_user
 from app.service.auth_service import AuthUser
@@ -45,6 +67,14 @@ class AiUsageOverview:
     items: list[UserAiUsageSummary]
 
 
+@dataclass(frozen=True, slots=True)
+class AiQuotaReservation:
+    hold_id: int
+    user_id: str
+    period_month: str
+    estimated_usd: Decimal
+
+
 @dataclass(frozen=True, slots=True)
 class AppliedAiUsageStatus:
     global_used_usd: Decimal
@@ -72,6 +102,17 @@ def _default_global_limit_usd() -> Decimal:
         return Decimal("5.0000")
 
 
+def _parse_usd_amount(raw: str, default: Decimal) -> Decimal:
+    try:
+        return _to_usage_amount(max(ZERO_USD, Decimal(raw)))
+    except Exception:
+        return default
+
+
+TRANSCRIPTION_HOLD_USD = _parse_usd_amount(AI_QUOTA_HOLD_TRANSCRIPTION_USD, Decimal("0.005000"))
+SUMMARY_HOLD_USD = _parse_usd_amount(AI_QUOTA_HOLD_SUMMARY_USD, Decimal("0.010000"))
+
+
 def _to_global_status(monthly_limit_usd: Decimal, used_usd: Decimal, period_month: str) -> GlobalAiQuotaStatus:
     limit = _to_limit_amount(monthly_limit_usd)
     used = _to_usage_amount(used_usd)
@@ -88,27 +129,143 @@ def _effective_global_used_usd(global_used_usd: Decimal, aggregated_user_used_us
     return _to_usage_amount(max(global_used_usd, aggregated_user_used_usd))
 
 
-async def ensure_quota_available(user_id: str, db: AsyncSession) -> GlobalAiQuotaStatus | DomainError:
-    del user_id
-    month = _period_month_now()
-    quota = await find_or_create_global_ai_quota(
-        db=db,
-        period_month=month,
-        default_limit_usd=_default_global_limit_usd(),
-    )
-    used_usd = Decimal(str(quota.used_usd)) if quota.period_month == month else ZERO_USD
-    aggregated_user_used_usd = await sum_user_ai_usage_by_period(db, month)
-    status = _to_global_status(
+@dataclass(slots=True)
+class _CachedGlobalUsage:
+    period_month: str
+    monthly_limit_usd: Decimal
+    used_usd: Decimal
+    loaded_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class _Hold:
+    period_month: str
+    usd_cost: Decimal
+    expires_at: float
+
+
+class AiUsageCache:
+    # 한도 확인마다 합계 행과 원장을 다시 읽지 않도록 전사 사용량을 잠깐 들고 있는다.
+    # 이 프로세스에서 쓴 비용은 바로 더하고, 다른 워커가 쓴 비용은 TTL이 지나 다시 읽을 때 반영된다.
+    # 예상 비용 예약도 이 프로세스 안에서만 보이므로, 워커가 N개면 한도 초과폭은 최대 N배가 된다.
+    def __init__(
+        self,
+        ttl_seconds: int = AI_USAGE_CACHE_TTL_SECONDS,
+        hold_ttl_seconds: int = AI_QUOTA_HOLD_TTL_SECONDS,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.hold_ttl_seconds = max(1, hold_ttl_seconds)
+        self._cached: _CachedGlobalUsage | None = None
+        # 호출 전에 잡아 둔 예상 비용. 정산/취소 때 풀고, 응답 전에 끊겨 남은 예약은 만료되면 버린다.
+        self._holds: dict[int, _Hold] = {}
+        self._next_hold_id = count(1)
+
+    async def get_global_status(self, db: AsyncSession, period_month: str) -> GlobalAiQuotaStatus:
+        self._sweep_expired_holds()
+        cached = self._cached
+        if (
+            cached is None
+            or cached.period_month != period_month
+            or time.monotonic() - cached.loaded_at >= self.ttl_seconds
+        ):
+            cached = await _load_global_usage(db, period_month)
+            self._cached = cached
+        return _to_global_status(cached.monthly_limit_usd, cached.used_usd, period_month)
+
+    def add(self, period_month: str, usd_cost: Decimal) -> None:
+        cached = self._cached
+        if cached is not None and cached.period_month == period_month:
+            cached.used_usd = _to_usage_amount(cached.used_usd + usd_cost)
+
+    def held_usd(self, period_month: str) -> Decimal:
+        return sum((hold.usd_cost for hold in self._holds.values() if hold.period_month == period_month), ZERO_USD)
+
+    def hold(self, period_month: str, usd_cost: Decimal) -> int:
+        hold_id = next(self._next_hold_id)
+        self._holds[hold_id] = _Hold(period_month, usd_cost, time.monotonic() + self.hold_ttl_seconds)
+        return hold_id
+
+    def release(self, hold_id: int) -> bool:
+        return self._holds.pop(hold_id, None) is not None
+
+    def clear(self) -> None:
+        self._cached = None
+        self._holds.clear()
+
+    def _sweep_expired_holds(self) -> None:
+        now = time.monotonic()
+        expired = [hold_id for hold_id, hold in self._holds.items() if hold.expires_at <= now]
+        for hold_id in expired:
+            del self._holds[hold_id]
+
+
+async def _load_global_usage(db: AsyncSession, period_month: str) -> _CachedGlobalUsage:
+    # 합계 행에 아직 옮기지 않은 원장 항목까지 더해야 실제 사용량이다.
+    loaded = await find_global_ai_quota_with_pending_usd(db, period_month)
+    if loaded is None:
+        await find_or_create_global_ai_quota(
+            db=db,
+            period_month=period_month,
+            default_limit_usd=_default_global_limit_usd(),
+        )
+        return await _load_global_usage(db, period_month)
+    quota, pending_usd = loaded
+    rolled_up_usd = Decimal(str(quota.used_usd)) if quota.period_month == period_month else ZERO_USD
+    return _CachedGlobalUsage(
+        period_month=period_month,
         monthly_limit_usd=Decimal(str(quota.monthly_limit_usd)),
-        used_usd=_effective_global_used_usd(used_usd, aggregated_user_used_usd),
-        period_month=month,
+        used_usd=_to_usage_amount(rolled_up_usd + pending_usd),
+        loaded_at=time.monotonic(),
     )
-    if status.remaining_usd <= ZERO_USD:
+
+
+ai_usage_cache = AiUsageCache()
+
+
+async def reserve_ai_quota(
+    user_id: str,
+    estimated_usd: Decimal,
+    db: AsyncSession,
+) -> AiQuotaReservation | DomainError:
+    # 호출 전에 예상 비용을 잡아 둬서, 동시에 들어온 호출들이 같은 잔액을 보고 한도를 함께 넘지 않게 한다.
+    month = _period_month_now()
+    status = await ai_usage_cache.get_global_status(db, month)
+    # 위 await 이후로는 양보 지점이 없어 잔액 확인과 예약이 이 프로세스 안에서 한 번에 일어난다.
+    if status.remaining_usd - ai_usage_cache.held_usd(month) <= ZERO_USD:
         return DomainError(
             code="QUOTA_EXCEEDED",
             message=f"이번 달 전사 AI 사용 한도($ {status.monthly_limit_usd})를 초과했습니다.",
         )
-    return status
+    normalized_estimate = _to_usage_amount(max(ZERO_USD, estimated_usd))
+    return AiQuotaReservation(
+        hold_id=ai_usage_cache.hold(month, normalized_estimate),
+        user_id=user_id,
+        period_month=month,
+        estimated_usd=normalized_estimate,
+    )
+
+
+def release_ai_quota(reservation: AiQuotaReservation) -> bool:
+    # 호출이 실패해 정산할 비용이 없을 때. 이미 정산한 예약이면 아무것도 하지 않고 False를 돌려준다.
+    return ai_usage_cache.release(reservation.hold_id)
+
+
+async def settle_ai_quota(
+    reservation: AiQuotaReservation,
+    usd_cost: Decimal,
+    db: AsyncSession,
+) -> AppliedAiUsageStatus:
+    # 예약을 풀고 실제 비용을 기록한다. 호출은 이미 끝났으므로 한도를 넘었더라도 비용은 그대로 남긴다.
+    ai_usage_cache.release(reservation.hold_id)
+    month = _period_month_now()
+    global_status = await ai_usage_cache.get_global_status(db, month)
+    return await _record_ai_usage(
+        reservation.user_id,
+        _to_usage_amount(max(ZERO_USD, usd_cost)),
+        month,
+        global_status,
+        db,
+    )
 
 
 async def list_ai_usage_summaries_by_admin(
@@ -125,8 +282,13 @@ async def list_ai_usage_summaries_by_admin(
         default_limit_usd=_default_global_limit_usd(),
     )
     rows = await list_user_ai_quotas_with_users(db)
+    pending_by_user = {
+        user_id: (Decimal(str(pending_usd)), last_used_at)
+        for user_id, pending_usd, last_used_at in await list_pending_ai_usage_by_user(db, month)
+    }
     items: list[UserAiUsageSummary] = []
     aggregated_user_used_usd = ZERO_USD
+    pending_total_usd = ZERO_USD
     for (
         user_id,
         name,
@@ -138,6 +300,14 @@ async def list_ai_usage_summaries_by_admin(
         updated_at,
     ) in rows:
         normalized_used = Decimal(str(used_usd)) if used_usd is not None and period_month == month else ZERO_USD
+        normalized_updated_at = updated_at if period_month == month and isinstance(updated_at, datetime) else None
+        pending = pending_by_user.get(user_id)
+        if pending is not None:
+            pending_usd, last_used_at = pending
+            normalized_used += pending_usd
+            pending_total_usd += pending_usd
+            if normalized_updated_at is None or _as_aware(last_used_at) > _as_aware(normalized_updated_at):
+                normalized_updated_at = last_used_at
         aggregated_user_used_usd += normalized_used
         items.append(
             UserAiUsageSummary(
@@ -147,11 +317,12 @@ async def list_ai_usage_summaries_by_admin(
                 department=department,
                 used_usd=_to_usage_amount(normalized_used),
                 period_month=month,
-                updated_at=updated_at if period_month == month and isinstance(updated_at, datetime) else None,
+                updated_at=normalized_updated_at,
             )
         )
 
     global_used_usd = Decimal(str(global_quota.used_usd)) if global_quota.period_month == month else ZERO_USD
+    global_used_usd += pending_total_usd
     summary = _to_global_status(
         monthly_limit_usd=Decimal(str(global_quota.monthly_limit_usd)),
         used_usd=_effective_global_used_usd(global_used_usd, aggregated_user_used_usd),
@@ -161,67 +332,95 @@ async def list_ai_usage_summaries_by_admin(
     return AiUsageOverview(summary=summary, items=items)
 
 
-async def apply_ai_usage_cost(
+async def _record_ai_usage(
     user_id: str,
     usd_cost: Decimal,
+    period_month: str,
+    global_status: GlobalAiQuotaStatus,
     db: AsyncSession,
-) -> AppliedAiUsageStatus | DomainError:
-    normalized_cost = _to_usage_amount(max(ZERO_USD, usd_cost))
-    month = _period_month_now()
+) -> AppliedAiUsageStatus:
+    # 합계 행을 잠그지 않고 원장에 한 줄 추가만 한다. 합계 행 반영은 rollup_ai_usage_ledger가 모아서 한다.
+    try:
+        if usd_cost > ZERO_USD:
+            add_ai_usage_ledger_entry(db, user_id, usd_cost, period_month)
+        # 방금 추가한 항목까지 포함해 읽고, 커밋으로 트랜잭션을 끝낸다.
+        user_used_usd = await _user_used_usd(db, user_id, period_month)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    ai_usage_cache.add(period_month, usd_cost)
+
+    global_used_usd = _to_usage_amount(global_status.used_usd + usd_cost)
+    return AppliedAiUsageStatus(
+        global_used_usd=global_used_usd,
+        global_remaining_usd=_to_usage_amount(max(ZERO_USD, global_status.monthly_limit_usd - global_used_usd)),
+        user_used_usd=_to_usage_amount(user_used_usd),
+        period_month=period_month,
+    )
+
 
+async def _user_used_usd(db: AsyncSession, user_id: str, period_month: str) -> Decimal:
+    quota = await find_user_ai_quota(db, user_id)
+    rolled_up_usd = ZERO_USD
+    if quota is not None and quota.period_month == period_month:
+        rolled_up_usd = Decimal(str(quota.used_usd))
+    return rolled_up_usd + await sum_pending_user_ai_usage(db, user_id, period_month)
+
+
+async def rollup_ai_usage_ledger(db: AsyncSession, batch_size: int = AI_USAGE_ROLLUP_BATCH_SIZE) -> int:
+    # 원장 항목을 사용자/전사 합계 행에 더하고 반영 시각을 남긴다. 반영한 항목 수를 돌려준다.
+    month = _period_month_now()
     try:
+        # 전사 행을 먼저 잠가 여러 워커의 롤업이 같은 항목을 두 번 반영하지 않게 한다.
         global_quota = await find_or_create_global_ai_quota(
             db=db,
             period_month=month,
             default_limit_usd=_default_global_limit_usd(),
             for_update=True,
         )
-        user_quota = await find_or_create_user_ai_quota(
-            db=db,
-            user_id=user_id,
-            period_month=month,
-            default_limit_usd=ZERO_USD,
-            for_update=True,
-        )
-
-        if global_quota.period_month != month:
-            global_quota.period_month = month
-            global_quota.used_usd = _to_usage_amount(ZERO_USD)
-        if user_quota.period_month != month:
-            user_quota.period_month = month
-            user_quota.used_usd = _to_usage_amount(ZERO_USD)
-
-        aggregated_user_used_usd = await sum_user_ai_usage_by_period(db, month)
-        current_global_used_usd = _effective_global_used_usd(
-            Decimal(str(global_quota.used_usd)),
-            aggregated_user_used_usd,
-        )
-        global_quota.used_usd = current_global_used_usd
-
-        current_global_status = _to_global_status(
-            monthly_limit_usd=Decimal(str(global_quota.monthly_limit_usd)),
-            used_usd=current_global_used_usd,
-            period_month=month,
-        )
-        if normalized_cost > ZERO_USD and current_global_status.remaining_usd < normalized_cost:
-            await db.rollback()
-            return DomainError(
-                code="QUOTA_EXCEEDED",
-                message=f"이번 달 전사 AI 사용 한도($ {current_global_status.monthly_limit_usd})를 초과했습니다.",
+        entries = await list_pending_ai_usage_ledger_entries(db, max(1, batch_size))
+        if not entries:
+            await db.commit()
+            return 0
+
+        user_totals: defaultdict[tuple[str, str], Decimal] = defaultdict(lambda: ZERO_USD)
+        period_totals: defaultdict[str, Decimal] = defaultdict(lambda: ZERO_USD)
+        for entry in entries:
+            cost = Decimal(str(entry.usd_cost))
+            user_totals[(entry.user_id, entry.period_month)] += cost
+            period_totals[entry.period_month] += cost
+
+        for (entry_user_id, period_month), total_usd in sorted(user_totals.items()):
+            user_quota = await find_or_create_user_ai_quota(
+                db=db,
+                user_id=entry_user_id,
+                period_month=period_month,
+                default_limit_usd=ZERO_USD,
+                for_update=True,
             )
+            _add_period_usage(user_quota, period_month, total_usd)
+        for period_month, total_usd in sorted(period_totals.items()):
+            _add_period_usage(global_quota, period_month, total_usd)
 
-        global_quota.used_usd = _to_usage_amount(Decimal(str(global_quota.used_usd)) + normalized_cost)
-        user_quota.used_usd = _to_usage_amount(Decimal(str(user_quota.used_usd)) + normalized_cost)
+        await mark_ai_usage_ledger_entries_rolled_up(db, [entry.id for entry in entries], datetime.now(UTC))
         await db.commit()
-
-        return AppliedAiUsageStatus(
-            global_used_usd=_to_usage_amount(Decimal(str(global_quota.used_usd))),
-            global_remaining_usd=_to_usage_amount(
-                max(ZERO_USD, Decimal(str(global_quota.monthly_limit_usd)) - Decimal(str(global_quota.used_usd)))
-            ),
-            user_used_usd=_to_usage_amount(Decimal(str(user_quota.used_usd))),
-            period_month=month,
-        )
+        return len(entries)
     except Exception:
         await db.rollback()
         raise
+
+
+def _add_period_usage(quota: GlobalAiQuota | UserAiQuota, period_month: str, usd_cost: Decimal) -> None:
+    # 합계 행은 이번 달 사용량만 들고 있으므로, 지난달 항목은 원장에만 남긴다.
+    if quota.period_month > period_month:
+        return
+    if quota.period_month < period_month:
+        quota.period_month = period_month
+        quota.used_usd = _to_usage_amount(ZERO_USD)
+    quota.used_usd = _to_usage_amount(Decimal(str(quota.used_usd)) + usd_cost)
+
+
+def _as_aware(value: datetime) -> datetime:
+    # SQLite는 시간대 정보를 버리므로 비교 전에 UTC로 맞춘다.
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
@@ -1,24 +1,38 @@
+import asyncio
 import base64
 import json
 import re
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from decimal import ROUND_HALF_UP, Decimal
-
-from app.core.settings import OPENAI_API_KEY
+from typing import IO
+
+from app.core.settings import (
+    AI_AUDIO_UPLOAD_MAX_BYTES,
+    AI_PROVIDER,
+    AI_SUMMARY_CHUNK_CHARS,
+    AI_SUMMARY_MAX_CONCURRENCY,
+    OPENAI_API_KEY,
+)
 from app.infra.openai import (
+    is_retryable_openai_error,
     repair_minutes_json,
+    stream_minutes_json,
     suggest_minutes_json,
 )
 from app.infra.openai import (
     transcribe_audio_chunk as openai_transcribe_audio_chunk,
 )
 from app.service.domain import DomainError
+from app.service.transcription_cache_service import transcription_cache, transcription_cache_key
+from app.service.voice_activity_service import is_silent_wav
 
 GPT4O_TRANSCRIPT_INPUT_PER_1M = Decimal("2.5000")
 GPT4O_TRANSCRIPT_OUTPUT_PER_1M = Decimal("10.0000")
 GPT5_NANO_INPUT_PER_1M = Decimal("0.0500")
 GPT5_NANO_OUTPUT_PER_1M = Decimal("0.4000")
 USD_COST_PRECISION = Decimal("0.000001")
+MINUTES_SUGGESTION_SECTIONS = ("agenda", "meeting_content", "meeting_result")
 SUPPORTED_AUDIO_FORMATS: dict[str, str] = {
     "mp3": "audio/mpeg",
     "mp4": "audio/mp4",
@@ -38,6 +52,19 @@ class MinutesSuggestionResult:
     usd_cost: Decimal
 
 
+@dataclass
+class MinutesSuggestionFailure:
+    error: DomainError
+    # 실패 전에 이미 끝난 호출(구간 요약 등)의 비용. 0이 아니면 정산해야 한다.
+    usd_cost: Decimal
+
+
+@dataclass
+class MinutesSuggestionItem:
+    section: str
+    text: str
+
+
 @dataclass
 class TranscriptionResult:
     text: str
@@ -214,7 +241,8 @@ def _calc_usd_cost(
 
 
 def _require_api_key() -> DomainError | None:
-    if OPENAI_API_KEY:
+    # 로컬 대역은 키 없이 동작한다.
+    if OPENAI_API_KEY or AI_PROVIDER == "fake":
         return None
     return DomainError(code="INVALID_ARGUMENT", message="OPENAI_API_KEY가 설정되지 않았습니다.")
 
@@ -241,7 +269,7 @@ def _normalize_audio_format(mime_type: str | None) -> tuple[str, str] | DomainEr
     return subtype, normalized_mime
 
 
-def transcribe_audio_chunk(
+async def transcribe_audio_chunk(
     audio_base64: str,
     mime_type: str | None,
     previous_text: str | None,
@@ -254,18 +282,51 @@ def transcribe_audio_chunk(
         audio_bytes = base64.b64decode(audio_base64)
     except Exception:
         return DomainError(code="INVALID_ARGUMENT", message="오디오 데이터 형식이 올바르지 않습니다.")
-    if len(audio_bytes) == 0:
+    return await transcribe_audio(audio_bytes, len(audio_bytes), mime_type, previous_text)
+
+
+async def transcribe_audio(
+    audio: bytes | IO[bytes],
+    audio_size: int,
+    mime_type: str | None,
+    previous_text: str | None,
+) -> TranscriptionResult | DomainError:
+    missing_key = _require_api_key()
+    if missing_key is not None:
+        return missing_key
+
+    if audio_size == 0:
         return DomainError(code="INVALID_ARGUMENT", message="빈 오디오 데이터입니다.")
+    if audio_size > AI_AUDIO_UPLOAD_MAX_BYTES:
+        return audio_too_large_error()
 
     normalized_audio = _normalize_audio_format(mime_type)
     if isinstance(normalized_audio, DomainError):
         return normalized_audio
     extension, normalized_mime_type = normalized_audio
 
+    # 회의 중 긴 침묵은 전사를 요청하지 않고 빈 결과를 비용 없이 돌려준다.
+    if extension == "wav" and await asyncio.to_thread(is_silent_wav, audio):
+        return TranscriptionResult(text="", usd_cost=Decimal("0"))
+
+    prompt = (previous_text or "").strip()[-1000:]
+    # 네트워크가 불안정해 같은 청크를 다시 보내면 저장된 결과를 비용 없이 돌려준다.
+    # 최대 25MB를 읽어 해시하므로 이벤트 루프를 막지 않게 스레드에서 계산한다.
+    cache_key = await asyncio.to_thread(transcription_cache_key, audio, normalized_mime_type, prompt)
+    while True:
+        cached_text = await transcription_cache.get(cache_key)
+        if cached_text is not None:
+            return TranscriptionResult(text=cached_text, usd_cost=Decimal("0"))
+        pending = transcription_cache.claim(cache_key)
+        if pending is None:
+            break
+        pending_text = await asyncio.shield(pending)
+        if pending_text is not None:
+            return TranscriptionResult(text=pending_text, usd_cost=Decimal("0"))
+
     try:
-        prompt = (previous_text or "").strip()[-1000:]
-        gateway_result = openai_transcribe_audio_chunk(
-            audio_bytes=audio_bytes,
+        gateway_result = await openai_transcribe_audio_chunk(
+            audio=audio,
             extension=extension,
             mime_type=normalized_mime_type,
             prompt=prompt if prompt else None,
@@ -278,99 +339,457 @@ def transcribe_audio_chunk(
             input_price=GPT4O_TRANSCRIPT_INPUT_PER_1M,
             output_price=GPT4O_TRANSCRIPT_OUTPUT_PER_1M,
         )
+        await transcription_cache.put(cache_key, cleaned_text)
         return TranscriptionResult(text=cleaned_text, usd_cost=usd_cost)
     except Exception as exc:
-        return DomainError(code="INVALID_ARGUMENT", message=f"전사에 실패했습니다: {exc}")
+        code = "UPSTREAM_UNAVAILABLE" if is_retryable_openai_error(exc) else "INVALID_ARGUMENT"
+        return DomainError(code=code, message=f"전사에 실패했습니다: {exc}")
+    finally:
+        transcription_cache.release(cache_key)
 
 
-def suggest_minutes_bullets(
-    transcript: str,
+def audio_too_large_error() -> DomainError:
+    max_mb = AI_AUDIO_UPLOAD_MAX_BYTES // (1024 * 1024)
+    return DomainError(
+        code="PAYLOAD_TOO_LARGE",
+        message=f"오디오 데이터가 너무 큽니다. 최대 {max_mb}MB까지 전송할 수 있습니다.",
+    )
+
+
+_MINUTES_RULES = (
+    "문장 앞에 '안건:', '주제:', '내용:', '결과:' 같은 접두어를 붙이지 않는다. "
+    "문체는 자연스럽고 읽기 쉬운 한국어 회의록 문장으로 유지한다. "
+    "구어체, 반복 표현, 추임새는 제거하고 핵심 논의 흐름이 잘 드러나게 요약한다. "
+    "담당자, 일정, 결정사항, 후속 액션은 전사 원문에 분명히 있을 때만 자연스럽게 포함한다. "
+    "불명확한 이름, 직급, 일정, 결론은 추정해서 만들지 않는다. "
+)
+_MINUTES_FIELDS_GUIDE = (
+    "agenda는 회의에서 다룬 안건 목록이며, 각 원소는 짧은 제목형 문장으로 작성한다. "
+    "meeting_content는 agenda 각 항목을 순서에 맞춰 풀어쓴 세부 설명이어야 한다. "
+    "meeting_content의 각 원소는 여러 줄 문자열이어도 되며, 첫 줄은 안건 제목, "
+    "그 아래 줄들은 해당 안건에 대해 오간 논의 배경, 쟁점, 검토 내용, "
+    "의견 차이, 정리된 방향 등을 이해하기 쉽게 적는다. "
+    "meeting_result는 최종 결론이 있으면 정리하고, 없으면 합의된 방향이나 남은 논점을 요약한다. "
+    "필요하면 항목 수는 자유롭게 반환해도 된다."
+)
+_MINUTES_JSON_FORMAT = (
+    "너는 회의록 정리 비서다. 반드시 한국어로 응답한다. "
+    "JSON 객체만 반환하고, 키는 agenda, meeting_content, meeting_result 3개만 사용한다. "
+    "각 값은 문자열 배열이다. "
+)
+MINUTES_SYSTEM_INSTRUCTION = (
+    _MINUTES_JSON_FORMAT + _MINUTES_RULES + "이미 사용자 작성본과 의미가 겹치는 내용은 제외한다. "
+    "새로운 정보만 반환한다. " + _MINUTES_FIELDS_GUIDE
+)
+MINUTES_SECTION_SYSTEM_INSTRUCTION = (
+    _MINUTES_JSON_FORMAT + "입력은 긴 회의 전사의 한 구간이다. 이 구간에서 다룬 내용만 빠짐없이 정리하고, "
+    "구간 밖의 내용은 추측하지 않는다. " + _MINUTES_RULES + _MINUTES_FIELDS_GUIDE
+)
+MINUTES_MERGE_SYSTEM_INSTRUCTION = (
+    _MINUTES_JSON_FORMAT + "입력은 한 회의를 시간 순서대로 나눈 구간별 회의록 초안이다. "
+    "이를 하나의 회의록으로 합치고, 여러 구간에 걸친 같은 안건은 하나로 묶어 시간 순서를 유지한다. "
+    "구간 초안에 없는 내용은 만들지 않는다. " + _MINUTES_RULES + "이미 사용자 작성본과 의미가 겹치는 내용은 제외한다. "
+    "새로운 정보만 반환한다. " + _MINUTES_FIELDS_GUIDE
+)
+_SPEAKER_TURN_PATTERN = re.compile(r"^\s*speaker\d+\s*:", re.IGNORECASE)
+
+
+@dataclass
+class _MinutesJsonResult:
+    parsed: dict[str, object]
+    input_tokens: Decimal
+    output_tokens: Decimal
+
+
+@dataclass
+class _MinutesJsonFailure:
+    error: DomainError
+    input_tokens: Decimal = Decimal("0")
+    output_tokens: Decimal = Decimal("0")
+
+
+@dataclass
+class _MinutesRequest:
+    system_instruction: str
+    user_prompt: str
+    # 긴 전사를 구간별로 먼저 요약했다면 그 호출들의 결과(비용 합산용)
+    prior_results: list[_MinutesJsonResult]
+
+
+def _split_transcript_turns(transcript: str) -> list[str]:
+    turns: list[str] = []
+    for line in transcript.splitlines():
+        if not line.strip():
+            continue
+        if turns and not _SPEAKER_TURN_PATTERN.match(line):
+            # 화자 표시가 없는 줄은 앞 발화에 이어 붙인다.
+            turns[-1] = f"{turns[-1]}\n{line}"
+            continue
+        turns.append(line)
+    return turns
+
+
+def _split_transcript_sections(transcript: str, max_chars: int) -> list[str]:
+    # 발화 중간에서 끊지 않도록 화자가 바뀌는 줄 단위로 max_chars 안에서 묶는다.
+    max_chars = max(1, max_chars)
+    sections: list[str] = []
+    current: list[str] = []
+    current_size = 0
+    for turn in _split_transcript_turns(transcript):
+        pieces = [turn[start : start + max_chars] for start in range(0, len(turn), max_chars)]
+        for piece in pieces:
+            if current and current_size + 1 + len(piece) > max_chars:
+                sections.append("\n".join(current))
+                current = []
+                current_size = 0
+            current.append(piece)
+            current_size += len(piece) + (1 if current_size else 0)
+    if current:
+        sections.append("\n".join(current))
+    return sections
+
+
+def _existing_minutes_prompt(
     existing_agenda: str,
     existing_meeting_content: str,
     existing_meeting_result: str,
-) -> MinutesSuggestionResult | DomainError:
-    missing_key = _require_api_key()
-    if missing_key is not None:
-        return missing_key
-
-    if not transcript.strip():
-        return DomainError(code="INVALID_ARGUMENT", message="전사 텍스트가 비어있습니다.")
-
-    system_instruction = (
-        "너는 회의록 정리 비서다. 반드시 한국어로 응답한다. "
-        "JSON 객체만 반환하고, 키는 agenda, meeting_content, meeting_result 3개만 사용한다. "
-        "각 값은 문자열 배열이다. "
-        "문장 앞에 '안건:', '주제:', '내용:', '결과:' 같은 접두어를 붙이지 않는다. "
-        "문체는 자연스럽고 읽기 쉬운 한국어 회의록 문장으로 유지한다. "
-        "구어체, 반복 표현, 추임새는 제거하고 핵심 논의 흐름이 잘 드러나게 요약한다. "
-        "담당자, 일정, 결정사항, 후속 액션은 전사 원문에 분명히 있을 때만 자연스럽게 포함한다. "
-        "불명확한 이름, 직급, 일정, 결론은 추정해서 만들지 않는다. "
-        "이미 사용자 작성본과 의미가 겹치는 내용은 제외한다. "
-        "새로운 정보만 반환한다. "
-        "agenda는 회의에서 다룬 안건 목록이며, 각 원소는 짧은 제목형 문장으로 작성한다. "
-        "meeting_content는 agenda 각 항목을 순서에 맞춰 풀어쓴 세부 설명이어야 한다. "
-        "meeting_content의 각 원소는 여러 줄 문자열이어도 되며, 첫 줄은 안건 제목, "
-        "그 아래 줄들은 해당 안건에 대해 오간 논의 배경, 쟁점, 검토 내용, "
-        "의견 차이, 정리된 방향 등을 이해하기 쉽게 적는다. "
-        "meeting_result는 최종 결론이 있으면 정리하고, 없으면 합의된 방향이나 남은 논점을 요약한다. "
-        "필요하면 항목 수는 자유롭게 반환해도 된다."
-    )
-    user_prompt = (
+) -> str:
+    return (
         "[기존 주요 안건]\n"
         f"{existing_agenda}\n\n"
         "[기존 회의 내용]\n"
         f"{existing_meeting_content}\n\n"
         "[기존 회의 결과]\n"
         f"{existing_meeting_result}\n\n"
-        "[전사 원문]\n"
-        f"{transcript}\n\n"
-        "위 정보를 바탕으로 JSON만 반환하라."
     )
 
+
+def _invalid_minutes_json_error() -> DomainError:
+    return DomainError(
+        code="INVALID_ARGUMENT",
+        message="회의록 생성에 실패했습니다: 모델 응답 형식이 올바른 JSON 객체가 아닙니다.",
+    )
+
+
+async def _request_minutes_json(
+    system_instruction: str,
+    user_prompt: str,
+) -> _MinutesJsonResult | _MinutesJsonFailure:
     try:
-        gateway_result = suggest_minutes_json(system_instruction=system_instruction, user_prompt=user_prompt)
+        gateway_result = await suggest_minutes_json(system_instruction=system_instruction, user_prompt=user_prompt)
     except Exception as exc:
-        return DomainError(code="INVALID_ARGUMENT", message=f"회의록 생성에 실패했습니다: {exc}")
+        return _MinutesJsonFailure(DomainError(code="INVALID_ARGUMENT", message=f"회의록 생성에 실패했습니다: {exc}"))
 
+    # 응답을 받은 뒤의 실패는 이미 쓴 토큰을 함께 돌려준다.
+    input_tokens, output_tokens = _extract_usage_tokens(gateway_result.usage)
     if _is_non_object_json(gateway_result.content):
-        return DomainError(
-            code="INVALID_ARGUMENT",
-            message="회의록 생성에 실패했습니다: 모델 응답 형식이 올바른 JSON 객체가 아닙니다.",
-        )
+        return _MinutesJsonFailure(_invalid_minutes_json_error(), input_tokens, output_tokens)
 
     parsed = _parse_minutes_json(gateway_result.content)
-    repaired_usage = None
     if parsed is None:
         try:
-            repaired = repair_minutes_json(gateway_result.content)
-            parsed = _parse_minutes_json(repaired.content)
-            repaired_usage = repaired.usage
+            repaired = await repair_minutes_json(gateway_result.content)
         except Exception as exc:
-            return DomainError(code="INVALID_ARGUMENT", message=f"회의록 생성에 실패했습니다: {exc}")
+            return _MinutesJsonFailure(
+                DomainError(code="INVALID_ARGUMENT", message=f"회의록 생성에 실패했습니다: {exc}"),
+                input_tokens,
+                output_tokens,
+            )
+        repaired_input_tokens, repaired_output_tokens = _extract_usage_tokens(repaired.usage)
+        input_tokens += repaired_input_tokens
+        output_tokens += repaired_output_tokens
+        parsed = _parse_minutes_json(repaired.content)
 
     if not isinstance(parsed, dict):
-        return DomainError(
-            code="INVALID_ARGUMENT",
-            message="회의록 생성에 실패했습니다: 모델 응답 형식이 올바른 JSON 객체가 아닙니다.",
+        return _MinutesJsonFailure(_invalid_minutes_json_error(), input_tokens, output_tokens)
+    return _MinutesJsonResult(parsed=parsed, input_tokens=input_tokens, output_tokens=output_tokens)
+
+
+async def _summarize_transcript_sections(sections: list[str]) -> list[_MinutesJsonResult] | _MinutesJsonFailure:
+    semaphore = asyncio.Semaphore(max(1, AI_SUMMARY_MAX_CONCURRENCY))
+
+    async def summarize(index: int, section: str) -> _MinutesJsonResult | _MinutesJsonFailure:
+        user_prompt = f"[전사 원문 {index}/{len(sections)} 구간]\n{section}\n\n위 구간 내용을 JSON만 반환하라."
+        async with semaphore:
+            return await _request_minutes_json(MINUTES_SECTION_SYSTEM_INSTRUCTION, user_prompt)
+
+    section_results = await asyncio.gather(
+        *(summarize(index, section) for index, section in enumerate(sections, start=1))
+    )
+    summaries = [result for result in section_results if isinstance(result, _MinutesJsonResult)]
+    failures = [result for result in section_results if isinstance(result, _MinutesJsonFailure)]
+    if failures:
+        # 한 구간이라도 실패하면 전체를 실패로 보되, 끝난 구간 호출들의 토큰은 모두 넘겨 정산하게 한다.
+        return _MinutesJsonFailure(
+            failures[0].error,
+            sum((result.input_tokens for result in section_results), Decimal("0")),
+            sum((result.output_tokens for result in section_results), Decimal("0")),
         )
+    return summaries
 
-    agenda = _sanitize_items(parsed.get("agenda"))
-    meeting_content = _sanitize_items(parsed.get("meeting_content"))
-    meeting_result = _sanitize_items(parsed.get("meeting_result"))
-    input_tokens, output_tokens = _extract_usage_tokens(gateway_result.usage)
-    if repaired_usage is not None:
-        repaired_input_tokens, repaired_output_tokens = _extract_usage_tokens(repaired_usage)
-        input_tokens += repaired_input_tokens
-        output_tokens += repaired_output_tokens
-    usd_cost = _calc_usd_cost(
+
+async def _prepare_minutes_request(
+    transcript: str,
+    existing_agenda: str,
+    existing_meeting_content: str,
+    existing_meeting_result: str,
+) -> _MinutesRequest | _MinutesJsonFailure:
+    missing_key = _require_api_key()
+    if missing_key is not None:
+        return _MinutesJsonFailure(missing_key)
+
+    if not transcript.strip():
+        return _MinutesJsonFailure(DomainError(code="INVALID_ARGUMENT", message="전사 텍스트가 비어있습니다."))
+
+    existing_prompt = _existing_minutes_prompt(existing_agenda, existing_meeting_content, existing_meeting_result)
+    sections = _split_transcript_sections(transcript, AI_SUMMARY_CHUNK_CHARS)
+    if len(sections) <= 1:
+        return _MinutesRequest(
+            system_instruction=MINUTES_SYSTEM_INSTRUCTION,
+            user_prompt=existing_prompt + f"[전사 원문]\n{transcript}\n\n위 정보를 바탕으로 JSON만 반환하라.",
+            prior_results=[],
+        )
+
+    # 긴 회의는 구간별로 나눠 동시에 요약한 뒤(map-reduce), 구간 초안들을 기존 작성본과 함께 한 번 더 합친다.
+    summaries = await _summarize_transcript_sections(sections)
+    if isinstance(summaries, _MinutesJsonFailure):
+        return summaries
+    drafts = [
+        {
+            "section": index,
+            "agenda": _sanitize_items(summary.parsed.get("agenda")),
+            "meeting_content": _sanitize_items(summary.parsed.get("meeting_content")),
+            "meeting_result": _sanitize_items(summary.parsed.get("meeting_result")),
+        }
+        for index, summary in enumerate(summaries, start=1)
+    ]
+    return _MinutesRequest(
+        system_instruction=MINUTES_MERGE_SYSTEM_INSTRUCTION,
+        user_prompt=(
+            existing_prompt
+            + "[구간별 회의록 초안]\n"
+            + json.dumps(drafts, ensure_ascii=False)
+            + "\n\n위 정보를 바탕으로 JSON만 반환하라."
+        ),
+        prior_results=summaries,
+    )
+
+
+def _minutes_usd_cost(input_tokens: Decimal, output_tokens: Decimal) -> Decimal:
+    return _calc_usd_cost(
         input_tokens=input_tokens,
         output_tokens=output_tokens,
         input_price=GPT5_NANO_INPUT_PER_1M,
         output_price=GPT5_NANO_OUTPUT_PER_1M,
     )
+
+
+def _minutes_failure(
+    error: DomainError,
+    input_tokens: Decimal,
+    output_tokens: Decimal,
+    prior_results: list[_MinutesJsonResult],
+) -> MinutesSuggestionFailure:
+    for result in prior_results:
+        input_tokens += result.input_tokens
+        output_tokens += result.output_tokens
+    return MinutesSuggestionFailure(error=error, usd_cost=_minutes_usd_cost(input_tokens, output_tokens))
+
+
+async def suggest_minutes_bullets(
+    transcript: str,
+    existing_agenda: str,
+    existing_meeting_content: str,
+    existing_meeting_result: str,
+) -> MinutesSuggestionResult | MinutesSuggestionFailure:
+    prepared = await _prepare_minutes_request(
+        transcript,
+        existing_agenda,
+        existing_meeting_content,
+        existing_meeting_result,
+    )
+    if isinstance(prepared, _MinutesJsonFailure):
+        return _minutes_failure(prepared.error, prepared.input_tokens, prepared.output_tokens, [])
+    final = await _request_minutes_json(prepared.system_instruction, prepared.user_prompt)
+    if isinstance(final, _MinutesJsonFailure):
+        return _minutes_failure(final.error, final.input_tokens, final.output_tokens, prepared.prior_results)
+
+    results = [*prepared.prior_results, final]
     return MinutesSuggestionResult(
-        agenda=agenda,
-        meeting_content=meeting_content,
-        meeting_result=meeting_result,
-        usd_cost=usd_cost,
+        agenda=_sanitize_items(final.parsed.get("agenda")),
+        meeting_content=_sanitize_items(final.parsed.get("meeting_content")),
+        meeting_result=_sanitize_items(final.parsed.get("meeting_result")),
+        usd_cost=_minutes_usd_cost(
+            sum((result.input_tokens for result in results), Decimal("0")),
+            sum((result.output_tokens for result in results), Decimal("0")),
+        ),
+    )
+
+
+class _MinutesItemStreamParser:
+    # 받는 중인 {"agenda": [...], ...} 응답에서 배열 항목 문자열이 닫히는 대로 (키, 항목)을 꺼낸다.
+    def __init__(self) -> None:
+        self._depth = 0
+        self._key: str | None = None
+        self._in_string = False
+        self._escaped = False
+        self._string: list[str] = []
+
+    def feed(self, content: str) -> list[tuple[str, str]]:
+        items: list[tuple[str, str]] = []
+        for char in content:
+            if not self._in_string:
+                if char == '"':
+                    self._in_string = True
+                    self._string = []
+                elif char in "{[":
+                    self._depth += 1
+                elif char in "}]":
+                    self._depth -= 1
+                continue
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+                item = self._finish_string()
+                if item is not None:
+                    items.append(item)
+                continue
+            self._string.append(char)
+        return items
+
+    def _finish_string(self) -> tuple[str, str] | None:
+        try:
+            value = json.loads('"' + "".join(self._string) + '"')
+        except ValueError:
+            return None
+        if self._depth == 1:
+            self._key = value
+            return None
+        if self._depth == 2 and self._key in MINUTES_SUGGESTION_SECTIONS:
+            return self._key, value
+        return None
+
+
+def _accept_minutes_item(
+    accepted: dict[str, list[str]],
+    section: str,
+    value: object,
+) -> MinutesSuggestionItem | None:
+    # _sanitize_items와 같은 기준으로 빈 항목과 중복 항목을 거른다.
+    if not isinstance(value, str):
+        return None
+    normalized = value.strip()
+    if not normalized:
+        return None
+    if normalized.lower() in {item.lower() for item in accepted[section]}:
+        return None
+    accepted[section].append(normalized)
+    return MinutesSuggestionItem(section=section, text=normalized)
+
+
+class MinutesUsageMeter:
+    # 스트리밍 도중 끊겨도 그때까지 쓴 비용을 정산할 수 있게, 끝난 호출의 토큰을 바로바로 더해 둔다.
+    # 사용량이 아직 오지 않은 스트리밍 호출은 받은 조각 하나를 출력 토큰 하나로 센다(입력 토큰은 알 수 없어 빠진다).
+    def __init__(self) -> None:
+        self._input_tokens = Decimal("0")
+        self._output_tokens = Decimal("0")
+        self._streamed_chunks = 0
+
+    @property
+    def usd_cost(self) -> Decimal:
+        return _minutes_usd_cost(self._input_tokens, self._output_tokens + self._streamed_chunks)
+
+    def add_tokens(self, input_tokens: Decimal, output_tokens: Decimal) -> None:
+        self._input_tokens += input_tokens
+        self._output_tokens += output_tokens
+
+    def add_streamed_chunk(self) -> None:
+        self._streamed_chunks += 1
+
+    def add_stream_usage(self, usage: object) -> None:
+        # 실제 사용량이 오면 조각 수로 센 추정치를 대신한다.
+        self._streamed_chunks = 0
+        self.add_tokens(*_extract_usage_tokens(usage))
+
+
+async def stream_minutes_suggestion(
+    transcript: str,
+    existing_agenda: str,
+    existing_meeting_content: str,
+    existing_meeting_result: str,
+    usage_meter: MinutesUsageMeter | None = None,
+) -> AsyncIterator[MinutesSuggestionItem | MinutesSuggestionResult | MinutesSuggestionFailure]:
+    # 항목을 파싱되는 대로 먼저 내보내고, 마지막에 전체 결과와 합산 비용을 한 번 내보낸다.
+    # 실패도 그때까지 쓴 비용을 담아 한 번 내보낸다. 중간에 끊기면 usage_meter에 쌓인 비용으로 정산한다.
+    meter = usage_meter if usage_meter is not None else MinutesUsageMeter()
+    prepared = await _prepare_minutes_request(
+        transcript,
+        existing_agenda,
+        existing_meeting_content,
+        existing_meeting_result,
+    )
+    if isinstance(prepared, _MinutesJsonFailure):
+        meter.add_tokens(prepared.input_tokens, prepared.output_tokens)
+        yield MinutesSuggestionFailure(error=prepared.error, usd_cost=meter.usd_cost)
+        return
+    for result in prepared.prior_results:
+        meter.add_tokens(result.input_tokens, result.output_tokens)
+
+    parser = _MinutesItemStreamParser()
+    accepted: dict[str, list[str]] = {section: [] for section in MINUTES_SUGGESTION_SECTIONS}
+    content_parts: list[str] = []
+    try:
+        async for chunk in stream_minutes_json(prepared.system_instruction, prepared.user_prompt):
+            if chunk.content:
+                meter.add_streamed_chunk()
+            if chunk.usage is not None:
+                meter.add_stream_usage(chunk.usage)
+            if not chunk.content:
+                continue
+            content_parts.append(chunk.content)
+            for section, value in parser.feed(chunk.content):
+                item = _accept_minutes_item(accepted, section, value)
+                if item is not None:
+                    yield item
+    except Exception as exc:
+        yield MinutesSuggestionFailure(
+            error=DomainError(code="INVALID_ARGUMENT", message=f"회의록 생성에 실패했습니다: {exc}"),
+            usd_cost=meter.usd_cost,
+        )
+        return
+
+    content = "".join(content_parts)
+    if not any(accepted.values()) and _parse_minutes_json(content) is None:
+        # 형식이 깨진 응답은 스트리밍으로 건질 항목이 없으므로 비스트리밍과 같이 복구를 시도한다.
+        if _is_non_object_json(content):
+            yield MinutesSuggestionFailure(error=_invalid_minutes_json_error(), usd_cost=meter.usd_cost)
+            return
+        try:
+            repaired = await repair_minutes_json(content)
+        except Exception as exc:
+            yield MinutesSuggestionFailure(
+                error=DomainError(code="INVALID_ARGUMENT", message=f"회의록 생성에 실패했습니다: {exc}"),
+                usd_cost=meter.usd_cost,
+            )
+            return
+        meter.add_tokens(*_extract_usage_tokens(repaired.usage))
+        parsed = _parse_minutes_json(repaired.content)
+        if parsed is None:
+            yield MinutesSuggestionFailure(error=_invalid_minutes_json_error(), usd_cost=meter.usd_cost)
+            return
+        for section in MINUTES_SUGGESTION_SECTIONS:
+            values = parsed.get(section)
+            for value in values if isinstance(values, list) else []:
+                item = _accept_minutes_item(accepted, section, value)
+                if item is not None:
+                    yield item
+
+    yield MinutesSuggestionResult(
+        agenda=accepted["agenda"],
+        meeting_content=accepted["meeting_content"],
+        meeting_result=accepted["meeting_result"],
+        usd_cost=meter.usd_cost,
     )
@@ -0,0 +1,64 @@
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.settings import AI_USAGE_ROLLUP_BATCH_SIZE, AI_USAGE_ROLLUP_INTERVAL_SECONDS
+from app.service.ai_quota_service import ai_usage_cache, rollup_ai_usage_ledger
+
+logger = logging.getLogger(__name__)
+
+
+class AiUsageRollup:
+    # AI 호출마다 합계 행을 잠그지 않도록, 원장에 쌓인 사용량을 주기적으로 한 번에 합계 행에 옮긴다.
+    def __init__(
+        self,
+        interval_seconds: int = AI_USAGE_ROLLUP_INTERVAL_SECONDS,
+        batch_size: int = AI_USAGE_ROLLUP_BATCH_SIZE,
+    ) -> None:
+        self.interval_seconds = interval_seconds
+        self.batch_size = max(1, batch_size)
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+        # 다른 DB를 가리킬 수 있으므로 이전에 읽어 둔 사용량은 버린다.
+        ai_usage_cache.clear()
+        if self.interval_seconds <= 0:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task = self._task
+        self._task = None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def rollup_once(self) -> int:
+        if self._session_factory is None:
+            return 0
+        rolled_up = 0
+        while True:
+            async with self._session_factory() as db:
+                count = await rollup_ai_usage_ledger(db, self.batch_size)
+            rolled_up += count
+            if count < self.batch_size:
+                return rolled_up
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.rollup_once()
+            except Exception as exc:
+                logger.warning("ai usage rollup failed error=%s", exc)
+
+
+ai_usage_rollup = AiUsageRollup()
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.infra.slow_query_log import slow_query_log
+from app.service.admin_service import is_admin_user
+from app.service.auth_service import AuthUser
+from app.service.domain import DomainError
+
+
+@dataclass(frozen=True, slots=True)
+class SlowQueryItem:
+    recorded_at: datetime
+    route: str | None
+    statement: str
+    parameters: list[str]
+    duration_ms: float
+    explain_plan: str | None
+
+
+def list_slow_queries_by_admin(auth_user: AuthUser) -> list[SlowQueryItem] | DomainError:
+    if not is_admin_user(auth_user):
+        return DomainError(code="FORBIDDEN", message="관리자만 슬로우 쿼리 기록을 조회할 수 있습니다.")
+
+    return [
+        SlowQueryItem(
+            recorded_at=entry.recorded_at,
+            route=entry.route,
+            statement=entry.statement,
+            parameters=list(entry.parameters),
+            duration_ms=entry.duration_ms,
+            explain_plan=entry.explain_plan,
+        )
+        for entry in slow_query_log.entries()
+    ]
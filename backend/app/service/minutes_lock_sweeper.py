@@ -0,0 +1,59 @@
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.settings import MINUTES_LOCK_SWEEP_INTERVAL_SECONDS
+from app.service.minutes_room_service import minutes_room_hub
+from app.service.reservation_service import archive_idle_minutes_live_states, sweep_expired_minutes_locks
+
+logger = logging.getLogger(__name__)
+
+
+class MinutesLockSweeper:
+    # 조회 요청이 만료 잠금을 지우지 않도록, 주기적으로 한 번에 정리한다.
+    def __init__(self, interval_seconds: int = MINUTES_LOCK_SWEEP_INTERVAL_SECONDS) -> None:
+        self.interval_seconds = interval_seconds
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+        if self.interval_seconds <= 0:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task = self._task
+        self._task = None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def sweep_once(self) -> list[str]:
+        if self._session_factory is None:
+            return []
+        async with self._session_factory() as db:
+            reservation_ids = await sweep_expired_minutes_locks(db)
+            # 잠금이 만료돼 녹음이 꺼진 전사도 보관 테이블로 옮긴다.
+            await archive_idle_minutes_live_states(db)
+        # 회의록 화면에는 잠금 해제로 알리고, 클라이언트가 최신 상태를 다시 읽는다.
+        for reservation_id in reservation_ids:
+            minutes_room_hub.broadcast(reservation_id, {"type": "lock", "lock": None})
+        return reservation_ids
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.sweep_once()
+            except Exception as exc:
+                logger.warning("minutes lock sweep failed error=%s", exc)
+
+
+minutes_lock_sweeper = MinutesLockSweeper()
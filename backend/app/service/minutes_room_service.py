@@ -0,0 +1,378 @@
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Protocol
+from uuid import uuid4
+
+from app.core.settings import DATABASE_URL, RESERVATION_EVENT_BACKEND
+from app.infra.db import engine
+from app.infra.pg_notify import PgNotifyChannel
+
+MINUTES_ROOM_MAX_PENDING = 100
+MINUTES_ROOM_HEARTBEAT_SECONDS = 25.0
+MINUTES_ROOM_CHANNEL = "roombook_minutes_room"
+# NOTIFY payload 한도(8000바이트)보다 조금 작게 잡는다.
+MINUTES_ROOM_NOTIFY_MAX_BYTES = 7500
+
+logger = logging.getLogger(__name__)
+
+MinutesRoomMessage = dict[str, Any]
+
+# 구독자(SSE 뷰어)를 깨워 keep-alive를 보내게 하는 신호. 다른 워커로는 보내지 않는다.
+MINUTES_ROOM_HEARTBEAT: MinutesRoomMessage = {"type": "heartbeat"}
+
+
+@dataclass(frozen=True, slots=True)
+class MinutesRoomMember:
+    connection_id: str
+    user_id: str
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class _RemoteMembers:
+    members: list[MinutesRoomMember]
+    # 그 워커의 presence를 마지막으로 받은 시각(monotonic)
+    seen_at: float
+
+
+class MinutesRoomConnection:
+    # 연결별 송신 큐. 브로드캐스트가 느린 연결 하나 때문에 막히지 않게 한다.
+    def __init__(self, reservation_id: str, member: MinutesRoomMember, max_pending: int) -> None:
+        self.reservation_id = reservation_id
+        self.member = member
+        # 이 연결로 잠금을 잡았는지. HTTP로 잡은 잠금은 연결이 끊겨도 풀지 않고 TTL에 맡긴다.
+        self.holds_lock = False
+        self._queue: asyncio.Queue[MinutesRoomMessage | None] = asyncio.Queue(maxsize=max(1, max_pending))
+
+    def push(self, message: MinutesRoomMessage) -> None:
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # 너무 밀린 연결은 끊고, 재접속할 때 스냅샷을 다시 받게 한다.
+            self.close()
+
+    async def get(self) -> MinutesRoomMessage | None:
+        return await self._queue.get()
+
+    def heartbeat(self) -> None:
+        # 보낼 메시지가 밀려 있으면 그 전송이 keep-alive를 대신한다.
+        if self._queue.empty():
+            self._queue.put_nowait(MINUTES_ROOM_HEARTBEAT)
+
+    def close(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+
+class MinutesRoomChannel(Protocol):
+    async def notify(self, payload: str) -> None: ...
+
+    async def start(
+        self,
+        handler: Callable[[str], Awaitable[None]],
+        on_listen: Callable[[], Awaitable[None]] | None = None,
+    ) -> None: ...
+
+    async def stop(self) -> None: ...
+
+
+class MinutesRoomHub:
+    # 예약별 회의록 협업 방. 프로세스 안의 WebSocket 연결만 관리한다.
+    def __init__(
+        self,
+        max_pending: int = MINUTES_ROOM_MAX_PENDING,
+        heartbeat_seconds: float = MINUTES_ROOM_HEARTBEAT_SECONDS,
+    ) -> None:
+        self.max_pending = max_pending
+        self._heartbeat_seconds = heartbeat_seconds
+        self._heartbeat_task: asyncio.Task[None] | None = None
+        self._rooms: defaultdict[str, dict[str, MinutesRoomConnection]] = defaultdict(dict)
+        # 접속자 목록/잠금 자동 해제에는 끼지 않고 메시지만 받는 구독자 (SSE 뷰어)
+        self._listeners: defaultdict[str, dict[str, MinutesRoomConnection]] = defaultdict(dict)
+
+    async def start(self) -> None:
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._send_heartbeats())
+
+    async def stop(self) -> None:
+        task = self._heartbeat_task
+        self._heartbeat_task = None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def join(self, reservation_id: str, user_id: str, name: str) -> MinutesRoomConnection:
+        member = MinutesRoomMember(connection_id=uuid4().hex, user_id=user_id, name=name)
+        connection = MinutesRoomConnection(reservation_id, member, self.max_pending)
+        self._rooms[reservation_id][member.connection_id] = connection
+        return connection
+
+    def subscribe(self, reservation_id: str, user_id: str, name: str) -> MinutesRoomConnection:
+        member = MinutesRoomMember(connection_id=uuid4().hex, user_id=user_id, name=name)
+        connection = MinutesRoomConnection(reservation_id, member, self.max_pending)
+        self._listeners[reservation_id][member.connection_id] = connection
+        return connection
+
+    def leave(self, connection: MinutesRoomConnection) -> None:
+        for connections in (self._rooms, self._listeners):
+            room = connections.get(connection.reservation_id)
+            if room is None:
+                continue
+            room.pop(connection.member.connection_id, None)
+            if not room:
+                del connections[connection.reservation_id]
+
+    def members(self, reservation_id: str) -> list[MinutesRoomMember]:
+        return self.local_members(reservation_id)
+
+    def local_members(self, reservation_id: str) -> list[MinutesRoomMember]:
+        room = self._rooms.get(reservation_id)
+        if room is None:
+            return []
+        return [connection.member for connection in room.values()]
+
+    def is_user_connected(self, reservation_id: str, user_id: str) -> bool:
+        return any(member.user_id == user_id for member in self.members(reservation_id))
+
+    def broadcast(self, reservation_id: str, message: MinutesRoomMessage) -> None:
+        self._deliver(reservation_id, message)
+
+    def broadcast_presence(self, reservation_id: str) -> None:
+        self.broadcast(reservation_id, presence_message(self.members(reservation_id)))
+
+    def _deliver(self, reservation_id: str, message: MinutesRoomMessage) -> None:
+        for connections in (self._rooms, self._listeners):
+            room = connections.get(reservation_id)
+            if room is None:
+                continue
+            for connection in list(room.values()):
+                connection.push(message)
+
+    async def _send_heartbeats(self) -> None:
+        # 연결마다 타이머를 두지 않고 하나의 태스크가 모든 구독자를 주기적으로 깨운다.
+        # keep-alive 전송이 실패하면 끊긴 연결이 정리된다.
+        while True:
+            await asyncio.sleep(self._heartbeat_seconds)
+            self._on_heartbeat()
+
+    def _on_heartbeat(self) -> None:
+        for room in list(self._listeners.values()):
+            for connection in list(room.values()):
+                connection.heartbeat()
+
+    def _close_room(self, reservation_id: str) -> None:
+        # 연결을 닫아 클라이언트가 재접속해 스냅샷을 다시 받게 한다.
+        for connections in (self._rooms, self._listeners):
+            room = connections.get(reservation_id)
+            if room is None:
+                continue
+            for connection in list(room.values()):
+                connection.close()
+
+
+class PgNotifyMinutesRoomHub(MinutesRoomHub):
+    # 여러 워커가 같은 DB를 바라볼 때 방 메시지를 pg_notify로 공유한다.
+    # 발행은 NOTIFY만 하고, 로컬 연결 전달은 프로세스당 하나인 LISTEN 연결이 맡는다.
+    def __init__(
+        self,
+        channel: MinutesRoomChannel,
+        max_pending: int = MINUTES_ROOM_MAX_PENDING,
+        max_payload_bytes: int = MINUTES_ROOM_NOTIFY_MAX_BYTES,
+        heartbeat_seconds: float = MINUTES_ROOM_HEARTBEAT_SECONDS,
+    ) -> None:
+        super().__init__(max_pending, heartbeat_seconds)
+        self._channel = channel
+        self._max_payload_bytes = max_payload_bytes
+        self._worker_id = uuid4().hex
+        # 예약 ID -> 워커 ID -> 그 워커의 접속자. 워커는 하트비트마다 자기 접속자를 다시 알리고,
+        # 하트비트 세 번 동안 소식이 없는 워커(종료, 재시작, 놓친 NOTIFY)의 접속자는 지운다.
+        self._remote_members: defaultdict[str, dict[str, _RemoteMembers]] = defaultdict(dict)
+        self._remote_ttl_seconds = heartbeat_seconds * 3
+        # 브로드캐스트 순서를 지키도록 NOTIFY는 태스크 하나가 차례로 보낸다.
+        self._outbox: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._sender_task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        await super().start()
+        await self._channel.start(self._on_payload, self._on_listen)
+        if self._sender_task is None or self._sender_task.done():
+            self._sender_task = asyncio.create_task(self._send_forever())
+
+    async def stop(self) -> None:
+        task = self._sender_task
+        self._sender_task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self._channel.stop()
+        await super().stop()
+
+    def members(self, reservation_id: str) -> list[MinutesRoomMember]:
+        remote = [member for entry in self._remote_members.get(reservation_id, {}).values() for member in entry.members]
+        return self.local_members(reservation_id) + remote
+
+    def broadcast(self, reservation_id: str, message: MinutesRoomMessage) -> None:
+        self._publish({"kind": "message", "reservation_id": reservation_id, "message": message})
+
+    def broadcast_presence(self, reservation_id: str) -> None:
+        # 워커마다 자기 접속자만 알리고, 받은 쪽이 합쳐서 보여준다.
+        self._publish(self._presence_envelope(reservation_id, reply=True))
+
+    def _presence_envelope(self, reservation_id: str, reply: bool, refresh: bool = False) -> dict[str, Any]:
+        members = [
+            {"connection_id": member.connection_id, "user_id": member.user_id, "name": member.name}
+            for member in self.local_members(reservation_id)
+        ]
+        return {
+            "kind": "presence",
+            "reservation_id": reservation_id,
+            "members": members,
+            "reply": reply,
+            # 하트비트로 다시 알리는 presence. 접속자 목록이 바뀌지 않았으면 클라이언트에 보내지 않는다.
+            "refresh": refresh,
+        }
+
+    def _on_heartbeat(self) -> None:
+        super()._on_heartbeat()
+        for reservation_id in list(self._rooms):
+            self._publish(self._presence_envelope(reservation_id, reply=False, refresh=True))
+        deadline = time.monotonic() - self._remote_ttl_seconds
+        for reservation_id, workers in list(self._remote_members.items()):
+            stale = [worker_id for worker_id, entry in workers.items() if entry.seen_at < deadline]
+            if not stale:
+                continue
+            for worker_id in stale:
+                del workers[worker_id]
+            if not workers:
+                del self._remote_members[reservation_id]
+            self._deliver(reservation_id, presence_message(self.members(reservation_id)))
+
+    async def _on_listen(self) -> None:
+        # LISTEN이 끊긴 동안 다른 워커의 입장/퇴장을 놓쳤을 수 있으므로 기억한 목록을 버리고 다시 묻는다.
+        self._remote_members.clear()
+        for reservation_id in list(self._rooms):
+            self._publish(self._presence_envelope(reservation_id, reply=True))
+
+    def _publish(self, envelope: dict[str, Any]) -> None:
+        envelope["worker_id"] = self._worker_id
+        if self._sender_task is None or self._sender_task.done():
+            self._apply(envelope)
+            return
+        self._outbox.put_nowait(envelope)
+
+    async def _send_forever(self) -> None:
+        while True:
+            envelope = await self._outbox.get()
+            payload = json.dumps(envelope, ensure_ascii=False)
+            if len(payload.encode()) > self._max_payload_bytes:
+                # 한도를 넘는 메시지(긴 전사 등)는 이 워커에만 보내고,
+                # 다른 워커에는 방 연결을 닫게 해 재접속 스냅샷으로 맞춘다.
+                self._apply(envelope)
+                if envelope["kind"] == "message":
+                    envelope = {"kind": "resync", "reservation_id": envelope["reservation_id"]}
+                    envelope["worker_id"] = self._worker_id
+                    payload = json.dumps(envelope)
+                else:
+                    continue
+            try:
+                await self._channel.notify(payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("minutes room notify failed, delivering locally only error=%s", exc)
+                if envelope["kind"] != "resync":
+                    self._apply(envelope)
+
+    async def _on_payload(self, payload: str) -> None:
+        envelope = decode_minutes_room_envelope(payload)
+        if envelope is None:
+            logger.warning("ignored malformed minutes room payload=%s", payload)
+            return
+        self._apply(envelope)
+
+    def _apply(self, envelope: dict[str, Any]) -> None:
+        reservation_id = envelope["reservation_id"]
+        remote = envelope["worker_id"] != self._worker_id
+        if envelope["kind"] == "message":
+            self._deliver(reservation_id, envelope["message"])
+        elif envelope["kind"] == "resync":
+            if remote:
+                self._close_room(reservation_id)
+        elif envelope["kind"] == "presence":
+            before = presence_message(self.members(reservation_id))
+            if remote:
+                self._remember_remote_members(reservation_id, envelope["worker_id"], envelope["members"])
+                # 새로 접속자가 생긴 워커는 아직 다른 워커의 접속자를 모르므로 한 번 답해준다.
+                if envelope["reply"] and reservation_id in self._rooms:
+                    self._publish(self._presence_envelope(reservation_id, reply=False))
+            after = presence_message(self.members(reservation_id))
+            if not envelope["refresh"] or after != before:
+                self._deliver(reservation_id, after)
+
+    def _remember_remote_members(self, reservation_id: str, worker_id: str, raw_members: list[Any]) -> None:
+        members = [
+            MinutesRoomMember(connection_id=item["connection_id"], user_id=item["user_id"], name=item["name"])
+            for item in raw_members
+            if isinstance(item, dict)
+        ]
+        workers = self._remote_members[reservation_id]
+        if members:
+            workers[worker_id] = _RemoteMembers(members=members, seen_at=time.monotonic())
+            return
+        workers.pop(worker_id, None)
+        if not workers:
+            del self._remote_members[reservation_id]
+
+
+def presence_message(members: list[MinutesRoomMember]) -> MinutesRoomMessage:
+    # 같은 사용자가 여러 탭으로 접속해도 한 번만 보여준다.
+    seen: dict[str, MinutesRoomMessage] = {}
+    for member in members:
+        seen.setdefault(member.user_id, {"user_id": member.user_id, "name": member.name})
+    return {"type": "presence", "members": list(seen.values())}
+
+
+def decode_minutes_room_envelope(payload: str) -> dict[str, Any] | None:
+    try:
+        envelope = json.loads(payload)
+    except ValueError:
+        return None
+    if not isinstance(envelope, dict):
+        return None
+    if not isinstance(envelope.get("worker_id"), str) or not isinstance(envelope.get("reservation_id"), str):
+        return None
+    kind = envelope.get("kind")
+    if kind == "message" and isinstance(envelope.get("message"), dict):
+        return envelope
+    if kind == "presence" and isinstance(envelope.get("members"), list):
+        envelope["reply"] = envelope.get("reply") is True
+        envelope["refresh"] = envelope.get("refresh") is True
+        return envelope
+    if kind == "resync":
+        return envelope
+    return None
+
+
+def _create_minutes_room_hub() -> MinutesRoomHub:
+    if RESERVATION_EVENT_BACKEND != "postgres":
+        return MinutesRoomHub()
+    return PgNotifyMinutesRoomHub(PgNotifyChannel(MINUTES_ROOM_CHANNEL, DATABASE_URL, engine))
+
+
+minutes_room_hub = _create_minutes_room_hub()
@@ -1,45 +1,414 @@
 import asyncio
-from dataclasses import dataclass
-from typing import Literal
+import json
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, fields, replace
+from datetime import datetime
+from typing import Literal, Protocol
+from uuid import uuid4
+
+from app.core.settings import (
+    DATABASE_URL,
+    RESERVATION_EVENT_BACKEND,
+    RESERVATION_EVENT_LOG_SIZE,
+    RESERVATION_EVENT_MAX_PENDING,
+)
+from app.infra.db import engine
+from app.infra.pg_notify import PgNotifyChannel
 
 ReservationEventAction = Literal["created", "updated", "deleted"]
+RESERVATION_EVENT_CHANNEL = "roombook_reservation_events"
+RESERVATION_EVENT_HEARTBEAT_SECONDS = 25.0
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True, slots=True)
 class ReservationEvent:
     action: ReservationEventAction
     reservation_id: str
+    room_id: str | None = None
+    start_at: datetime | None = None
+    end_at: datetime | None = None
+    previous_room_id: str | None = None
+    previous_start_at: datetime | None = None
+    previous_end_at: datetime | None = None
+    # 변경 후 예약 요약. 클라이언트가 상세를 다시 조회하지 않고 화면을 갱신할 수 있게 한다.
+    room_name: str | None = None
+    title: str | None = None
+    label: str | None = None
+    created_by_name: str | None = None
+    event_id: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ReservationEventFilter:
+    room_ids: frozenset[str] | None = None
+    start_at: datetime | None = None
+    end_at: datetime | None = None
+
+    def matches(self, event: ReservationEvent) -> bool:
+        # 방/시간 정보가 없는 이벤트는 놓치지 않도록 모든 구독자에게 보낸다.
+        if event.room_id is None and event.previous_room_id is None:
+            return True
+        return self._matches_slot(event.room_id, event.start_at, event.end_at) or self._matches_slot(
+            event.previous_room_id, event.previous_start_at, event.previous_end_at
+        )
+
+    def _matches_slot(self, room_id: str | None, start_at: datetime | None, end_at: datetime | None) -> bool:
+        if room_id is None:
+            return False
+        if self.room_ids is not None and room_id not in self.room_ids:
+            return False
+        if self.start_at is not None and end_at is not None and end_at <= self.start_at:
+            return False
+        if self.end_at is not None and start_at is not None and start_at >= self.end_at:
+            return False
+        return True
+
+
+@dataclass(frozen=True, slots=True)
+class ReservationEventBatch:
+    events: list[ReservationEvent]
+    resync: bool
+    last_event_id: str | None
+    heartbeat: bool = False
+
+
+class ReservationEventMailbox:
+    # 구독자별 대기 이벤트. 같은 예약의 이벤트는 하나로 합치고,
+    # 합쳐도 max_pending을 넘으면 이벤트를 버리는 대신 resync 신호 하나로 바꾼다.
+    def __init__(self, max_pending: int) -> None:
+        self._max_pending = max(1, max_pending)
+        self._pending: dict[str, ReservationEvent] = {}
+        self._resync = False
+        self._heartbeat = False
+        self._last_event_id: str | None = None
+        self._ready = asyncio.Event()
+
+    def put(self, event: ReservationEvent) -> None:
+        self._last_event_id = event.event_id
+        self._ready.set()
+        if self._resync:
+            return
+        current = self._pending.pop(event.reservation_id, None)
+        self._pending[event.reservation_id] = event if current is None else merge_reservation_events(current, event)
+        if len(self._pending) > self._max_pending:
+            self._pending.clear()
+            self._resync = True
+
+    async def get(self) -> ReservationEvent:
+        while not self._pending:
+            self._ready.clear()
+            await self._ready.wait()
+        reservation_id = next(iter(self._pending))
+        return self._pending.pop(reservation_id)
+
+    def heartbeat(self) -> None:
+        self._heartbeat = True
+        self._ready.set()
+
+    async def get_batch(self) -> ReservationEventBatch:
+        while not self._pending and not self._resync and not self._heartbeat:
+            self._ready.clear()
+            await self._ready.wait()
+        batch = ReservationEventBatch(
+            events=list(self._pending.values()),
+            resync=self._resync,
+            last_event_id=self._last_event_id,
+            heartbeat=self._heartbeat,
+        )
+        self._pending.clear()
+        self._resync = False
+        self._heartbeat = False
+        return batch
+
+    def qsize(self) -> int:
+        return len(self._pending)
+
+    def empty(self) -> bool:
+        return not self._pending and not self._resync
+
+
+@dataclass(frozen=True, slots=True)
+class ReservationEventSubscription:
+    queue: ReservationEventMailbox
+    replay: list[ReservationEvent]
+    reset: bool
+    last_event_id: str
+
+
+class ReservationEventChannel(Protocol):
+    async def notify(self, payload: str) -> None: ...
+
+    async def start(self, handler: Callable[[str], Awaitable[None]]) -> None: ...
+
+    async def stop(self) -> None: ...
 
 
 class ReservationEventBroker:
-    def __init__(self) -> None:
-        self._subscribers: set[asyncio.Queue[ReservationEvent]] = set()
+    def __init__(
+        self,
+        log_size: int = RESERVATION_EVENT_LOG_SIZE,
+        max_pending: int = RESERVATION_EVENT_MAX_PENDING,
+        heartbeat_seconds: float = RESERVATION_EVENT_HEARTBEAT_SECONDS,
+    ) -> None:
+        self._max_pending = max_pending
+        self._heartbeat_seconds = heartbeat_seconds
+        self._heartbeat_task: asyncio.Task[None] | None = None
+        # 이벤트 ID는 "<발행한 프로세스의 epoch>-<그 프로세스의 발행 순번>"이다. pg_notify로 ID까지 함께 보내
+        # 모든 워커가 같은 ID로 기록하므로, 다른 워커로 재연결해도 자기 버퍼에서 Last-Event-ID를 찾아 이어 준다.
+        self._epoch = uuid4().hex[:8]
+        self._issued = 0
+        # 버퍼 순서는 이 프로세스가 받은 순서(_sequence)로 매긴다.
+        self._sequence = 0
+        self._event_log: deque[tuple[int, ReservationEvent]] = deque(maxlen=max(1, log_size))
+        self._log_index: dict[str, int] = {}
+        self._filters: dict[ReservationEventMailbox, ReservationEventFilter] = {}
+        # 방 ID -> 구독자. 방을 지정하지 않은 구독자는 _all_room_subscribers에 둔다.
+        self._room_index: dict[str, set[ReservationEventMailbox]] = {}
+        self._all_room_subscribers: set[ReservationEventMailbox] = set()
         self._lock = asyncio.Lock()
 
-    async def subscribe(self) -> asyncio.Queue[ReservationEvent]:
-        queue: asyncio.Queue[ReservationEvent] = asyncio.Queue(maxsize=10)
+    async def start(self) -> None:
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._send_heartbeats())
+
+    async def stop(self) -> None:
+        task = self._heartbeat_task
+        self._heartbeat_task = None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def subscribe(self, event_filter: ReservationEventFilter | None = None) -> ReservationEventMailbox:
+        subscription = await self.open_subscription(event_filter)
+        return subscription.queue
+
+    async def open_subscription(
+        self,
+        event_filter: ReservationEventFilter | None = None,
+        last_event_id: str | None = None,
+    ) -> ReservationEventSubscription:
+        queue = ReservationEventMailbox(self._max_pending)
+        normalized_filter = event_filter or ReservationEventFilter()
         async with self._lock:
-            self._subscribers.add(queue)
-        return queue
+            replay: list[ReservationEvent] = []
+            reset = False
+            if last_event_id is not None:
+                missed = self._events_after(last_event_id)
+                if missed is None:
+                    reset = True
+                else:
+                    replay = [event for event in missed if normalized_filter.matches(event)]
+            self._filters[queue] = normalized_filter
+            if normalized_filter.room_ids is None:
+                self._all_room_subscribers.add(queue)
+            else:
+                for room_id in normalized_filter.room_ids:
+                    self._room_index.setdefault(room_id, set()).add(queue)
+            head_event_id = self._head_event_id()
+        return ReservationEventSubscription(queue=queue, replay=replay, reset=reset, last_event_id=head_event_id)
 
-    async def unsubscribe(self, queue: asyncio.Queue[ReservationEvent]) -> None:
+    async def unsubscribe(self, queue: ReservationEventMailbox) -> None:
         async with self._lock:
-            self._subscribers.discard(queue)
+            event_filter = self._filters.pop(queue, None)
+            if event_filter is None:
+                return
+            if event_filter.room_ids is None:
+                self._all_room_subscribers.discard(queue)
+                return
+            for room_id in event_filter.room_ids:
+                room_subscribers = self._room_index.get(room_id)
+                if room_subscribers is None:
+                    continue
+                room_subscribers.discard(queue)
+                if not room_subscribers:
+                    del self._room_index[room_id]
 
     async def publish(self, event: ReservationEvent) -> None:
+        await self._dispatch(event)
+
+    async def _dispatch(self, event: ReservationEvent) -> None:
         async with self._lock:
-            subscribers = tuple(self._subscribers)
+            event_id = event.event_id or self._issue_event_id()
+            event = replace(event, event_id=event_id)
+            self._sequence += 1
+            if len(self._event_log) == self._event_log.maxlen:
+                _, evicted = self._event_log[0]
+                self._log_index.pop(evicted.event_id or "", None)
+            self._event_log.append((self._sequence, event))
+            self._log_index[event_id] = self._sequence
+            if event.room_id is None and event.previous_room_id is None:
+                candidates = set(self._filters)
+            else:
+                candidates = set(self._all_room_subscribers)
+                for room_id in {event.room_id, event.previous_room_id}:
+                    if room_id is not None:
+                        candidates.update(self._room_index.get(room_id, ()))
+            subscribers = [queue for queue in candidates if self._filters[queue].matches(event)]
 
         for queue in subscribers:
-            if queue.full():
-                try:
-                    queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    continue
-            try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                continue
+            queue.put(event)
+
+    async def _send_heartbeats(self) -> None:
+        # 연결마다 타이머를 두지 않고 하나의 태스크가 모든 구독자를 주기적으로 깨운다.
+        # keep-alive 전송이 실패하면 끊긴 연결이 정리된다.
+        while True:
+            await asyncio.sleep(self._heartbeat_seconds)
+            async with self._lock:
+                subscribers = tuple(self._filters)
+            for queue in subscribers:
+                queue.heartbeat()
+
+    def _issue_event_id(self) -> str:
+        self._issued += 1
+        return f"{self._epoch}-{self._issued}"
+
+    def _head_event_id(self) -> str:
+        # 아직 받은 이벤트가 없으면 "<epoch>-0"을 시작점으로 준다.
+        if self._event_log:
+            return self._event_log[-1][1].event_id or ""
+        return f"{self._epoch}-0"
+
+    def _events_after(self, last_event_id: str) -> list[ReservationEvent] | None:
+        # 버퍼만으로 빠진 이벤트를 모두 채울 수 없으면 None을 돌려 클라이언트가 전체를 다시 읽게 한다.
+        normalized = last_event_id.strip()
+        last_sequence = self._log_index.get(normalized)
+        if last_sequence is None:
+            # 이 프로세스가 이벤트를 받기 전에 준 시작점이고, 그 뒤의 이벤트가 버퍼에 모두 남아 있을 때만 이어 준다.
+            if normalized != f"{self._epoch}-0":
+                return None
+            if self._event_log and self._event_log[0][0] != 1:
+                return None
+            last_sequence = 0
+        return [event for sequence, event in self._event_log if sequence > last_sequence]
+
+
+class PgNotifyReservationEventBroker(ReservationEventBroker):
+    # 여러 워커/컨테이너가 같은 DB를 바라볼 때 pg_notify로 이벤트를 공유한다.
+    # 발행은 NOTIFY만 하고, 로컬 구독자 전달은 프로세스당 하나인 LISTEN 연결이 맡는다.
+    def __init__(self, channel: ReservationEventChannel) -> None:
+        super().__init__()
+        self._channel = channel
+
+    async def start(self) -> None:
+        await super().start()
+        await self._channel.start(self._on_payload)
+
+    async def stop(self) -> None:
+        await self._channel.stop()
+        await super().stop()
+
+    async def publish(self, event: ReservationEvent) -> None:
+        # 발행한 워커가 ID를 매겨 함께 보내야 모든 워커의 버퍼에 같은 ID로 남는다.
+        event = replace(event, event_id=self._issue_event_id())
+        try:
+            await self._channel.notify(encode_reservation_event(event))
+        except Exception as exc:
+            logger.warning("reservation event notify failed, delivering locally only error=%s", exc)
+            await self._dispatch(event)
+
+    async def _on_payload(self, payload: str) -> None:
+        event = decode_reservation_event(payload)
+        if event is None:
+            logger.warning("ignored malformed reservation event payload=%s", payload)
+            return
+        await self._dispatch(event)
+
+
+def merge_reservation_events(first: ReservationEvent, latest: ReservationEvent) -> ReservationEvent:
+    # 클라이언트가 알고 있는 "변경 전" 위치는 첫 이벤트 기준으로 유지한다.
+    if first.action == "created":
+        if latest.action == "deleted":
+            return latest
+        return replace(
+            latest,
+            action="created",
+            previous_room_id=None,
+            previous_start_at=None,
+            previous_end_at=None,
+        )
+    if first.action == "deleted":
+        return latest
+    return replace(
+        latest,
+        previous_room_id=first.previous_room_id,
+        previous_start_at=first.previous_start_at,
+        previous_end_at=first.previous_end_at,
+    )
+
+
+def coalesce_reservation_events(events: list[ReservationEvent]) -> list[ReservationEvent]:
+    pending: dict[str, ReservationEvent] = {}
+    for event in events:
+        current = pending.pop(event.reservation_id, None)
+        pending[event.reservation_id] = event if current is None else merge_reservation_events(current, event)
+    return list(pending.values())
+
+
+def reservation_event_to_dict(event: ReservationEvent) -> dict[str, object]:
+    payload: dict[str, object] = {}
+    for field in fields(event):
+        value = getattr(event, field.name)
+        payload[field.name] = value.isoformat() if isinstance(value, datetime) else value
+    return payload
+
+
+def encode_reservation_event(event: ReservationEvent) -> str:
+    return json.dumps(reservation_event_to_dict(event), ensure_ascii=False)
+
+
+def decode_reservation_event(payload: str) -> ReservationEvent | None:
+    try:
+        raw = json.loads(payload)
+    except ValueError:
+        return None
+    if not isinstance(raw, dict):
+        return None
+    action = raw.get("action")
+    reservation_id = raw.get("reservation_id")
+    if action not in {"created", "updated", "deleted"} or not isinstance(reservation_id, str):
+        return None
+    try:
+        return ReservationEvent(
+            action=action,
+            reservation_id=reservation_id,
+            room_id=_optional_str(raw.get("room_id")),
+            start_at=_optional_datetime(raw.get("start_at")),
+            end_at=_optional_datetime(raw.get("end_at")),
+            previous_room_id=_optional_str(raw.get("previous_room_id")),
+            previous_start_at=_optional_datetime(raw.get("previous_start_at")),
+            previous_end_at=_optional_datetime(raw.get("previous_end_at")),
+            room_name=_optional_str(raw.get("room_name")),
+            title=_optional_str(raw.get("title")),
+            label=_optional_str(raw.get("label")),
+            created_by_name=_optional_str(raw.get("created_by_name")),
+            event_id=_optional_str(raw.get("event_id")),
+        )
+    except ValueError:
+        return None
+
+
+def _optional_str(value: object) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+def _optional_datetime(value: object) -> datetime | None:
+    if not isinstance(value, str):
+        return None
+    return datetime.fromisoformat(value)
+
+
+def _create_reservation_event_broker() -> ReservationEventBroker:
+    if RESERVATION_EVENT_BACKEND != "postgres":
+        return ReservationEventBroker()
+    return PgNotifyReservationEventBroker(PgNotifyChannel(RESERVATION_EVENT_CHANNEL, DATABASE_URL, engine))
 
 
-reservation_event_broker = ReservationEventBroker()
+reservation_event_broker = _create_reservation_event_broker()
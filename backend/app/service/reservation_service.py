@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from uuid import uuid4
@@ -5,15 +6,32 @@ from uuid import uuid4
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 
 from app.infra.minutes_live_state import (
+    MinutesLiveState,
     add_or_update_minutes_live_state,
     find_minutes_live_state,
+    list_idle_minutes_live_states,
 )
 from app.infra.minutes_lock import (
-    add_or_update_minutes_lock,
+    delete_expired_minutes_locks,
     delete_minutes_lock,
     find_minutes_lock,
+    upsert_minutes_lock_if_available,
+)
+from app.infra.minutes_transcript_archive import (
+    MinutesTranscriptArchive,
+    add_or_update_minutes_transcript_archive,
+    decode_transcript,
+    find_minutes_transcript_archive,
+)
+from app.infra.minutes_transcript_chunk import (
+    MinutesTranscriptChunk,
+    add_minutes_transcript_chunk,
+    delete_minutes_transcript_chunks,
+    find_last_transcript_chunk_seq,
+    list_minutes_transcript_chunks,
 )
 from app.infra.reservation import (
     Reservation,
@@ -32,6 +50,13 @@ from app.service.auth_service import AuthUser
 from app.service.domain import DomainError
 from app.service.user_service import resolve_attendee_user_ids
 
+MINUTES_LOCK_PERMISSION_CACHE_SIZE = 1024
+MINUTES_LOCK_PERMISSION_CACHE_TTL_SECONDS = 60
+MINUTES_LIVE_STATE_ARCHIVE_BATCH_SIZE = 100
+
+# (reservation_id, user_id) -> 권한을 재사용할 수 있는 마지막 시각. 오래 안 쓴 항목부터 밀어낸다.
+_minutes_lock_permission_cache: OrderedDict[tuple[str, str], datetime] = OrderedDict()
+
 
 @dataclass(frozen=True, slots=True)
 class CreateReservationInput:
@@ -69,6 +94,8 @@ class UpdateReservationInput:
     meeting_result: str | None
     other_notes: str | None
     minutes_attachment: str | None
+    # 편집을 시작할 때 읽은 버전. 주면 그 사이 다른 저장이 있었는지 확인한다.
+    version: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -90,6 +117,7 @@ class CreateReservationResult:
     start_at: datetime
     end_at: datetime
     created_at: datetime
+    created_by_name: str
 
 
 @dataclass(frozen=True, slots=True)
@@ -113,6 +141,24 @@ class ReservationDetailResult:
     created_by_name: str
     created_by_email: str
     attendees: list[AttendeeItem]
+    version: int
+
+
+@dataclass(frozen=True, slots=True)
+class UpdatedReservationResult(ReservationDetailResult):
+    previous_room_id: str
+    previous_start_at: datetime
+    previous_end_at: datetime
+    # 바뀐 값이 없어 저장하지 않았으면 False. 이때는 변경 이벤트를 보내지 않는다.
+    changed: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class DeletedReservationResult:
+    id: str
+    room_id: str
+    start_at: datetime
+    end_at: datetime
 
 
 @dataclass(frozen=True, slots=True)
@@ -131,6 +177,27 @@ class MinutesLiveStateResult:
     updated_by_user_id: str | None
     updated_by_name: str | None
     updated_at: datetime
+    transcript_seq: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class MinutesTranscriptChunkResult:
+    reservation_id: str
+    seq: int
+    text: str
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class MinutesTranscriptDeltaResult:
+    reservation_id: str
+    # 뷰어가 가진 조각 번호로 이어 붙일 수 없으면 전체 상태를 다시 보낸다.
+    snapshot: MinutesLiveStateResult | None
+    chunks: list[MinutesTranscriptChunkResult]
+    is_recording: bool
+    updated_by_user_id: str | None
+    updated_by_name: str | None
+    transcript_seq: int
 
 
 async def create_reservation(
@@ -207,6 +274,7 @@ async def create_reservation(
         start_at=payload.start_at,
         end_at=payload.end_at,
         created_at=reservation.created_at,
+        created_by_name=owner.name,
     )
 
 
@@ -285,7 +353,7 @@ async def update_reservation(
     payload: UpdateReservationInput,
     auth_user: AuthUser,
     db: AsyncSession,
-) -> ReservationDetailResult | DomainError:
+) -> UpdatedReservationResult | DomainError:
     item = await find_reservation_with_timetable_and_creator(db, reservation_id)
     if item is None:
         return DomainError(code="NOT_FOUND", message="예약을 찾을 수 없습니다.")
@@ -301,7 +369,7 @@ async def update_reservation_minutes(
     payload: UpdateReservationInput,
     auth_user: AuthUser,
     db: AsyncSession,
-) -> ReservationDetailResult | DomainError:
+) -> UpdatedReservationResult | DomainError:
     item = await find_reservation_with_timetable_and_creator(db, reservation_id)
     if item is None:
         return DomainError(code="NOT_FOUND", message="예약을 찾을 수 없습니다.")
@@ -316,18 +384,28 @@ async def delete_reservation(
     reservation_id: str,
     auth_user: AuthUser,
     db: AsyncSession,
-) -> None | DomainError:
+) -> DeletedReservationResult | DomainError:
     item = await find_reservation_with_timetable_and_creator(db, reservation_id)
     if item is None:
         return DomainError(code="NOT_FOUND", message="예약을 찾을 수 없습니다.")
-    reservation, _, _, _ = item
+    reservation, timetable, _, _ = item
     permission_error = await _ensure_reservation_delete_permission(reservation.id, reservation.user_id, auth_user, db)
     if permission_error is not None:
         return permission_error
 
-    await db.delete(reservation)
-    await db.commit()
-    return None
+    deleted = DeletedReservationResult(
+        id=reservation.id,
+        room_id=timetable.room_id,
+        start_at=timetable.start_at,
+        end_at=timetable.end_at,
+    )
+    try:
+        await db.delete(reservation)
+        await db.commit()
+    except StaleDataError:
+        await db.rollback()
+        return _version_conflict_error()
+    return deleted
 
 
 async def get_minutes_lock(
@@ -335,11 +413,8 @@ async def get_minutes_lock(
     db: AsyncSession,
 ) -> MinutesLockResult | None:
     lock = await find_minutes_lock(db, reservation_id)
-    if lock is None:
-        return None
-    if lock.expires_at <= datetime.now(UTC):
-        await db.delete(lock)
-        await db.commit()
+    # 만료된 잠금은 없는 것으로 본다. 정리는 백그라운드 sweeper가 맡는다.
+    if lock is None or _is_lock_expired(lock.expires_at, datetime.now(UTC)):
         return None
     return MinutesLockResult(
         reservation_id=lock.reservation_id,
@@ -355,28 +430,40 @@ async def acquire_minutes_lock(
     db: AsyncSession,
     ttl_seconds: int = 15,
 ) -> MinutesLockResult | DomainError:
-    reservation_item = await find_reservation_with_timetable_and_creator(db, reservation_id)
-    if reservation_item is None:
-        return DomainError(code="NOT_FOUND", message="예약을 찾을 수 없습니다.")
-    reservation, _, _, _ = reservation_item
-    permission_error = await _ensure_minutes_edit_permission(reservation.id, reservation.user_id, holder, db)
-    if permission_error is not None:
-        return permission_error
-
     now = datetime.now(UTC)
-    current = await find_minutes_lock(db, reservation_id)
-    if current is not None and current.expires_at > now and current.holder_user_id != holder.id:
-        return DomainError(code="LOCKED", message=f"{current.holder_name}가 수정하고있습니다.")
+    # 잠금이 유지되는 동안 확인한 편집 권한은 재사용해서 하트비트를 upsert 한 번으로 끝낸다.
+    if not _has_cached_minutes_lock_permission(reservation_id, holder.id, now):
+        reservation_item = await find_reservation_with_timetable_and_creator(db, reservation_id)
+        if reservation_item is None:
+            return DomainError(code="NOT_FOUND", message="예약을 찾을 수 없습니다.")
+        reservation, _, _, _ = reservation_item
+        permission_error = await _ensure_minutes_edit_permission(reservation.id, reservation.user_id, holder, db)
+        if permission_error is not None:
+            return permission_error
 
     expires_at = now + timedelta(seconds=max(5, min(ttl_seconds, 120)))
-    lock = await add_or_update_minutes_lock(
-        db=db,
-        reservation_id=reservation_id,
-        holder_user_id=holder.id,
-        holder_name=holder.name,
-        expires_at=expires_at,
-    )
+    try:
+        lock = await upsert_minutes_lock_if_available(
+            db=db,
+            reservation_id=reservation_id,
+            holder_user_id=holder.id,
+            holder_name=holder.name,
+            expires_at=expires_at,
+            now=now,
+        )
+    except IntegrityError:
+        # 권한 캐시가 남아 있는 사이 예약이 삭제된 경우
+        await db.rollback()
+        _forget_minutes_lock_permission(reservation_id, holder.id)
+        return DomainError(code="NOT_FOUND", message="예약을 찾을 수 없습니다.")
+    if lock is None:
+        await db.rollback()
+        _forget_minutes_lock_permission(reservation_id, holder.id)
+        current = await find_minutes_lock(db, reservation_id)
+        holder_name = current.holder_name if current is not None else "다른 사용자"
+        return DomainError(code="LOCKED", message=f"{holder_name}가 수정하고있습니다.")
     await db.commit()
+    _remember_minutes_lock_permission(reservation_id, holder.id, now)
     return MinutesLockResult(
         reservation_id=lock.reservation_id,
         holder_user_id=lock.holder_user_id,
@@ -395,24 +482,34 @@ async def release_minutes_lock(
         return None
 
     now = datetime.now(UTC)
-    if current.expires_at > now and current.holder_user_id != holder_user_id:
+    if not _is_lock_expired(current.expires_at, now) and current.holder_user_id != holder_user_id:
         return DomainError(code="FORBIDDEN", message="다른 사용자가 보유한 수정 잠금입니다.")
 
     await delete_minutes_lock(db, reservation_id)
+    _forget_minutes_lock_permission(reservation_id, holder_user_id)
     current_state = await find_minutes_live_state(db, reservation_id)
-    if current_state is not None and current_state.is_recording:
-        await add_or_update_minutes_live_state(
-            db=db,
-            reservation_id=reservation_id,
-            transcript_text=current_state.transcript_text,
-            is_recording=False,
-            updated_by_user_id=current_state.updated_by_user_id,
-            updated_by_name=current_state.updated_by_name,
-        )
+    if current_state is not None:
+        await _archive_minutes_live_state(db, current_state)
     await db.commit()
     return None
 
 
+async def sweep_expired_minutes_locks(db: AsyncSession) -> list[str]:
+    reservation_ids = await delete_expired_minutes_locks(db, datetime.now(UTC))
+    await db.commit()
+    return reservation_ids
+
+
+async def archive_idle_minutes_live_states(db: AsyncSession) -> list[str]:
+    # 녹음 중이 아닌데 hot 테이블에 남은 행(만료 잠금 정리, 이전 버전 데이터)을 보관 테이블로 옮긴다.
+    states = await list_idle_minutes_live_states(db, MINUTES_LIVE_STATE_ARCHIVE_BATCH_SIZE)
+    reservation_ids = [state.reservation_id for state in states]
+    for state in states:
+        await _archive_minutes_live_state(db, state)
+    await db.commit()
+    return reservation_ids
+
+
 async def get_minutes_live_state(
     reservation_id: str,
     db: AsyncSession,
@@ -423,21 +520,50 @@ async def get_minutes_live_state(
 
     state = await find_minutes_live_state(db, reservation_id)
     if state is None:
-        return MinutesLiveStateResult(
+        return await _get_archived_minutes_live_state(db, reservation_id)
+    chunks = await list_minutes_transcript_chunks(db, reservation_id, after_seq=state.transcript_seq)
+    return _to_minutes_live_state_result(state, chunks)
+
+
+async def get_minutes_transcript_delta(
+    reservation_id: str,
+    after_seq: int | None,
+    db: AsyncSession,
+) -> MinutesTranscriptDeltaResult | DomainError:
+    reservation_item = await find_reservation_with_timetable_and_creator(db, reservation_id)
+    if reservation_item is None:
+        return DomainError(code="NOT_FOUND", message="예약을 찾을 수 없습니다.")
+
+    state = await find_minutes_live_state(db, reservation_id)
+    if state is None:
+        archived = await _get_archived_minutes_live_state(db, reservation_id)
+        return MinutesTranscriptDeltaResult(
             reservation_id=reservation_id,
-            transcript_text="",
+            snapshot=None if after_seq == archived.transcript_seq else archived,
+            chunks=[],
             is_recording=False,
-            updated_by_user_id=None,
-            updated_by_name=None,
-            updated_at=datetime.now(UTC),
+            updated_by_user_id=archived.updated_by_user_id,
+            updated_by_name=archived.updated_by_name,
+            transcript_seq=archived.transcript_seq,
         )
-    return MinutesLiveStateResult(
-        reservation_id=state.reservation_id,
-        transcript_text=state.transcript_text,
+
+    chunks = await list_minutes_transcript_chunks(db, reservation_id, after_seq=state.transcript_seq)
+    transcript_seq = chunks[-1].seq if chunks else state.transcript_seq
+    # 이미 transcript_text에 합쳐진 구간이나 알 수 없는 번호에서 이어 받으려 하면 스냅샷으로 대신한다.
+    snapshot: MinutesLiveStateResult | None = None
+    if after_seq is not None and state.transcript_seq <= after_seq <= transcript_seq:
+        chunks = [chunk for chunk in chunks if chunk.seq > after_seq]
+    else:
+        snapshot = _to_minutes_live_state_result(state, chunks)
+        chunks = []
+    return MinutesTranscriptDeltaResult(
+        reservation_id=reservation_id,
+        snapshot=snapshot,
+        chunks=[_to_minutes_transcript_chunk_result(chunk) for chunk in chunks],
         is_recording=state.is_recording,
         updated_by_user_id=state.updated_by_user_id,
         updated_by_name=state.updated_by_name,
-        updated_at=state.updated_at,
+        transcript_seq=transcript_seq,
     )
 
 
@@ -458,18 +584,19 @@ async def update_minutes_live_state(
 
     now = datetime.now(UTC)
     lock = await find_minutes_lock(db, reservation_id)
-    if lock is None or lock.expires_at <= now or lock.holder_user_id != holder.id:
-        if lock is not None and lock.expires_at <= now:
-            await db.delete(lock)
-            await db.commit()
+    if lock is None or _is_lock_expired(lock.expires_at, now) or lock.holder_user_id != holder.id:
         return DomainError(code="FORBIDDEN", message="수정 잠금 보유자만 전사 상태를 변경할 수 있습니다.")
 
     current_state = await find_minutes_live_state(db, reservation_id)
-    next_transcript = (
-        transcript_text
-        if transcript_text is not None
-        else (current_state.transcript_text if current_state is not None else "")
+    archive: MinutesTranscriptArchive | None = None
+    if current_state is None:
+        archive = await find_minutes_transcript_archive(db, reservation_id)
+    base_transcript = (
+        current_state.transcript_text
+        if current_state is not None
+        else (decode_transcript(archive.codec, archive.transcript_data) if archive is not None else "")
     )
+    next_transcript = transcript_text if transcript_text is not None else base_transcript
     next_is_recording = (
         is_recording
         if is_recording is not None
@@ -484,15 +611,204 @@ async def update_minutes_live_state(
         updated_by_user_id=holder.id,
         updated_by_name=holder.name,
     )
+    if archive is not None:
+        state.transcript_seq = archive.transcript_seq
+    if transcript_text is not None:
+        # 전사 전체를 직접 고친 경우 남은 조각은 버린다. 교체도 번호 하나를 써서
+        # 조각만 이어 받던 뷰어가 전체를 다시 받아야 한다는 것을 알 수 있게 한다.
+        last_seq = await find_last_transcript_chunk_seq(db, reservation_id)
+        state.transcript_seq = max(state.transcript_seq or 0, last_seq or 0) + 1
+        if last_seq is not None:
+            await delete_minutes_transcript_chunks(db, reservation_id, last_seq)
+    if not next_is_recording:
+        archived = await _archive_minutes_live_state(db, state)
+        await db.commit()
+        return archived
+    if archive is not None:
+        # 녹음을 다시 시작하면 보관본을 hot 테이블로 되돌린다.
+        await db.delete(archive)
     await db.commit()
     await db.refresh(state)
-    return MinutesLiveStateResult(
+    chunks = await list_minutes_transcript_chunks(db, reservation_id, after_seq=state.transcript_seq)
+    return _to_minutes_live_state_result(state, chunks)
+
+
+async def ensure_minutes_transcript_writer(
+    reservation_id: str,
+    holder: AuthUser,
+    db: AsyncSession,
+) -> DomainError | None:
+    state = await _find_writable_minutes_live_state(reservation_id, holder, db)
+    return state if isinstance(state, DomainError) else None
+
+
+async def append_minutes_transcript_chunk(
+    reservation_id: str,
+    holder: AuthUser,
+    text: str,
+    db: AsyncSession,
+    separator: str = "",
+    accept_after_stop: bool = False,
+) -> MinutesTranscriptChunkResult | DomainError:
+    # accept_after_stop: 녹음 중에 접수한 전사 작업의 결과. 권한과 녹음 여부는 접수할 때 확인했으므로,
+    # 결과가 녹음 종료(보관) 뒤에 도착해도 버리지 않고 붙인다.
+    if not text:
+        return DomainError(code="INVALID_ARGUMENT", message="전사 내용이 비어 있습니다.")
+
+    if accept_after_stop:
+        current_state = await find_minutes_live_state(db, reservation_id)
+        if current_state is None:
+            return await _append_archived_minutes_transcript(reservation_id, holder, text, db, separator)
+        state: MinutesLiveState | DomainError = current_state
+    else:
+        state = await _find_writable_minutes_live_state(reservation_id, holder, db)
+    if isinstance(state, DomainError):
+        return state
+    last_seq = await find_last_transcript_chunk_seq(db, reservation_id)
+    seq = max(state.transcript_seq, last_seq or 0) + 1
+    # 서버가 이어 붙이는 조각은 전사가 비어 있지 않을 때만 구분자를 앞에 붙인다.
+    if separator and (state.transcript_text or (last_seq or 0) > state.transcript_seq):
+        text = separator + text
+    chunk = add_minutes_transcript_chunk(
+        db=db,
+        reservation_id=reservation_id,
+        seq=seq,
+        text=text,
+        created_by_user_id=holder.id,
+    )
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 같은 번호로 동시에 붙인 경우. 클라이언트가 다시 보내면 다음 번호를 받는다.
+        await db.rollback()
+        return DomainError(code="LOCKED", message="다른 전사 조각과 충돌했습니다. 다시 시도해주세요.")
+    await db.refresh(chunk)
+    return _to_minutes_transcript_chunk_result(chunk)
+
+
+async def _append_archived_minutes_transcript(
+    reservation_id: str,
+    holder: AuthUser,
+    text: str,
+    db: AsyncSession,
+    separator: str,
+) -> MinutesTranscriptChunkResult | DomainError:
+    # 녹음이 끝나 보관된 전사 뒤에 바로 이어 붙이고, 조각 번호도 하나 올려 뷰어가 순서를 맞출 수 있게 한다.
+    archive = await find_minutes_transcript_archive(db, reservation_id)
+    base_transcript = decode_transcript(archive.codec, archive.transcript_data) if archive is not None else ""
+    if separator and base_transcript:
+        text = separator + text
+    seq = (archive.transcript_seq if archive is not None else 0) + 1
+    await add_or_update_minutes_transcript_archive(
+        db=db,
+        reservation_id=reservation_id,
+        transcript_text=base_transcript + text,
+        transcript_seq=seq,
+        updated_by_user_id=holder.id,
+        updated_by_name=holder.name,
+    )
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        return DomainError(code="LOCKED", message="다른 전사 조각과 충돌했습니다. 다시 시도해주세요.")
+    return MinutesTranscriptChunkResult(reservation_id=reservation_id, seq=seq, text=text, created_at=datetime.now(UTC))
+
+
+async def _find_writable_minutes_live_state(
+    reservation_id: str,
+    holder: AuthUser,
+    db: AsyncSession,
+) -> MinutesLiveState | DomainError:
+    # 잠금 보유자만 조각을 붙일 수 있으므로 편집 권한은 잠금 획득 시점의 확인으로 갈음한다.
+    lock = await find_minutes_lock(db, reservation_id)
+    if lock is None or _is_lock_expired(lock.expires_at, datetime.now(UTC)) or lock.holder_user_id != holder.id:
+        return DomainError(code="FORBIDDEN", message="수정 잠금 보유자만 전사 상태를 변경할 수 있습니다.")
+
+    state = await find_minutes_live_state(db, reservation_id)
+    if state is None or not state.is_recording:
+        return DomainError(code="INVALID_ARGUMENT", message="녹음 중에만 전사를 추가할 수 있습니다.")
+    return state
+
+
+async def _materialize_minutes_transcript(db: AsyncSession, state: MinutesLiveState) -> None:
+    # 녹음이 끝나면 쌓인 조각을 transcript_text에 한 번만 합치고 조각은 지운다.
+    chunks = await list_minutes_transcript_chunks(db, state.reservation_id, after_seq=state.transcript_seq or 0)
+    if not chunks:
+        return
+    state.transcript_text = (state.transcript_text or "") + "".join(chunk.text for chunk in chunks)
+    state.transcript_seq = chunks[-1].seq
+    await delete_minutes_transcript_chunks(db, state.reservation_id, state.transcript_seq)
+
+
+async def _archive_minutes_live_state(db: AsyncSession, state: MinutesLiveState) -> MinutesLiveStateResult:
+    # 녹음이 끝난 전사는 압축해서 보관 테이블로 옮기고 hot 테이블 행은 지운다.
+    await _materialize_minutes_transcript(db, state)
+    transcript_seq = state.transcript_seq or 0
+    archive = await add_or_update_minutes_transcript_archive(
+        db=db,
         reservation_id=state.reservation_id,
         transcript_text=state.transcript_text,
+        transcript_seq=transcript_seq,
+        updated_by_user_id=state.updated_by_user_id,
+        updated_by_name=state.updated_by_name,
+    )
+    await db.delete(state)
+    return MinutesLiveStateResult(
+        reservation_id=archive.reservation_id,
+        transcript_text=state.transcript_text,
+        is_recording=False,
+        updated_by_user_id=archive.updated_by_user_id,
+        updated_by_name=archive.updated_by_name,
+        updated_at=datetime.now(UTC),
+        transcript_seq=transcript_seq,
+    )
+
+
+async def _get_archived_minutes_live_state(db: AsyncSession, reservation_id: str) -> MinutesLiveStateResult:
+    archive = await find_minutes_transcript_archive(db, reservation_id)
+    if archive is None:
+        return MinutesLiveStateResult(
+            reservation_id=reservation_id,
+            transcript_text="",
+            is_recording=False,
+            updated_by_user_id=None,
+            updated_by_name=None,
+            updated_at=datetime.now(UTC),
+        )
+    return MinutesLiveStateResult(
+        reservation_id=archive.reservation_id,
+        transcript_text=decode_transcript(archive.codec, archive.transcript_data),
+        is_recording=False,
+        updated_by_user_id=archive.updated_by_user_id,
+        updated_by_name=archive.updated_by_name,
+        updated_at=archive.archived_at,
+        transcript_seq=archive.transcript_seq,
+    )
+
+
+def _to_minutes_transcript_chunk_result(chunk: MinutesTranscriptChunk) -> MinutesTranscriptChunkResult:
+    return MinutesTranscriptChunkResult(
+        reservation_id=chunk.reservation_id,
+        seq=chunk.seq,
+        text=chunk.text,
+        created_at=chunk.created_at,
+    )
+
+
+def _to_minutes_live_state_result(
+    state: MinutesLiveState,
+    chunks: list[MinutesTranscriptChunk],
+) -> MinutesLiveStateResult:
+    # 녹음 중에는 합쳐지지 않은 조각을 읽을 때 이어 붙여 보여준다.
+    return MinutesLiveStateResult(
+        reservation_id=state.reservation_id,
+        transcript_text=state.transcript_text + "".join(chunk.text for chunk in chunks),
         is_recording=state.is_recording,
         updated_by_user_id=state.updated_by_user_id,
         updated_by_name=state.updated_by_name,
         updated_at=state.updated_at,
+        transcript_seq=chunks[-1].seq if chunks else state.transcript_seq,
     )
 
 
@@ -503,7 +819,13 @@ async def _update_reservation_internal(
     current_room: Room | None,
     payload: UpdateReservationInput,
     db: AsyncSession,
-) -> ReservationDetailResult | DomainError:
+) -> UpdatedReservationResult | DomainError:
+    if payload.version is not None and payload.version != reservation.version:
+        return _version_conflict_error()
+
+    previous_room_id = current_timetable.room_id
+    previous_start_at = current_timetable.start_at
+    previous_end_at = current_timetable.end_at
     next_room_id = payload.room_id if payload.room_id is not None else current_timetable.room_id
     next_room = current_room
     if next_room_id != current_timetable.room_id:
@@ -541,49 +863,92 @@ async def _update_reservation_internal(
     if not _is_valid_datetime_range(next_start_at, next_end_at):
         return DomainError(code="INVALID_ARGUMENT", message="종료시간은 시작시간보다 커야 합니다.")
 
-    await _acquire_room_reservation_lock(db, next_room_id)
-
-    has_conflict = await find_reservation_conflict(
-        db=db,
-        room_id=next_room_id,
-        start_at=next_start_at,
-        end_at=next_end_at,
-        exclude_reservation_id=reservation.id,
+    # 바뀐 값이 없으면 쓰지 않는다. 자동 저장이 같은 내용을 보내도 버전이 오르지 않는다.
+    current_attendee_ids: set[str] | None = None
+    if attendee_user_ids is not None:
+        current_attendee_ids = {user_id for user_id, _, _ in await list_attendees_by_reservation_id(db, reservation.id)}
+    has_changes = (
+        next_room_id != current_timetable.room_id
+        or not _is_same_instant(next_start_at, previous_start_at)
+        or not _is_same_instant(next_end_at, previous_end_at)
+        or (attendee_user_ids is not None and set(attendee_user_ids) != current_attendee_ids)
+        or (
+            next_title,
+            next_label,
+            next_purpose,
+            next_agenda_url,
+            next_description,
+            next_external_attendees,
+            next_agenda,
+            next_meeting_content,
+            next_meeting_result,
+            next_other_notes,
+            next_minutes_attachment,
+        )
+        != (
+            reservation.title,
+            reservation.label,
+            reservation.purpose,
+            reservation.agenda_url,
+            reservation.description,
+            reservation.external_attendees,
+            reservation.agenda,
+            reservation.meeting_content,
+            reservation.meeting_result,
+            reservation.other_notes,
+            reservation.minutes_attachment,
+        )
     )
-    if has_conflict:
-        return DomainError(code="RESERVATION_CONFLICT", message="이미 해당 시간대에 예약이 존재합니다.")
+    if has_changes:
+        await _acquire_room_reservation_lock(db, next_room_id)
 
-    try:
-        target_timetable = await _find_or_create_timetable(
+        has_conflict = await find_reservation_conflict(
             db=db,
             room_id=next_room_id,
             start_at=next_start_at,
             end_at=next_end_at,
+            exclude_reservation_id=reservation.id,
         )
-
-        reservation.title = next_title
-        reservation.label = next_label
-        reservation.purpose = next_purpose
-        reservation.agenda_url = next_agenda_url
-        reservation.description = next_description
-        reservation.timetable_id = target_timetable.id
-        reservation.external_attendees = next_external_attendees
-        reservation.agenda = next_agenda
-        reservation.meeting_content = next_meeting_content
-        reservation.meeting_result = next_meeting_result
-        reservation.other_notes = next_other_notes
-        reservation.minutes_attachment = next_minutes_attachment
-        if attendee_user_ids is not None:
-            await replace_reservation_attendees(db, reservation.id, attendee_user_ids)
-        await db.commit()
-        await db.refresh(reservation)
-    except IntegrityError:
-        await db.rollback()
-        return DomainError(code="RESERVATION_CONFLICT", message="이미 해당 시간대에 예약이 존재합니다.")
+        if has_conflict:
+            return DomainError(code="RESERVATION_CONFLICT", message="이미 해당 시간대에 예약이 존재합니다.")
+
+        try:
+            target_timetable = await _find_or_create_timetable(
+                db=db,
+                room_id=next_room_id,
+                start_at=next_start_at,
+                end_at=next_end_at,
+            )
+
+            reservation.title = next_title
+            reservation.label = next_label
+            reservation.purpose = next_purpose
+            reservation.agenda_url = next_agenda_url
+            reservation.description = next_description
+            reservation.timetable_id = target_timetable.id
+            reservation.external_attendees = next_external_attendees
+            reservation.agenda = next_agenda
+            reservation.meeting_content = next_meeting_content
+            reservation.meeting_result = next_meeting_result
+            reservation.other_notes = next_other_notes
+            reservation.minutes_attachment = next_minutes_attachment
+            # 참석자만 바뀌어도 예약 행을 갱신해서 버전이 올라가게 한다.
+            reservation.updated_at = datetime.now(UTC)
+            if attendee_user_ids is not None:
+                await replace_reservation_attendees(db, reservation.id, attendee_user_ids)
+            await db.commit()
+            await db.refresh(reservation)
+        except StaleDataError:
+            # 버전을 확인한 뒤 UPDATE 사이에 다른 저장이 끼어든 경우
+            await db.rollback()
+            return _version_conflict_error()
+        except IntegrityError:
+            await db.rollback()
+            return DomainError(code="RESERVATION_CONFLICT", message="이미 해당 시간대에 예약이 존재합니다.")
 
     attendee_rows = await list_attendees_by_reservation_id(db, reservation.id)
     attendees = [AttendeeItem(id=user_id, name=name, email=email) for user_id, name, email in attendee_rows]
-    return ReservationDetailResult(
+    return UpdatedReservationResult(
         id=reservation.id,
         room_id=next_room_id,
         room_name=next_room.name if next_room is not None else next_room_id,
@@ -603,6 +968,11 @@ async def _update_reservation_internal(
         created_by_name=creator.name,
         created_by_email=creator.email,
         attendees=attendees,
+        version=reservation.version,
+        previous_room_id=previous_room_id,
+        previous_start_at=previous_start_at,
+        previous_end_at=previous_end_at,
+        changed=has_changes,
     )
 
 
@@ -635,6 +1005,7 @@ async def _to_reservation_detail_result(
         created_by_name=creator.name,
         created_by_email=creator.email,
         attendees=attendees,
+        version=reservation.version,
     )
 
 
@@ -731,6 +1102,53 @@ def _is_valid_datetime_range(start_at: datetime, end_at: datetime) -> bool:
     return end_at > start_at
 
 
+def _has_cached_minutes_lock_permission(reservation_id: str, user_id: str, now: datetime) -> bool:
+    key = (reservation_id, user_id)
+    expires_at = _minutes_lock_permission_cache.get(key)
+    if expires_at is None:
+        return False
+    if expires_at <= now:
+        del _minutes_lock_permission_cache[key]
+        return False
+    _minutes_lock_permission_cache.move_to_end(key)
+    return True
+
+
+def _remember_minutes_lock_permission(reservation_id: str, user_id: str, now: datetime) -> None:
+    # 만료 시각은 권한을 처음 확인한 때 정하고, 하트비트로 연장하지 않는다.
+    # 그래서 참석자에서 빠지는 등 권한이 바뀌어도 TTL 안에 다시 확인된다.
+    key = (reservation_id, user_id)
+    expires_at = _minutes_lock_permission_cache.get(key)
+    if expires_at is None or expires_at <= now:
+        expires_at = now + timedelta(seconds=MINUTES_LOCK_PERMISSION_CACHE_TTL_SECONDS)
+    _minutes_lock_permission_cache[key] = expires_at
+    _minutes_lock_permission_cache.move_to_end(key)
+    while len(_minutes_lock_permission_cache) > MINUTES_LOCK_PERMISSION_CACHE_SIZE:
+        _minutes_lock_permission_cache.popitem(last=False)
+
+
+def _forget_minutes_lock_permission(reservation_id: str, user_id: str) -> None:
+    _minutes_lock_permission_cache.pop((reservation_id, user_id), None)
+
+
+def _version_conflict_error() -> DomainError:
+    return DomainError(code="VERSION_CONFLICT", message="다른 사용자가 먼저 저장했습니다. 최신 내용을 확인해주세요.")
+
+
+def _is_same_instant(left: datetime, right: datetime) -> bool:
+    # SQLite는 타임존 없이 저장한 시각을 그대로 돌려주므로 한쪽이라도 naive면 시각 값만 비교한다.
+    if left.tzinfo is None or right.tzinfo is None:
+        return left.replace(tzinfo=None) == right.replace(tzinfo=None)
+    return left == right
+
+
+def _is_lock_expired(expires_at: datetime, now: datetime) -> bool:
+    # SQLite는 타임존 없이 돌려주므로 UTC로 저장된 값으로 본다.
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=UTC)
+    return expires_at <= now
+
+
 def _new_id(prefix: str) -> str:
     return f"{prefix}_{uuid4().hex}"
 
@@ -0,0 +1,134 @@
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from typing import IO
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.settings import (
+    TRANSCRIPTION_CACHE_DB_ENABLED,
+    TRANSCRIPTION_CACHE_DB_TTL_HOURS,
+    TRANSCRIPTION_CACHE_SIZE,
+)
+from app.infra.transcription_cache import (
+    delete_transcription_cache_entries_before,
+    find_transcription_cache_entry,
+    upsert_transcription_cache_entry,
+)
+
+logger = logging.getLogger(__name__)
+
+# 전사 모델이나 후처리가 바뀌면 올려서 예전 결과를 쓰지 않게 한다.
+TRANSCRIPTION_CACHE_KEY_VERSION = "gpt-4o-mini-transcribe:1"
+TRANSCRIPTION_CACHE_PRUNE_EVERY = 100
+_HASH_BLOCK_SIZE = 64 * 1024
+
+
+def transcription_cache_key(audio: bytes | IO[bytes], mime_type: str, prompt: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{TRANSCRIPTION_CACHE_KEY_VERSION}\0{mime_type}\0{prompt}\0".encode())
+    if isinstance(audio, bytes):
+        digest.update(audio)
+        return digest.hexdigest()
+    # 임시 파일로 넘어간 큰 업로드도 한 번에 읽지 않고 블록 단위로 해시한다.
+    audio.seek(0)
+    while block := audio.read(_HASH_BLOCK_SIZE):
+        digest.update(block)
+    audio.seek(0)
+    return digest.hexdigest()
+
+
+class TranscriptionCache:
+    # 같은 청크를 다시 보내도 전사 API를 다시 부르지 않는다. 메모리 LRU가 기본이고 DB는 선택이다.
+    def __init__(
+        self,
+        max_entries: int = TRANSCRIPTION_CACHE_SIZE,
+        db_enabled: bool = TRANSCRIPTION_CACHE_DB_ENABLED,
+        db_ttl_hours: int = TRANSCRIPTION_CACHE_DB_TTL_HOURS,
+    ) -> None:
+        self.max_entries = max(0, max_entries)
+        self.db_enabled = db_enabled
+        self.db_ttl = timedelta(hours=max(1, db_ttl_hours))
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        # 같은 청크가 전사 중에 다시 들어오면 새로 요청하지 않고 앞 요청의 결과를 기다린다.
+        self._inflight: dict[str, asyncio.Future[str | None]] = {}
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._db_writes = 0
+
+    async def start(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def stop(self) -> None:
+        # 전사 중이던 청크를 기다리는 요청이 남아 있으면 직접 전사하도록 풀어준다.
+        inflight = self._inflight
+        self._inflight = {}
+        for pending in inflight.values():
+            if not pending.done():
+                pending.set_result(None)
+        self._session_factory = None
+
+    async def get(self, key: str) -> str | None:
+        text = self._entries.get(key)
+        if text is not None:
+            self._entries.move_to_end(key)
+            return text
+        if not self.db_enabled or self._session_factory is None:
+            return None
+        try:
+            async with self._session_factory() as db:
+                entry = await find_transcription_cache_entry(db, key, datetime.now(UTC) - self.db_ttl)
+        except Exception as exc:
+            logger.warning("transcription cache read failed error=%s", exc)
+            return None
+        if entry is None:
+            return None
+        self._remember(key, entry.text)
+        return entry.text
+
+    def claim(self, key: str) -> asyncio.Future[str | None] | None:
+        # 이미 전사 중이면 기다릴 future를, 아니면 None을 돌려주고 호출한 쪽이 전사를 맡는다.
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return pending
+        self._inflight[key] = asyncio.get_running_loop().create_future()
+        return None
+
+    def release(self, key: str) -> None:
+        # 전사를 맡은 쪽이 결과 없이 끝나면 기다리던 요청이 직접 전사하도록 풀어준다.
+        pending = self._inflight.pop(key, None)
+        if pending is not None and not pending.done():
+            pending.set_result(None)
+
+    async def put(self, key: str, text: str) -> None:
+        self._remember(key, text)
+        pending = self._inflight.pop(key, None)
+        if pending is not None and not pending.done():
+            pending.set_result(text)
+        if self.db_enabled and self._session_factory is not None:
+            await self._store(self._session_factory, key, text)
+
+    def _remember(self, key: str, text: str) -> None:
+        if self.max_entries == 0:
+            return
+        self._entries[key] = text
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _store(self, session_factory: async_sessionmaker[AsyncSession], key: str, text: str) -> None:
+        try:
+            async with session_factory() as db:
+                # 다른 워커가 같은 청크를 먼저 저장했거나 만료된 행이 남아 있어도 upsert 한 번으로 끝낸다.
+                await upsert_transcription_cache_entry(db, key, text)
+                await db.commit()
+                self._db_writes += 1
+                if self._db_writes % TRANSCRIPTION_CACHE_PRUNE_EVERY == 0:
+                    await delete_transcription_cache_entries_before(db, datetime.now(UTC) - self.db_ttl)
+                    await db.commit()
+        except Exception as exc:
+            logger.warning("transcription cache write failed error=%s", exc)
+
+
+transcription_cache = TranscriptionCache()
@@ -0,0 +1,278 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import IO
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.settings import (
+    TRANSCRIPTION_MAX_ATTEMPTS,
+    TRANSCRIPTION_QUEUE_SIZE,
+    TRANSCRIPTION_RETRY_BASE_MS,
+    TRANSCRIPTION_WORKER_COUNT,
+)
+from app.service.ai_quota_service import AiQuotaReservation, release_ai_quota, settle_ai_quota
+from app.service.ai_service import TranscriptionResult, transcribe_audio
+from app.service.auth_service import AuthUser
+from app.service.domain import DomainError
+from app.service.minutes_room_service import MinutesRoomMessage, minutes_room_hub
+from app.service.reservation_service import MinutesTranscriptChunkResult, append_minutes_transcript_chunk
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_TRANSCRIPTION_ERROR_CODES = frozenset({"UPSTREAM_UNAVAILABLE"})
+
+
+@dataclass(slots=True)
+class TranscriptionJob:
+    reservation_id: str
+    seq: int
+    holder: AuthUser
+    quota: AiQuotaReservation
+    audio: IO[bytes]
+    audio_size: int
+    mime_type: str | None
+    previous_text: str | None
+    paragraph_break: bool
+
+
+@dataclass(frozen=True, slots=True)
+class SubmittedTranscriptionJob:
+    reservation_id: str
+    seq: int
+    pending: int
+
+
+@dataclass(slots=True)
+class _ReservationJobs:
+    next_seq: int = 1
+    next_commit_seq: int = 1
+    # 먼저 끝났지만 앞 번호가 아직 안 끝나 반영을 기다리는 결과
+    finished: dict[int, tuple[TranscriptionJob, TranscriptionResult | DomainError]] = field(default_factory=dict)
+    commit_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class TranscriptionJobQueue:
+    # 청크 전사를 요청과 분리해 워커 수만큼만 동시에 처리하고, 결과는 예약별 제출 순서대로 전사에 반영한다.
+    # 접수 번호와 반영 순서는 프로세스 메모리에만 있으므로, 서버는 워커 프로세스 하나로 띄워야 순서가 보장된다.
+    def __init__(
+        self,
+        worker_count: int = TRANSCRIPTION_WORKER_COUNT,
+        max_pending: int = TRANSCRIPTION_QUEUE_SIZE,
+        max_attempts: int = TRANSCRIPTION_MAX_ATTEMPTS,
+        retry_base_seconds: float = TRANSCRIPTION_RETRY_BASE_MS / 1000,
+    ) -> None:
+        self.worker_count = max(1, worker_count)
+        self.max_pending = max(1, max_pending)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_seconds = retry_base_seconds
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._queue: asyncio.Queue[TranscriptionJob] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._reservations: dict[str, _ReservationJobs] = {}
+
+    async def start(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+        if self._workers:
+            return
+        queue: asyncio.Queue[TranscriptionJob] = asyncio.Queue(maxsize=self.max_pending)
+        self._queue = queue
+        self._workers = [asyncio.create_task(self._run(queue)) for _ in range(self.worker_count)]
+
+    async def stop(self) -> None:
+        workers = self._workers
+        self._workers = []
+        for worker in workers:
+            worker.cancel()
+        for worker in workers:
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        queue = self._queue
+        self._queue = None
+        while queue is not None and not queue.empty():
+            job = queue.get_nowait()
+            job.audio.close()
+            release_ai_quota(job.quota)
+        self._reservations.clear()
+
+    def submit(
+        self,
+        reservation_id: str,
+        holder: AuthUser,
+        quota: AiQuotaReservation,
+        audio: IO[bytes],
+        audio_size: int,
+        mime_type: str | None,
+        previous_text: str | None,
+        paragraph_break: bool,
+    ) -> SubmittedTranscriptionJob | DomainError:
+        # 성공하면 audio와 한도 예약은 큐가 닫고 정산한다. 실패하면 호출한 쪽이 정리한다.
+        if self._queue is None:
+            return DomainError(code="UNAVAILABLE", message="전사 작업을 처리할 수 없습니다.")
+        if self._queue.full():
+            return DomainError(code="UNAVAILABLE", message="전사 요청이 밀려 있습니다. 잠시 후 다시 시도해주세요.")
+        jobs = self._reservations.setdefault(reservation_id, _ReservationJobs())
+        job = TranscriptionJob(
+            reservation_id=reservation_id,
+            seq=jobs.next_seq,
+            holder=holder,
+            quota=quota,
+            audio=audio,
+            audio_size=audio_size,
+            mime_type=mime_type,
+            previous_text=previous_text,
+            paragraph_break=paragraph_break,
+        )
+        jobs.next_seq += 1
+        self._queue.put_nowait(job)
+        return SubmittedTranscriptionJob(
+            reservation_id=reservation_id,
+            seq=job.seq,
+            pending=jobs.next_seq - jobs.next_commit_seq,
+        )
+
+    def pending_count(self, reservation_id: str) -> int:
+        jobs = self._reservations.get(reservation_id)
+        if jobs is None:
+            return 0
+        return jobs.next_seq - jobs.next_commit_seq
+
+    async def _run(self, queue: asyncio.Queue[TranscriptionJob]) -> None:
+        while True:
+            job = await queue.get()
+            try:
+                result = await self._transcribe_with_retry(job)
+            except Exception:
+                # 예외 내용은 방 전체에 알리지 않고 로그에만 남긴다.
+                logger.exception(
+                    "transcription job failed reservation_id=%s seq=%s",
+                    job.reservation_id,
+                    job.seq,
+                )
+                result = DomainError(
+                    code="UPSTREAM_UNAVAILABLE",
+                    message="전사에 실패했습니다. 잠시 후 다시 시도해주세요.",
+                )
+            finally:
+                job.audio.close()
+            try:
+                await self._finish(job, result)
+            finally:
+                queue.task_done()
+
+    async def _transcribe_with_retry(self, job: TranscriptionJob) -> TranscriptionResult | DomainError:
+        attempt = 1
+        while True:
+            job.audio.seek(0)
+            result = await transcribe_audio(job.audio, job.audio_size, job.mime_type, job.previous_text)
+            if not isinstance(result, DomainError) or result.code not in RETRYABLE_TRANSCRIPTION_ERROR_CODES:
+                return result
+            if attempt >= self.max_attempts:
+                return result
+            delay = self.retry_base_seconds * 2 ** (attempt - 1)
+            logger.info(
+                "transcription job retry reservation_id=%s seq=%s attempt=%s delay_s=%.2f",
+                job.reservation_id,
+                job.seq,
+                attempt,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _finish(self, job: TranscriptionJob, result: TranscriptionResult | DomainError) -> None:
+        jobs = self._reservations.get(job.reservation_id)
+        if jobs is None:
+            return
+        async with jobs.commit_lock:
+            jobs.finished[job.seq] = (job, result)
+            # 앞 번호가 끝날 때까지 기다렸다가, 이어지는 번호까지 한 번에 순서대로 반영한다.
+            while jobs.next_commit_seq in jobs.finished:
+                ready_job, ready_result = jobs.finished.pop(jobs.next_commit_seq)
+                jobs.next_commit_seq += 1
+                try:
+                    await self._commit(ready_job, ready_result)
+                except Exception as exc:
+                    release_ai_quota(ready_job.quota)
+                    # 반영 하나가 실패해도 뒤 번호가 막히지 않게 넘어간다.
+                    logger.warning(
+                        "transcription commit failed reservation_id=%s seq=%s error=%s",
+                        ready_job.reservation_id,
+                        ready_job.seq,
+                        exc,
+                    )
+                    failed = DomainError(code="INVALID_ARGUMENT", message="전사 결과를 반영하지 못했습니다.")
+                    minutes_room_hub.broadcast(ready_job.reservation_id, _job_failed_message(ready_job, failed))
+            if jobs.next_commit_seq == jobs.next_seq:
+                self._reservations.pop(job.reservation_id, None)
+
+    async def _commit(self, job: TranscriptionJob, result: TranscriptionResult | DomainError) -> None:
+        if isinstance(result, DomainError):
+            release_ai_quota(job.quota)
+            minutes_room_hub.broadcast(job.reservation_id, _job_failed_message(job, result))
+            return
+        if self._session_factory is None:
+            release_ai_quota(job.quota)
+            return
+        async with self._session_factory() as db:
+            if not result.text:
+                await settle_ai_quota(job.quota, result.usd_cost, db)
+                minutes_room_hub.broadcast(job.reservation_id, _job_done_message(job, None))
+                return
+            # 녹음 중에 접수한 작업이므로 그 사이 녹음이 끝났어도 결과를 붙이고, 붙인 뒤에만 비용을 정산한다.
+            chunk = await append_minutes_transcript_chunk(
+                reservation_id=job.reservation_id,
+                holder=job.holder,
+                text=result.text,
+                db=db,
+                separator="\n\n" if job.paragraph_break else "\n",
+                accept_after_stop=True,
+            )
+            if isinstance(chunk, DomainError):
+                release_ai_quota(job.quota)
+                minutes_room_hub.broadcast(job.reservation_id, _job_failed_message(job, chunk))
+                return
+            await settle_ai_quota(job.quota, result.usd_cost, db)
+        minutes_room_hub.broadcast(job.reservation_id, _transcript_chunk_message(chunk))
+        minutes_room_hub.broadcast(job.reservation_id, _job_done_message(job, chunk))
+
+
+def _transcript_chunk_message(chunk: MinutesTranscriptChunkResult) -> MinutesRoomMessage:
+    return {
+        "type": "transcript_chunk",
+        "chunk": {
+            "reservation_id": chunk.reservation_id,
+            "seq": chunk.seq,
+            "text": chunk.text,
+            "created_at": chunk.created_at.isoformat(),
+        },
+    }
+
+
+def _job_done_message(job: TranscriptionJob, chunk: MinutesTranscriptChunkResult | None) -> MinutesRoomMessage:
+    return {
+        "type": "transcription",
+        "job": {
+            "seq": job.seq,
+            "user_id": job.holder.id,
+            "status": "done",
+            "transcript_seq": chunk.seq if chunk is not None else None,
+        },
+    }
+
+
+def _job_failed_message(job: TranscriptionJob, error: DomainError) -> MinutesRoomMessage:
+    return {
+        "type": "transcription",
+        "job": {
+            "seq": job.seq,
+            "user_id": job.holder.id,
+            "status": "failed",
+            "error": {"code": error.code, "message": error.message},
+        },
+    }
+
+
+transcription_job_queue = TranscriptionJobQueue()
@@ -0,0 +1,60 @@
+import io
+import math
+import sys
+import wave
+from array import array
+from typing import IO
+
+from app.core.settings import AI_SILENCE_FRAME_MS, AI_SILENCE_MIN_VOICED_MS, AI_SILENCE_RMS_THRESHOLD
+
+# 큰 파일도 한 번에 읽지 않도록 프레임 여러 개씩 묶어 읽는다.
+_FRAMES_PER_BLOCK = 64
+
+
+def is_silent_wav(
+    audio: bytes | IO[bytes],
+    rms_threshold: int = AI_SILENCE_RMS_THRESHOLD,
+    frame_ms: int = AI_SILENCE_FRAME_MS,
+    min_voiced_ms: int = AI_SILENCE_MIN_VOICED_MS,
+) -> bool:
+    # 판단할 수 없는 형식(16비트 PCM이 아닌 WAV, 깨진 헤더)은 무음으로 보지 않고 그대로 전사한다.
+    if rms_threshold <= 0:
+        return False
+    source = io.BytesIO(audio) if isinstance(audio, bytes) else audio
+    frame_ms = max(1, frame_ms)
+    required_frames = max(1, math.ceil(min_voiced_ms / frame_ms))
+    source.seek(0)
+    try:
+        with wave.open(source, "rb") as reader:
+            if reader.getsampwidth() != 2 or reader.getcomptype() != "NONE":
+                return False
+            frame_length = max(1, reader.getframerate() * frame_ms // 1000)
+            frame_samples = frame_length * reader.getnchannels()
+            voiced_frames = 0
+            while pcm := reader.readframes(frame_length * _FRAMES_PER_BLOCK):
+                voiced_frames += count_voiced_frames(pcm, frame_samples, rms_threshold)
+                # 말소리가 충분히 나오면 나머지는 읽지 않는다.
+                if voiced_frames >= required_frames:
+                    return False
+    except (wave.Error, EOFError):
+        return False
+    finally:
+        source.seek(0)
+    return True
+
+
+def count_voiced_frames(pcm: bytes, frame_samples: int, rms_threshold: int) -> int:
+    # 16비트 리틀엔디언 PCM을 frame_samples개씩 나눠 RMS가 기준 이상인 프레임 수를 센다. 끝의 자투리는 버린다.
+    usable_samples = len(pcm) // 2 // frame_samples * frame_samples
+    if usable_samples == 0:
+        return 0
+    samples_array = array("h")
+    samples_array.frombytes(pcm[: usable_samples * 2])
+    if sys.byteorder == "big":
+        samples_array.byteswap()
+    min_sum = rms_threshold * rms_threshold * frame_samples
+    voiced = 0
+    for start in range(0, usable_samples, frame_samples):
+        if sum(sample * sample for sample in samples_array[start : start + frame_samples]) >= min_sum:
+            voiced += 1
+    return voiced
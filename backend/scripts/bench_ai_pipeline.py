@@ -0,0 +1,322 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+
+from scripts.bench_reservation_events import (
+    BENCH_EMAIL,
+    BENCH_PASSWORD,
+    percentile,
+    prepare_database,
+    spawn_server,
+    wait_for_server,
+)
+
+REQUEST_KINDS = ("transcribe", "summary")
+BENCH_TRANSCRIPT = "\n".join(f"화자{index % 3 + 1}: 벤치마크 발언 {index}번입니다." for index in range(40))
+
+
+@dataclass(frozen=True, slots=True)
+class RequestSample:
+    kind: str
+    status: int
+    error_code: str | None
+    latency_ms: float
+    # 스트리밍 요약에서 첫 항목을 받기까지 걸린 시간
+    first_item_ms: float | None = None
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="AI 전사/회의록 생성 파이프라인 부하 테스트")
+    parser.add_argument("--base-url", default="http://127.0.0.1:9394", help="대상 서버 주소")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시에 보내는 AI 요청 수")
+    parser.add_argument("--duration", type=float, default=20.0, help="부하를 거는 시간(초)")
+    parser.add_argument("--baseline-requests", type=int, default=20, help="동시성 1로 먼저 보내 기준 지연을 잴 요청 수")
+    parser.add_argument("--summary-ratio", type=float, default=0.2, help="전체 요청 중 회의록 생성 요청 비율")
+    parser.add_argument("--stream", action="store_true", help="회의록 생성을 스트리밍 API로 보냄")
+    parser.add_argument("--chunk-bytes", type=int, default=16000, help="전사 요청 한 번에 보내는 오디오 크기")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--email", default=BENCH_EMAIL)
+    parser.add_argument("--password", default=BENCH_PASSWORD)
+    parser.add_argument("--spawn", action="store_true", help="AI_PROVIDER=fake로 uvicorn 서버를 직접 띄워서 측정")
+    parser.add_argument(
+        "--database-url",
+        default="sqlite+aiosqlite:///./bench-ai.db",
+        help="--spawn 시 사용할 DB. SQLite는 스키마와 벤치 계정을 자동으로 만든다.",
+    )
+    parser.add_argument("--fake-latency-ms", type=int, default=200, help="--spawn 시 대역의 응답 지연")
+    parser.add_argument("--fake-error-rate", type=float, default=0.0, help="--spawn 시 대역의 실패 비율")
+    parser.add_argument(
+        "--global-limit-usd",
+        default="1000.0000",
+        help="--spawn 시 전사 월 한도. 낮추면 한도 소진 구간의 경합을 측정한다.",
+    )
+    parser.add_argument("--json", dest="json_path", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--max-p99-ms", type=float, help="전체 p99 지연이 이 값을 넘으면 종료 코드 1")
+    parser.add_argument("--max-error-rate", type=float, help="한도 초과를 뺀 실패 비율이 이 값을 넘으면 종료 코드 1")
+    return parser.parse_args(argv)
+
+
+async def send_request(
+    client: httpx.AsyncClient,
+    kind: str,
+    chunk_bytes: int,
+    stream: bool,
+) -> RequestSample:
+    started = time.monotonic()
+    first_item_ms: float | None = None
+    try:
+        if kind == "transcribe":
+            # 같은 오디오는 전사 캐시에 걸리므로 매번 다른 바이트를 보낸다.
+            response = await client.post(
+                "/api/ai/transcribe-audio",
+                content=os.urandom(chunk_bytes),
+                headers={"Content-Type": "audio/webm"},
+            )
+            return _sample(kind, response.status_code, _error_code(response), started)
+        if not stream:
+            response = await client.post("/api/ai/suggest-minutes", json={"transcript": BENCH_TRANSCRIPT})
+            return _sample(kind, response.status_code, _error_code(response), started)
+        error_code: str | None = None
+        async with client.stream(
+            "POST",
+            "/api/ai/suggest-minutes/stream",
+            json={"transcript": BENCH_TRANSCRIPT},
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                return _sample(kind, response.status_code, _error_code(response), started)
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                event = json.loads(line)
+                if event["type"] == "item" and first_item_ms is None:
+                    first_item_ms = (time.monotonic() - started) * 1000
+                elif event["type"] == "error":
+                    error_code = str(event.get("code"))
+        return _sample(kind, 200, error_code, started, first_item_ms)
+    except httpx.HTTPError as exc:
+        return _sample(kind, 0, type(exc).__name__, started)
+
+
+def _sample(
+    kind: str,
+    status: int,
+    error_code: str | None,
+    started: float,
+    first_item_ms: float | None = None,
+) -> RequestSample:
+    return RequestSample(
+        kind=kind,
+        status=status,
+        error_code=error_code,
+        latency_ms=(time.monotonic() - started) * 1000,
+        first_item_ms=first_item_ms,
+    )
+
+
+def _error_code(response: httpx.Response) -> str | None:
+    if response.status_code < 400:
+        return None
+    try:
+        return str(response.json()["error"]["code"])
+    except (ValueError, KeyError, TypeError):
+        return f"HTTP {response.status_code}"
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    concurrency: int,
+    duration: float,
+    summary_ratio: float,
+    chunk_bytes: int,
+    stream: bool,
+    seed: int,
+) -> tuple[list[RequestSample], float]:
+    samples: list[RequestSample] = []
+    picker = random.Random(seed)
+    started = time.monotonic()
+    deadline = started + duration
+
+    async def worker() -> None:
+        while time.monotonic() < deadline:
+            kind = "summary" if picker.random() < summary_ratio else "transcribe"
+            samples.append(await send_request(client, kind, chunk_bytes, stream))
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return samples, time.monotonic() - started
+
+
+async def run_baseline(
+    client: httpx.AsyncClient,
+    count: int,
+    chunk_bytes: int,
+    stream: bool,
+) -> list[RequestSample]:
+    # 경합이 없을 때의 서버 처리 시간을 알기 위해 요청을 하나씩 보낸다.
+    samples: list[RequestSample] = []
+    for index in range(count):
+        kind = REQUEST_KINDS[index % len(REQUEST_KINDS)]
+        samples.append(await send_request(client, kind, chunk_bytes, stream))
+    return samples
+
+
+def _latency_summary(values: list[float]) -> dict[str, float | None]:
+    values = sorted(values)
+    return {
+        "p50": percentile(values, 0.5),
+        "p90": percentile(values, 0.9),
+        "p99": percentile(values, 0.99),
+        "max": percentile(values, 1.0),
+    }
+
+
+def summarize_samples(
+    samples: list[RequestSample],
+    elapsed: float,
+    provider_latency_ms: float | None = None,
+    baseline: list[RequestSample] | None = None,
+) -> dict[str, Any]:
+    ok = [sample for sample in samples if sample.status == 200 and sample.error_code is None]
+    quota_rejected = sum(1 for sample in samples if sample.error_code == "QUOTA_EXCEEDED")
+    failed = len(samples) - len(ok) - quota_rejected
+    error_codes: dict[str, int] = {}
+    for sample in samples:
+        if sample.error_code is not None:
+            error_codes[sample.error_code] = error_codes.get(sample.error_code, 0) + 1
+
+    report: dict[str, Any] = {
+        "requests": len(samples),
+        "ok": len(ok),
+        "quota_rejected": quota_rejected,
+        "failed": failed,
+        "error_rate": round(failed / len(samples), 4) if samples else 0.0,
+        "error_codes": error_codes,
+        "throughput_rps": round(len(ok) / elapsed, 2) if elapsed > 0 else None,
+        "latency_ms": _latency_summary([sample.latency_ms for sample in ok]),
+        "by_kind": {},
+        "overhead_ms": None,
+        "contention_ratio": None,
+    }
+    for kind in REQUEST_KINDS:
+        kind_ok = [sample for sample in ok if sample.kind == kind]
+        report["by_kind"][kind] = {
+            "ok": len(kind_ok),
+            "latency_ms": _latency_summary([sample.latency_ms for sample in kind_ok]),
+            "first_item_ms": _latency_summary(
+                [sample.first_item_ms for sample in kind_ok if sample.first_item_ms is not None]
+            ),
+        }
+
+    if provider_latency_ms is None:
+        return report
+    # 대역 응답 지연을 뺀 나머지가 인증, 한도 예약/정산, 원장 기록 등 서버 쪽 처리 시간이다.
+    # 동시성 1일 때보다 이 값이 크게 늘면 한도 처리나 DB에서 요청끼리 기다리고 있다는 뜻이다.
+    overhead = _latency_summary([max(0.0, sample.latency_ms - provider_latency_ms) for sample in ok])
+    report["overhead_ms"] = overhead
+    baseline_ok = [sample for sample in baseline or [] if sample.status == 200 and sample.error_code is None]
+    baseline_p50 = percentile(sorted(max(0.0, sample.latency_ms - provider_latency_ms) for sample in baseline_ok), 0.5)
+    if baseline_p50 and overhead["p50"] is not None:
+        report["baseline_overhead_ms"] = baseline_p50
+        report["contention_ratio"] = round(overhead["p50"] / baseline_p50, 2)
+    return report
+
+
+async def run_bench(args: argparse.Namespace) -> dict[str, Any]:
+    server: subprocess.Popen[bytes] | None = None
+    if args.spawn:
+        await prepare_database(args.database_url)
+        server = spawn_server(
+            args.base_url,
+            args.database_url,
+            {
+                "AI_PROVIDER": "fake",
+                "FAKE_AI_LATENCY_MS": str(args.fake_latency_ms),
+                "FAKE_AI_ERROR_RATE": str(args.fake_error_rate),
+                "AI_GLOBAL_MONTHLY_LIMIT_USD": args.global_limit_usd,
+            },
+        )
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    timeout = httpx.Timeout(120.0)
+    try:
+        async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=timeout) as client:
+            await wait_for_server(client, timeout=30.0)
+            login = await client.post("/api/auth/login", json={"email": args.email, "password": args.password})
+            login.raise_for_status()
+            baseline = await run_baseline(client, args.baseline_requests, args.chunk_bytes, args.stream)
+            samples, elapsed = await run_load(
+                client,
+                args.concurrency,
+                args.duration,
+                args.summary_ratio,
+                args.chunk_bytes,
+                args.stream,
+                args.seed,
+            )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    # 직접 띄운 대역 서버만 응답 지연을 알고 있으므로 그때만 서버 처리 시간을 따로 계산한다.
+    provider_latency_ms = float(args.fake_latency_ms) if args.spawn else None
+    report = summarize_samples(samples, elapsed, provider_latency_ms, baseline)
+    report["concurrency"] = args.concurrency
+    report["elapsed_seconds"] = round(elapsed, 3)
+    return report
+
+
+def print_report(report: dict[str, Any]) -> None:
+    latency = report["latency_ms"]
+    print(
+        f"requests      {report['requests']} sent, {report['ok']} ok, {report['quota_rejected']} quota rejected, "
+        f"{report['failed']} failed (concurrency {report['concurrency']}, {report['elapsed_seconds']}s)"
+    )
+    if report["error_codes"]:
+        print(f"errors        {report['error_codes']}")
+    print(f"throughput    {report['throughput_rps']} req/s")
+    print(f"latency ms    p50={latency['p50']} p90={latency['p90']} p99={latency['p99']} max={latency['max']}")
+    for kind, summary in report["by_kind"].items():
+        kind_latency = summary["latency_ms"]
+        line = f"  {kind:<11} {summary['ok']} ok, p50={kind_latency['p50']} p99={kind_latency['p99']}"
+        if summary["first_item_ms"]["p50"] is not None:
+            line += f", first item p50={summary['first_item_ms']['p50']}"
+        print(line)
+    overhead = report["overhead_ms"]
+    if overhead is None:
+        print("overhead      --spawn으로 대역 서버를 띄우면 서버 처리 시간과 경합 비율을 함께 측정합니다.")
+        return
+    print(f"overhead ms   p50={overhead['p50']} p99={overhead['p99']} max={overhead['max']}")
+    if report["contention_ratio"] is not None:
+        print(f"contention    {report['contention_ratio']}x of baseline {report['baseline_overhead_ms']}ms")
+
+
+def exceeds_thresholds(report: dict[str, Any], args: argparse.Namespace) -> bool:
+    p99 = report["latency_ms"]["p99"]
+    if args.max_p99_ms is not None and (p99 is None or p99 > args.max_p99_ms):
+        return True
+    return args.max_error_rate is not None and report["error_rate"] > args.max_error_rate
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    report = asyncio.run(run_bench(args))
+    print_report(report)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    return 1 if exceeds_thresholds(report, args) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,581 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import resource
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+
+BACKEND_DIR = Path(__file__).parent.parent
+BENCH_USER_ID = "bench"
+BENCH_EMAIL = "bench@ecminer.com"
+BENCH_PASSWORD = "bench-password"
+BENCH_ROOMS = (("A", "회의실", 30), ("B", "회의테이블", 6))
+# 예약 시간이 실제 예약과 겹치지 않도록 먼 미래에 만든다.
+BENCH_SLOT_BASE = datetime(2099, 1, 1, tzinfo=UTC)
+BENCH_SLOT_MINUTES = 30
+
+
+@dataclass(slots=True)
+class SubscriberStats:
+    connected_at: float | None = None
+    # (reservation_id, action) 별 최초 수신 시각
+    arrivals: dict[tuple[str, str], float] = field(default_factory=dict)
+    reservation_ids: set[str] = field(default_factory=set)
+    frames: int = 0
+    resyncs: int = 0
+    resets: int = 0
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class Mutation:
+    reservation_id: str
+    action: str
+    sent_at: float
+    completed_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class ProcessSample:
+    at: float
+    rss_bytes: int
+    cpu_seconds: float
+
+
+@dataclass(slots=True)
+class BenchCounters:
+    connected: int = 0
+    failed_mutations: int = 0
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="예약 이벤트 SSE 팬아웃 부하 테스트")
+    parser.add_argument("--base-url", default="http://127.0.0.1:9393", help="대상 서버 주소")
+    parser.add_argument("--subscribers", type=int, default=1000, help="동시 SSE 구독자 수")
+    parser.add_argument("--client-processes", type=int, default=4, help="구독 연결을 나눠 여는 프로세스 수")
+    parser.add_argument("--connect-concurrency", type=int, default=200, help="동시에 여는 연결 수")
+    parser.add_argument("--connect-timeout", type=float, default=60.0, help="전체 구독자 연결 대기 시간(초)")
+    parser.add_argument("--rate", type=float, default=5.0, help="초당 예약 변경 횟수")
+    parser.add_argument("--duration", type=float, default=30.0, help="예약 변경을 보내는 시간(초)")
+    parser.add_argument("--drain", type=float, default=3.0, help="변경 종료 후 이벤트 수신 대기 시간(초)")
+    parser.add_argument("--email", default=BENCH_EMAIL)
+    parser.add_argument("--password", default=BENCH_PASSWORD)
+    parser.add_argument("--server-pid", type=int, help="메모리/CPU를 측정할 서버 프로세스 PID")
+    parser.add_argument("--spawn", action="store_true", help="uvicorn 서버를 직접 띄워서 측정")
+    parser.add_argument(
+        "--database-url",
+        default="sqlite+aiosqlite:///./bench.db",
+        help="--spawn 시 사용할 DB. SQLite는 스키마와 벤치 계정을 자동으로 만든다.",
+    )
+    parser.add_argument("--json", dest="json_path", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--max-p99-ms", type=float, help="p99 지연이 이 값을 넘으면 종료 코드 1")
+    parser.add_argument("--max-dropped", type=int, help="유실 이벤트가 이 값을 넘으면 종료 코드 1")
+    return parser.parse_args(argv)
+
+
+async def prepare_database(database_url: str) -> None:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    from app.infra import (  # noqa: F401
+        ai_usage_ledger,
+        global_ai_quota,
+        minutes_live_state,
+        minutes_lock,
+        minutes_transcript_archive,
+        minutes_transcript_chunk,
+        reservation,
+        reservation_attendee,
+        reservation_label,
+        room,
+        timetable,
+        transcription_cache,
+        user,
+        user_ai_quota,
+    )
+    from app.infra.db import Base
+    from app.infra.reservation_label import ReservationLabel
+    from app.infra.room import Room
+    from app.infra.user import User
+    from app.service.auth_service import hash_password
+
+    engine = create_async_engine(database_url)
+    try:
+        # PostgreSQL은 alembic 마이그레이션이 끝난 DB를 전제로 하고, SQLite만 스키마를 만든다.
+        if engine.dialect.name == "sqlite":
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+
+        session_local = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with session_local() as session:
+            for room_id, name, capacity in BENCH_ROOMS:
+                if await session.get(Room, room_id) is None:
+                    session.add(Room(id=room_id, name=name, capacity=capacity))
+            if await session.get(ReservationLabel, "없음") is None:
+                session.add(ReservationLabel(name="없음"))
+            if await session.get(User, BENCH_USER_ID) is None:
+                session.add(
+                    User(
+                        id=BENCH_USER_ID,
+                        name="bench",
+                        email=BENCH_EMAIL,
+                        department="벤치마크",
+                        is_admin=True,
+                        password_hash=hash_password(BENCH_PASSWORD),
+                    )
+                )
+            await session.commit()
+    finally:
+        await engine.dispose()
+
+
+def spawn_server(
+    base_url: str,
+    database_url: str,
+    extra_env: dict[str, str] | None = None,
+) -> subprocess.Popen[bytes]:
+    url = httpx.URL(base_url)
+    env = {**os.environ, "DATABASE_URL": database_url, **(extra_env or {})}
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            url.host,
+            "--port",
+            str(url.port or 80),
+            "--log-level",
+            "warning",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+
+
+async def wait_for_server(client: httpx.AsyncClient, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            response = await client.get("/api/release")
+            if response.status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        if time.monotonic() > deadline:
+            raise RuntimeError("서버가 응답하지 않습니다.")
+        await asyncio.sleep(0.2)
+
+
+def read_process_sample(pid: int | None) -> ProcessSample | None:
+    # /proc 기반이라 리눅스에서만 측정한다.
+    if pid is None:
+        return None
+    try:
+        status_text = Path(f"/proc/{pid}/status").read_text()
+        stat_fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    rss_kb = next((int(line.split()[1]) for line in status_text.splitlines() if line.startswith("VmRSS:")), 0)
+    ticks = os.sysconf("SC_CLK_TCK")
+    # utime, stime은 stat의 14, 15번째 필드이다.
+    cpu_seconds = (int(stat_fields[11]) + int(stat_fields[12])) / ticks
+    return ProcessSample(at=time.monotonic(), rss_bytes=rss_kb * 1024, cpu_seconds=cpu_seconds)
+
+
+async def run_subscriber(
+    client: httpx.AsyncClient,
+    stats: SubscriberStats,
+    counters: BenchCounters,
+    connect_slots: asyncio.Semaphore,
+) -> None:
+    released = False
+    await connect_slots.acquire()
+    try:
+        async with client.stream("GET", "/api/reservations/events") as response:
+            if response.status_code != 200:
+                stats.error = f"HTTP {response.status_code}"
+                return
+            event_name = "message"
+            async for line in response.aiter_lines():
+                if line.startswith("id:") and stats.connected_at is None:
+                    # 연결 직후 보내는 기준 id를 받으면 구독이 등록된 것으로 본다.
+                    stats.connected_at = time.monotonic()
+                    counters.connected += 1
+                    connect_slots.release()
+                    released = True
+                elif line.startswith("event:"):
+                    event_name = line[6:].strip()
+                elif line.startswith("data:"):
+                    record_frame(stats, event_name, line[5:].strip(), time.monotonic())
+                elif line == "":
+                    event_name = "message"
+    except httpx.HTTPError as exc:
+        stats.error = type(exc).__name__
+    finally:
+        if not released:
+            connect_slots.release()
+
+
+def record_frame(stats: SubscriberStats, event_name: str, data: str, received_at: float) -> None:
+    stats.frames += 1
+    if event_name == "resync":
+        stats.resyncs += 1
+        return
+    if event_name == "reset":
+        stats.resets += 1
+        return
+    if event_name not in {"reservation", "reservations"}:
+        return
+    payload: Any = json.loads(data)
+    events = payload if isinstance(payload, list) else [payload]
+    for event in events:
+        reservation_id = str(event["reservation_id"])
+        stats.reservation_ids.add(reservation_id)
+        stats.arrivals.setdefault((reservation_id, str(event["action"])), received_at)
+
+
+async def run_mutation_chain(
+    client: httpx.AsyncClient,
+    index: int,
+    mutations: list[Mutation],
+    counters: BenchCounters,
+) -> None:
+    # 생성 → 수정 → 삭제를 한 묶음으로 보낸다.
+    room_id = BENCH_ROOMS[index % len(BENCH_ROOMS)][0]
+    start_at = BENCH_SLOT_BASE + timedelta(minutes=BENCH_SLOT_MINUTES * index)
+    end_at = start_at + timedelta(minutes=BENCH_SLOT_MINUTES)
+    slot = {"start_at": start_at.isoformat(), "end_at": end_at.isoformat()}
+
+    sent_at = time.monotonic()
+    payload = {"room_id": room_id, "title": f"bench-{index}", **slot}
+    response = await _send_mutation(client, "POST", "/api/reservations", payload, 201, counters)
+    if response is None:
+        return
+    reservation_id = str(response.json()["id"])
+    mutations.append(Mutation(reservation_id, "created", sent_at, time.monotonic()))
+
+    sent_at = time.monotonic()
+    payload = {"title": f"bench-{index}-updated", **slot}
+    if await _send_mutation(client, "PATCH", f"/api/reservations/{reservation_id}", payload, 200, counters):
+        mutations.append(Mutation(reservation_id, "updated", sent_at, time.monotonic()))
+
+    sent_at = time.monotonic()
+    if await _send_mutation(client, "DELETE", f"/api/reservations/{reservation_id}", None, 204, counters):
+        mutations.append(Mutation(reservation_id, "deleted", sent_at, time.monotonic()))
+
+
+async def _send_mutation(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    payload: dict[str, str] | None,
+    expected_status: int,
+    counters: BenchCounters,
+) -> httpx.Response | None:
+    try:
+        response = await client.request(method, url, json=payload)
+    except httpx.HTTPError:
+        counters.failed_mutations += 1
+        return None
+    if response.status_code != expected_status:
+        counters.failed_mutations += 1
+        return None
+    return response
+
+
+async def run_mutations(
+    client: httpx.AsyncClient,
+    rate: float,
+    duration: float,
+    counters: BenchCounters,
+) -> list[Mutation]:
+    mutations: list[Mutation] = []
+    chain_interval = 3 / rate
+    started = time.monotonic()
+    chains: list[asyncio.Task[None]] = []
+    index = 0
+    while time.monotonic() - started < duration:
+        chains.append(asyncio.create_task(run_mutation_chain(client, index, mutations, counters)))
+        index += 1
+        await asyncio.sleep(max(0.0, started + index * chain_interval - time.monotonic()))
+    await asyncio.gather(*chains)
+    return mutations
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float | None:
+    if not sorted_values:
+        return None
+    position = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return round(sorted_values[position], 3)
+
+
+def summarize_delivery(mutations: list[Mutation], subscribers: list[SubscriberStats]) -> dict[str, Any]:
+    latencies: list[float] = []
+    delivered = coalesced = dropped = 0
+    connected = [stats for stats in subscribers if stats.connected_at is not None]
+    for stats in connected:
+        for mutation in mutations:
+            received_at = stats.arrivals.get((mutation.reservation_id, mutation.action))
+            if received_at is not None:
+                delivered += 1
+                latencies.append((received_at - mutation.sent_at) * 1000)
+            elif mutation.reservation_id in stats.reservation_ids:
+                # 같은 예약의 다른 이벤트로 합쳐져 전달된 경우
+                coalesced += 1
+            else:
+                dropped += 1
+    latencies.sort()
+    request_latencies = sorted((mutation.completed_at - mutation.sent_at) * 1000 for mutation in mutations)
+    return {
+        "subscribers_connected": len(connected),
+        "subscriber_errors": sum(1 for stats in subscribers if stats.error is not None),
+        "mutations": len(mutations),
+        "expected_deliveries": len(mutations) * len(connected),
+        "delivered": delivered,
+        "coalesced": coalesced,
+        "dropped": dropped,
+        "resyncs": sum(stats.resyncs for stats in connected),
+        "resets": sum(stats.resets for stats in connected),
+        "latency_ms": {
+            "p50": percentile(latencies, 0.5),
+            "p90": percentile(latencies, 0.9),
+            "p99": percentile(latencies, 0.99),
+            "max": percentile(latencies, 1.0),
+        },
+        # 변경 요청 자체의 응답 시간. 전달 지연에서 이 값을 빼면 팬아웃 구간만 남는다.
+        "mutation_ms": {
+            "p50": percentile(request_latencies, 0.5),
+            "p99": percentile(request_latencies, 0.99),
+        },
+    }
+
+
+def summarize_process(
+    baseline: ProcessSample | None,
+    connected: ProcessSample | None,
+    finished: ProcessSample | None,
+    subscriber_count: int,
+) -> dict[str, Any] | None:
+    if baseline is None or connected is None or finished is None:
+        return None
+    rss_delta = connected.rss_bytes - baseline.rss_bytes
+    return {
+        "rss_baseline_mb": round(baseline.rss_bytes / 1024 / 1024, 1),
+        "rss_connected_mb": round(connected.rss_bytes / 1024 / 1024, 1),
+        "rss_finished_mb": round(finished.rss_bytes / 1024 / 1024, 1),
+        "rss_per_subscriber_kb": round(rss_delta / 1024 / subscriber_count, 2) if subscriber_count else None,
+        "cpu_percent_connect": _cpu_percent(baseline, connected),
+        "cpu_percent_mutations": _cpu_percent(connected, finished),
+    }
+
+
+def _cpu_percent(start: ProcessSample, end: ProcessSample) -> float | None:
+    elapsed = end.at - start.at
+    if elapsed <= 0:
+        return None
+    return round((end.cpu_seconds - start.cpu_seconds) / elapsed * 100, 1)
+
+
+def raise_open_file_limit(required: int) -> None:
+    # 구독자 수만큼 소켓을 열어야 하므로 soft limit을 가능한 만큼 올린다.
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = hard if hard == resource.RLIM_INFINITY else min(hard, max(soft, required))
+    if target > soft:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+
+
+def subscriber_worker(
+    base_url: str,
+    cookies: dict[str, str],
+    count: int,
+    connect_concurrency: int,
+    connected: Any,
+    stop: Any,
+    results: Any,
+) -> None:
+    # 클라이언트 이벤트 루프 하나가 수천 개 스트림을 파싱하면 그 자체가 병목이 되므로 프로세스로 나눈다.
+    raise_open_file_limit(count + 64)
+    cpu_started, started = _client_cpu_seconds(), time.monotonic()
+    subscribers = asyncio.run(_run_subscribers(base_url, cookies, count, connect_concurrency, connected, stop))
+    cpu_percent = (_client_cpu_seconds() - cpu_started) / max(time.monotonic() - started, 1e-9) * 100
+    results.put((subscribers, cpu_percent))
+
+
+async def _run_subscribers(
+    base_url: str,
+    cookies: dict[str, str],
+    count: int,
+    connect_concurrency: int,
+    connected: Any,
+    stop: Any,
+) -> list[SubscriberStats]:
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    timeout = httpx.Timeout(30.0, read=None)
+    subscribers = [SubscriberStats() for _ in range(count)]
+    async with httpx.AsyncClient(base_url=base_url, cookies=cookies, limits=limits, timeout=timeout) as client:
+        counters = BenchCounters()
+        connect_slots = asyncio.Semaphore(max(1, connect_concurrency))
+        tasks = [asyncio.create_task(run_subscriber(client, stats, counters, connect_slots)) for stats in subscribers]
+        reported = 0
+        while not stop.is_set():
+            if counters.connected != reported:
+                with connected.get_lock():
+                    connected.value += counters.connected - reported
+                reported = counters.connected
+            await asyncio.sleep(0.1)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return subscribers
+
+
+async def run_bench(args: argparse.Namespace) -> dict[str, Any]:
+    server: subprocess.Popen[bytes] | None = None
+    server_pid = args.server_pid
+    if args.spawn:
+        await prepare_database(args.database_url)
+        server = spawn_server(args.base_url, args.database_url)
+        server_pid = server.pid
+
+    # 프로세스 간 시각 비교를 위해 time.monotonic(리눅스 CLOCK_MONOTONIC)을 기준으로 삼는다.
+    context = multiprocessing.get_context("spawn")
+    connected = context.Value("i", 0)
+    stop = context.Event()
+    results = context.Queue()
+    workers: list[Any] = []
+    timeout = httpx.Timeout(30.0, read=None)
+    try:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=timeout) as client:
+            await wait_for_server(client, timeout=30.0)
+            login = await client.post("/api/auth/login", json={"email": args.email, "password": args.password})
+            login.raise_for_status()
+            cookies = dict(client.cookies)
+
+            baseline = read_process_sample(server_pid)
+            connect_started = time.monotonic()
+            process_count = max(1, min(args.client_processes, args.subscribers))
+            per_process = [
+                args.subscribers // process_count + (1 if index < args.subscribers % process_count else 0)
+                for index in range(process_count)
+            ]
+            for count in per_process:
+                worker = context.Process(
+                    target=subscriber_worker,
+                    args=(
+                        args.base_url,
+                        cookies,
+                        count,
+                        max(1, args.connect_concurrency // process_count),
+                        connected,
+                        stop,
+                        results,
+                    ),
+                )
+                worker.start()
+                workers.append(worker)
+            connect_deadline = connect_started + args.connect_timeout
+            while connected.value < args.subscribers and time.monotonic() < connect_deadline:
+                if not any(worker.is_alive() for worker in workers):
+                    break
+                await asyncio.sleep(0.1)
+            connect_seconds = time.monotonic() - connect_started
+            connected_sample = read_process_sample(server_pid)
+
+            counters = BenchCounters()
+            mutations = await run_mutations(client, args.rate, args.duration, counters)
+            await asyncio.sleep(args.drain)
+            finished_sample = read_process_sample(server_pid)
+            stop.set()
+
+            subscribers: list[SubscriberStats] = []
+            client_cpu_percents: list[float] = []
+            for _ in workers:
+                worker_subscribers, cpu_percent = await asyncio.to_thread(results.get, True, 60.0)
+                subscribers.extend(worker_subscribers)
+                client_cpu_percents.append(cpu_percent)
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join(timeout=10)
+            if worker.is_alive():
+                worker.terminate()
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    report = summarize_delivery(mutations, subscribers)
+    report["subscribers_requested"] = args.subscribers
+    report["connect_seconds"] = round(connect_seconds, 3)
+    report["failed_mutations"] = counters.failed_mutations
+    report["process"] = summarize_process(
+        baseline,
+        connected_sample,
+        finished_sample,
+        report["subscribers_connected"],
+    )
+    # 부하 발생 프로세스가 CPU 100%에 가까우면 지연 수치는 서버가 아니라 클라이언트 한계일 수 있다.
+    report["client_cpu_percent_max"] = round(max(client_cpu_percents), 1)
+    return report
+
+
+def _client_cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def print_report(report: dict[str, Any]) -> None:
+    latency = report["latency_ms"]
+    print(
+        f"subscribers   {report['subscribers_connected']}/{report['subscribers_requested']} connected "
+        f"in {report['connect_seconds']}s (errors {report['subscriber_errors']})"
+    )
+    print(f"mutations     {report['mutations']} ok, {report['failed_mutations']} failed")
+    print(
+        f"deliveries    {report['delivered']}/{report['expected_deliveries']} delivered, "
+        f"{report['coalesced']} coalesced, {report['dropped']} dropped, "
+        f"{report['resyncs']} resyncs, {report['resets']} resets"
+    )
+    print(f"latency ms    p50={latency['p50']} p90={latency['p90']} p99={latency['p99']} max={latency['max']}")
+    print(f"mutation ms   p50={report['mutation_ms']['p50']} p99={report['mutation_ms']['p99']}")
+    print(f"client cpu    max {report['client_cpu_percent_max']}% per subscriber process")
+    process = report["process"]
+    if process is None:
+        print("process       --server-pid 또는 --spawn을 지정하면 메모리/CPU를 함께 측정합니다.")
+        return
+    print(
+        f"memory        baseline={process['rss_baseline_mb']}MB connected={process['rss_connected_mb']}MB "
+        f"finished={process['rss_finished_mb']}MB per_subscriber={process['rss_per_subscriber_kb']}KB"
+    )
+    print(f"cpu           connect={process['cpu_percent_connect']}% mutations={process['cpu_percent_mutations']}%")
+
+
+def exceeds_thresholds(report: dict[str, Any], args: argparse.Namespace) -> bool:
+    p99 = report["latency_ms"]["p99"]
+    if args.max_p99_ms is not None and (p99 is None or p99 > args.max_p99_ms):
+        return True
+    return args.max_dropped is not None and report["dropped"] > args.max_dropped
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    report = asyncio.run(run_bench(args))
+    print_report(report)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    return 1 if exceeds_thresholds(report, args) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,17 +7,21 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.pool import StaticPool
 
 from app.infra import (  # noqa: F401
+    ai_usage_ledger,
     global_ai_quota,
     minutes_lock,
+    minutes_transcript_archive,
+    minutes_transcript_chunk,
     reservation,
     reservation_attendee,
     reservation_label,
     room,
     timetable,
+    transcription_cache,
     user,
     user_ai_quota,
 )
-from app.infra.db import Base, get_db_session
+from app.infra.db import Base, get_db_session, get_db_session_factory
 from app.infra.reservation_label import ReservationLabel
 from app.infra.room import Room
 from app.infra.user import User
@@ -78,6 +82,7 @@ def client() -> Iterator[TestClient]:
 
     asyncio.run(setup_db())
     app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_db_session_factory] = lambda: session_local
 
     with TestClient(app) as test_client:
         yield test_client
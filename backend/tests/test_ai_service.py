@@ -1,7 +1,40 @@
+import asyncio
+import base64
+import io
+import json
+import math
+import wave
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from decimal import Decimal
+from typing import IO
 
-from app.service.ai_service import _calc_usd_cost, suggest_minutes_bullets, transcribe_audio_chunk
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from app.infra.db import get_db_session_factory
+from app.infra.openai import FakeAiProvider, OpenAiChatStreamChunk, OpenAiClientHolder, ai_provider
+from app.infra.transcription_cache import TranscriptionCacheEntry
+from app.main import app
+from app.service.ai_service import (
+    GPT4O_TRANSCRIPT_INPUT_PER_1M,
+    GPT4O_TRANSCRIPT_OUTPUT_PER_1M,
+    GPT5_NANO_INPUT_PER_1M,
+    GPT5_NANO_OUTPUT_PER_1M,
+    MinutesSuggestionFailure,
+    MinutesSuggestionItem,
+    MinutesSuggestionResult,
+    MinutesUsageMeter,
+    TranscriptionResult,
+    _calc_usd_cost,
+    stream_minutes_suggestion,
+    suggest_minutes_bullets,
+    transcribe_audio,
+    transcribe_audio_chunk,
+)
 from app.service.domain import DomainError
+from app.service.transcription_cache_service import TranscriptionCache, transcription_cache_key
+from app.service.voice_activity_service import count_voiced_frames, is_silent_wav
 
 
 def test_should_keep_sub_cent_ai_cost_precision() -> None:
@@ -22,21 +55,24 @@ def test_should_return_domain_error_when_minutes_model_returns_non_object_json(m
         content = "[]"
         usage = None
 
-    monkeypatch.setattr(
-        "app.service.ai_service.suggest_minutes_json",
-        lambda system_instruction, user_prompt: FakeGatewayResponse(),
-    )
+    async def fake_suggest_minutes_json(system_instruction: str, user_prompt: str) -> FakeGatewayResponse:
+        return FakeGatewayResponse()
 
-    result = suggest_minutes_bullets(
-        transcript="speaker1: 이번 주 배포 일정을 조정합니다.",
-        existing_agenda="",
-        existing_meeting_content="",
-        existing_meeting_result="",
+    monkeypatch.setattr("app.service.ai_service.suggest_minutes_json", fake_suggest_minutes_json)
+
+    result = asyncio.run(
+        suggest_minutes_bullets(
+            transcript="speaker1: 이번 주 배포 일정을 조정합니다.",
+            existing_agenda="",
+            existing_meeting_content="",
+            existing_meeting_result="",
+        )
     )
 
-    assert isinstance(result, DomainError)
-    assert result.code == "INVALID_ARGUMENT"
-    assert "JSON 객체" in result.message
+    assert isinstance(result, MinutesSuggestionFailure)
+    assert result.error.code == "INVALID_ARGUMENT"
+    assert "JSON 객체" in result.error.message
+    assert result.usd_cost == Decimal("0")
 
 
 def test_should_use_openai_transcribe_function_without_recursive_self_call(monkeypatch) -> None:
@@ -46,16 +82,463 @@ def test_should_use_openai_transcribe_function_without_recursive_self_call(monke
         text = "speaker1: 테스트"
         usage = None
 
-    monkeypatch.setattr(
-        "app.service.ai_service.openai_transcribe_audio_chunk",
-        lambda **kwargs: FakeGatewayResponse(),
-    )
+    async def fake_transcribe_audio_chunk(**kwargs: object) -> FakeGatewayResponse:
+        return FakeGatewayResponse()
 
-    result = transcribe_audio_chunk(
-        audio_base64="dGVzdA==",
-        mime_type="audio/webm",
-        previous_text="",
+    monkeypatch.setattr("app.service.ai_service.openai_transcribe_audio_chunk", fake_transcribe_audio_chunk)
+
+    result = asyncio.run(
+        transcribe_audio_chunk(
+            audio_base64="dGVzdA==",
+            mime_type="audio/webm",
+            previous_text="",
+        )
     )
 
     assert not isinstance(result, DomainError)
     assert result.text == "speaker1: 테스트"
+
+
+def test_should_share_one_openai_client_across_calls(monkeypatch) -> None:
+    monkeypatch.setattr("app.infra.openai.OPENAI_API_KEY", "test-key")
+    holder = OpenAiClientHolder()
+
+    holder.start()
+    first = holder.get()
+
+    assert holder.get() is first
+    asyncio.run(holder.stop())
+    assert holder.get() is not first
+    asyncio.run(holder.stop())
+
+
+def test_should_transcribe_raw_audio_body_without_base64(client: TestClient, monkeypatch) -> None:
+    monkeypatch.setattr("app.service.ai_service.OPENAI_API_KEY", "test-key")
+    received: dict[str, object] = {}
+
+    class FakeGatewayResponse:
+        text = "speaker1: 업로드 테스트"
+        usage = None
+
+    async def fake_transcribe_audio_chunk(audio: IO[bytes], **kwargs: object) -> FakeGatewayResponse:
+        # JSON/base64를 거치지 않고 버퍼 파일이 그대로 전달된다.
+        assert not isinstance(audio, bytes)
+        received["audio"] = audio.read()
+        received.update(kwargs)
+        return FakeGatewayResponse()
+
+    monkeypatch.setattr("app.service.ai_service.openai_transcribe_audio_chunk", fake_transcribe_audio_chunk)
+    login = client.post("/api/auth/login", json={"email": "admin@ecminer.com", "password": "ecminer"})
+    assert login.status_code == 200
+
+    response = client.post(
+        "/api/ai/transcribe-audio",
+        content=b"\x1aE\xdf\xa3webm-bytes",
+        headers={
+            "Content-Type": "audio/webm;codecs=opus",
+            "X-Previous-Text": base64.b64encode("직전 전사".encode()).decode("ascii"),
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json()["text"] == "speaker1: 업로드 테스트"
+    assert received["audio"] == b"\x1aE\xdf\xa3webm-bytes"
+    assert received["mime_type"] == "audio/webm"
+    assert received["prompt"] == "직전 전사"
+
+
+def test_should_reject_malformed_previous_text_header(client: TestClient) -> None:
+    login = client.post("/api/auth/login", json={"email": "admin@ecminer.com", "password": "ecminer"})
+    assert login.status_code == 200
+
+    response = client.post(
+        "/api/ai/transcribe-audio",
+        content=b"webm-bytes",
+        headers={"Content-Type": "audio/webm", "X-Previous-Text": "not base64!"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "INVALID_ARGUMENT"
+
+
+def test_should_reject_raw_audio_body_over_upload_limit(client: TestClient, monkeypatch) -> None:
+    monkeypatch.setattr("app.router.ai.AI_AUDIO_UPLOAD_MAX_BYTES", 4)
+    login = client.post("/api/auth/login", json={"email": "admin@ecminer.com", "password": "ecminer"})
+    assert login.status_code == 200
+
+    response = client.post(
+        "/api/ai/transcribe-audio",
+        content=b"too-large",
+        headers={"Content-Type": "audio/webm"},
+    )
+
+    assert response.status_code == 413
+    assert response.json()["error"]["code"] == "PAYLOAD_TOO_LARGE"
+
+
+def test_should_reuse_cached_transcription_for_duplicate_chunk_without_cost(monkeypatch) -> None:
+    monkeypatch.setattr("app.service.ai_service.OPENAI_API_KEY", "test-key")
+    calls: list[bytes] = []
+
+    class FakeGatewayResponse:
+        text = "speaker1: 캐시 테스트"
+        usage = {"input_tokens": 1000, "output_tokens": 100}
+
+    async def fake_transcribe_audio_chunk(audio: bytes, **kwargs: object) -> FakeGatewayResponse:
+        calls.append(audio)
+        await asyncio.sleep(0.01)
+        return FakeGatewayResponse()
+
+    monkeypatch.setattr("app.service.ai_service.openai_transcribe_audio_chunk", fake_transcribe_audio_chunk)
+
+    async def scenario() -> list[TranscriptionResult | DomainError]:
+        # 동시에 들어온 재전송과 나중에 들어온 재전송 모두 전사를 다시 요청하지 않는다.
+        concurrent = await asyncio.gather(
+            transcribe_audio(b"duplicate-chunk", 15, "audio/wav", None),
+            transcribe_audio(b"duplicate-chunk", 15, "audio/wav", None),
+        )
+        later = await transcribe_audio(b"duplicate-chunk", 15, "audio/wav", None)
+        return [*concurrent, later]
+
+    results = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert all(isinstance(result, TranscriptionResult) for result in results)
+    costs = sorted(result.usd_cost for result in results if isinstance(result, TranscriptionResult))
+    assert costs[:2] == [Decimal("0"), Decimal("0")]
+    assert costs[2] > Decimal("0")
+
+
+def test_should_evict_least_recently_used_transcription_cache_entry() -> None:
+    cache = TranscriptionCache(max_entries=2, db_enabled=False)
+
+    async def scenario() -> list[str | None]:
+        await cache.put("a", "첫 번째")
+        await cache.put("b", "두 번째")
+        await cache.get("a")
+        await cache.put("c", "세 번째")
+        return [await cache.get("a"), await cache.get("b"), await cache.get("c")]
+
+    assert asyncio.run(scenario()) == ["첫 번째", None, "세 번째"]
+
+
+def test_should_share_transcription_cache_through_database(client: TestClient) -> None:
+    session_factory = app.dependency_overrides[get_db_session_factory]()
+    key = transcription_cache_key(b"shared-chunk", "audio/wav", "")
+
+    async def scenario() -> str | None:
+        writer = TranscriptionCache(db_enabled=True)
+        await writer.start(session_factory)
+        await writer.put(key, "다른 워커의 전사")
+        # 메모리 캐시가 비어 있는 다른 프로세스도 DB에 저장된 결과를 쓴다.
+        reader = TranscriptionCache(db_enabled=True)
+        await reader.start(session_factory)
+        return await reader.get(key)
+
+    assert asyncio.run(scenario()) == "다른 워커의 전사"
+
+
+def test_should_replace_expired_transcription_cache_row(client: TestClient) -> None:
+    session_factory = app.dependency_overrides[get_db_session_factory]()
+    key = transcription_cache_key(b"stale-chunk", "audio/wav", "")
+
+    async def scenario() -> str | None:
+        stale_writer = TranscriptionCache(db_enabled=True)
+        await stale_writer.start(session_factory)
+        await stale_writer.put(key, "예전 전사")
+        async with session_factory() as db:
+            await db.execute(
+                update(TranscriptionCacheEntry)
+                .where(TranscriptionCacheEntry.content_hash == key)
+                .values(created_at=datetime(2020, 1, 1, tzinfo=UTC))
+            )
+            await db.commit()
+        # 만료됐지만 정리되지 않은 행이 있어도 새 결과를 저장한다.
+        writer = TranscriptionCache(db_enabled=True)
+        await writer.start(session_factory)
+        await writer.put(key, "새 전사")
+        reader = TranscriptionCache(db_enabled=True)
+        await reader.start(session_factory)
+        return await reader.get(key)
+
+    assert asyncio.run(scenario()) == "새 전사"
+
+
+def test_should_summarize_long_transcript_by_sections_and_merge(monkeypatch) -> None:
+    monkeypatch.setattr("app.service.ai_service.OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr("app.service.ai_service.AI_SUMMARY_CHUNK_CHARS", 40)
+    monkeypatch.setattr("app.service.ai_service.AI_SUMMARY_MAX_CONCURRENCY", 2)
+    transcript = "\n".join(
+        [
+            "speaker1: 배포 일정을 다음 주로 미룹니다.",
+            "speaker2: QA 인원을 한 명 더 배정합니다.",
+            "이어서 테스트 범위를 넓힙니다.",
+            "speaker1: 예산은 다음 회의에서 다룹니다.",
+        ]
+    )
+    prompts: list[str] = []
+    active = 0
+    max_active = 0
+
+    class FakeGatewayResponse:
+        def __init__(self, content: str) -> None:
+            self.content = content
+            self.usage = {"input_tokens": 1000000, "output_tokens": 0}
+
+    async def fake_suggest_minutes_json(system_instruction: str, user_prompt: str) -> FakeGatewayResponse:
+        nonlocal active, max_active
+        prompts.append(user_prompt)
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if "[구간별 회의록 초안]" in user_prompt:
+            return FakeGatewayResponse('{"agenda": ["합친 안건"], "meeting_content": [], "meeting_result": []}')
+        return FakeGatewayResponse('{"agenda": ["구간 안건"], "meeting_content": [], "meeting_result": []}')
+
+    monkeypatch.setattr("app.service.ai_service.suggest_minutes_json", fake_suggest_minutes_json)
+
+    result = asyncio.run(
+        suggest_minutes_bullets(
+            transcript=transcript,
+            existing_agenda="기존 안건",
+            existing_meeting_content="",
+            existing_meeting_result="",
+        )
+    )
+
+    assert isinstance(result, MinutesSuggestionResult)
+    section_prompts = [prompt for prompt in prompts if "[구간별 회의록 초안]" not in prompt]
+    assert len(section_prompts) == 3
+    # 화자 표시가 없는 줄은 앞 발화와 같은 구간에 남는다.
+    assert any("QA 인원" in prompt and "테스트 범위" in prompt for prompt in section_prompts)
+    assert "기존 안건" in prompts[-1]
+    assert max_active == 2
+    assert result.agenda == ["합친 안건"]
+    # 구간 요약 3번과 합치기 1번의 입력 토큰 비용을 모두 더한다.
+    assert result.usd_cost == GPT5_NANO_INPUT_PER_1M * 4
+
+
+def test_should_settle_finished_section_costs_when_one_section_fails(client: TestClient, monkeypatch) -> None:
+    monkeypatch.setattr("app.service.ai_service.OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr("app.service.ai_service.AI_SUMMARY_CHUNK_CHARS", 40)
+    transcript = "\n".join(
+        [
+            "speaker1: 배포 일정을 다음 주로 미룹니다.",
+            "speaker2: QA 인원을 한 명 더 배정합니다.",
+            "speaker1: 예산은 다음 회의에서 다룹니다.",
+        ]
+    )
+
+    class FakeGatewayResponse:
+        content = '{"agenda": ["구간 안건"], "meeting_content": [], "meeting_result": []}'
+        usage = {"input_tokens": 1000000, "output_tokens": 0}
+
+    async def fake_suggest_minutes_json(system_instruction: str, user_prompt: str) -> FakeGatewayResponse:
+        if "예산" in user_prompt:
+            raise RuntimeError("upstream timeout")
+        return FakeGatewayResponse()
+
+    monkeypatch.setattr("app.service.ai_service.suggest_minutes_json", fake_suggest_minutes_json)
+    login = client.post("/api/auth/login", json={"email": "admin@ecminer.com", "password": "ecminer"})
+    assert login.status_code == 200
+
+    response = client.post("/api/ai/suggest-minutes", json={"transcript": transcript})
+
+    assert response.status_code == 400
+    assert "upstream timeout" in response.json()["error"]["message"]
+    # 실패한 구간과 합치기 호출은 비용이 없고, 끝난 두 구간의 비용만 정산된다.
+    usage = client.get("/api/users/ai-usage")
+    admin_row = next(row for row in usage.json()["items"] if row["user_id"] == "1")
+    assert admin_row["used_usd"] == float(GPT5_NANO_INPUT_PER_1M * 2)
+
+
+def test_should_stream_minutes_items_and_settle_usage_at_end(client: TestClient, monkeypatch) -> None:
+    monkeypatch.setattr("app.service.ai_service.OPENAI_API_KEY", "test-key")
+    content = json.dumps(
+        {
+            "agenda": ["배포 일정", "배포 일정", 'QA "회귀" 테스트'],
+            "meeting_content": ["배포 일정\n다음 주로 미룬다."],
+            "meeting_result": ["다음 주 배포"],
+        },
+        ensure_ascii=False,
+    )
+
+    async def fake_stream_minutes_json(
+        system_instruction: str,
+        user_prompt: str,
+    ) -> AsyncIterator[OpenAiChatStreamChunk]:
+        # 문자열 중간에서 끊긴 조각이 와도 항목이 닫힐 때 한 번씩만 나와야 한다.
+        for start in range(0, len(content), 3):
+            yield OpenAiChatStreamChunk(content=content[start : start + 3], usage=None)
+        yield OpenAiChatStreamChunk(content="", usage={"input_tokens": 1000000, "output_tokens": 0})
+
+    monkeypatch.setattr("app.service.ai_service.stream_minutes_json", fake_stream_minutes_json)
+    login = client.post("/api/auth/login", json={"email": "user@ecminer.com", "password": "ecminer2"})
+    assert login.status_code == 200
+
+    with client.stream(
+        "POST",
+        "/api/ai/suggest-minutes/stream",
+        json={"transcript": "speaker1: 배포 일정을 다음 주로 미룹니다."},
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.iter_lines() if line]
+
+    assert [(event["type"], event.get("section"), event.get("text")) for event in events[:-1]] == [
+        ("item", "agenda", "배포 일정"),
+        ("item", "agenda", 'QA "회귀" 테스트'),
+        ("item", "meeting_content", "배포 일정\n다음 주로 미룬다."),
+        ("item", "meeting_result", "다음 주 배포"),
+    ]
+    done = events[-1]
+    assert done["type"] == "done"
+    assert done["agenda"] == ["배포 일정", 'QA "회귀" 테스트']
+    assert done["user_used_usd"] == float(GPT5_NANO_INPUT_PER_1M)
+
+
+def test_should_run_ai_endpoints_against_fake_provider_without_api_key(client: TestClient, monkeypatch) -> None:
+    monkeypatch.setattr("app.service.ai_service.OPENAI_API_KEY", "")
+    monkeypatch.setattr("app.service.ai_service.AI_PROVIDER", "fake")
+    fake = FakeAiProvider(latency_ms=0, input_tokens=1000000, output_tokens=100000)
+    ai_provider.use(fake)
+    try:
+        login = client.post("/api/auth/login", json={"email": "user@ecminer.com", "password": "ecminer2"})
+        assert login.status_code == 200
+
+        transcribed = client.post(
+            "/api/ai/transcribe-audio",
+            content=b"fake-provider-audio",
+            headers={"Content-Type": "audio/webm"},
+        )
+        assert transcribed.status_code == 200
+        assert transcribed.json()["text"] == fake.transcript_text
+        # 대역이 보고한 사용량으로 실제와 같은 방식으로 비용을 계산한다.
+        assert transcribed.json()["user_used_usd"] == float(
+            GPT4O_TRANSCRIPT_INPUT_PER_1M + GPT4O_TRANSCRIPT_OUTPUT_PER_1M / 10
+        )
+
+        with client.stream("POST", "/api/ai/suggest-minutes/stream", json={"transcript": "화자1: 안건"}) as response:
+            events = [json.loads(line) for line in response.iter_lines() if line]
+        assert [event["type"] for event in events] == ["item", "item", "item", "done"]
+        assert events[-1]["agenda"] == ["로컬 대역 안건"]
+
+        ai_provider.use(FakeAiProvider(latency_ms=0, error_rate=1.0))
+        failed = client.post(
+            "/api/ai/transcribe-audio",
+            content=b"fake-provider-failing-audio",
+            headers={"Content-Type": "audio/webm"},
+        )
+        assert failed.status_code == 503
+        assert failed.json()["error"]["code"] == "UPSTREAM_UNAVAILABLE"
+        assert fake.calls == 2
+    finally:
+        ai_provider.use(None)
+
+
+def _pcm_wav(samples: list[int], sample_rate: int = 16000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(sample_rate)
+        writer.writeframes(b"".join(sample.to_bytes(2, "little", signed=True) for sample in samples))
+    return buffer.getvalue()
+
+
+def test_should_skip_transcribing_silent_wav_chunk_without_cost(monkeypatch) -> None:
+    monkeypatch.setattr("app.service.ai_service.OPENAI_API_KEY", "test-key")
+    calls: list[bytes] = []
+
+    class FakeGatewayResponse:
+        text = "speaker1: 말소리"
+        usage = {"input_tokens": 1000, "output_tokens": 0}
+
+    async def fake_transcribe_audio_chunk(audio: bytes, **kwargs: object) -> FakeGatewayResponse:
+        calls.append(audio)
+        return FakeGatewayResponse()
+
+    monkeypatch.setattr("app.service.ai_service.openai_transcribe_audio_chunk", fake_transcribe_audio_chunk)
+    # 배경 잡음에 100ms짜리 잡음 한 번이 섞인 1초(말소리로 보려면 150ms 이상 필요)
+    noise = [(index * 37 % 101) - 50 for index in range(16000)]
+    silent = _pcm_wav(noise[:8000] + [6000, -6000] * 800 + noise[9600:])
+    speech = _pcm_wav([int(5000 * math.sin(index / 8)) for index in range(16000)])
+
+    skipped = asyncio.run(transcribe_audio(silent, len(silent), "audio/wav", None))
+    transcribed = asyncio.run(transcribe_audio(speech, len(speech), "audio/wav", None))
+
+    assert skipped == TranscriptionResult(text="", usd_cost=Decimal("0"))
+    assert isinstance(transcribed, TranscriptionResult)
+    assert transcribed.text == "speaker1: 말소리"
+    assert calls == [speech]
+    # 판단할 수 없는 WAV는 전사로 넘긴다.
+    assert is_silent_wav(b"RIFF-broken") is False
+
+
+def test_should_count_voiced_frames_by_rms_threshold() -> None:
+    frames = [0] * 480 + [1000, -1000] * 240 + [200] * 480 + [7] * 100
+    pcm = b"".join(sample.to_bytes(2, "little", signed=True) for sample in frames)
+
+    # 3개 프레임 중 RMS 1000인 프레임만 기준(300)을 넘고, 끝의 자투리 100개는 세지 않는다.
+    assert count_voiced_frames(pcm, 480, 300) == 1
+    assert count_voiced_frames(pcm, 480, 200) == 2
+
+
+def test_should_settle_streamed_chunks_when_minutes_stream_breaks(client: TestClient, monkeypatch) -> None:
+    monkeypatch.setattr("app.service.ai_service.OPENAI_API_KEY", "test-key")
+
+    async def fake_stream_minutes_json(
+        system_instruction: str,
+        user_prompt: str,
+    ) -> AsyncIterator[OpenAiChatStreamChunk]:
+        for piece in ['{"agenda": ["배포', ' 일정"', "], "]:
+            yield OpenAiChatStreamChunk(content=piece, usage=None)
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setattr("app.service.ai_service.stream_minutes_json", fake_stream_minutes_json)
+    login = client.post("/api/auth/login", json={"email": "admin@ecminer.com", "password": "ecminer"})
+    assert login.status_code == 200
+
+    with client.stream(
+        "POST",
+        "/api/ai/suggest-minutes/stream",
+        json={"transcript": "speaker1: 배포 일정을 다음 주로 미룹니다."},
+    ) as response:
+        events = [json.loads(line) for line in response.iter_lines() if line]
+
+    assert [event["type"] for event in events] == ["item", "error"]
+    # 사용량이 오기 전에 끊긴 호출은 받은 조각 3개를 출력 토큰으로 정산한다.
+    usage = client.get("/api/users/ai-usage")
+    admin_row = next(row for row in usage.json()["items"] if row["user_id"] == "1")
+    assert admin_row["used_usd"] == float(
+        _calc_usd_cost(Decimal("0"), Decimal("3"), GPT5_NANO_INPUT_PER_1M, GPT5_NANO_OUTPUT_PER_1M)
+    )
+
+
+def test_should_count_minutes_stream_usage_until_consumer_stops(monkeypatch) -> None:
+    monkeypatch.setattr("app.service.ai_service.OPENAI_API_KEY", "test-key")
+
+    async def fake_stream_minutes_json(
+        system_instruction: str,
+        user_prompt: str,
+    ) -> AsyncIterator[OpenAiChatStreamChunk]:
+        for piece in ['{"agenda": ["배포 일정"', ', "QA 일정"', "]}"]:
+            yield OpenAiChatStreamChunk(content=piece, usage=None)
+        yield OpenAiChatStreamChunk(content="", usage={"input_tokens": 1000000, "output_tokens": 0})
+
+    monkeypatch.setattr("app.service.ai_service.stream_minutes_json", fake_stream_minutes_json)
+    meter = MinutesUsageMeter()
+
+    async def scenario() -> None:
+        stream = stream_minutes_suggestion("speaker1: 배포 일정을 정합니다.", "", "", "", meter)
+        # 첫 항목만 받고 클라이언트가 끊긴 것처럼 스트림을 닫는다.
+        assert isinstance(await anext(stream), MinutesSuggestionItem)
+        await stream.aclose()
+
+    asyncio.run(scenario())
+    assert meter.usd_cost == _calc_usd_cost(Decimal("0"), Decimal("1"), GPT5_NANO_INPUT_PER_1M, GPT5_NANO_OUTPUT_PER_1M)
+
+    # 실제 사용량이 오면 조각 수로 센 추정치를 대신한다.
+    meter.add_stream_usage({"input_tokens": 1000000, "output_tokens": 0})
+    assert meter.usd_cost == GPT5_NANO_INPUT_PER_1M
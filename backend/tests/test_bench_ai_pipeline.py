@@ -0,0 +1,32 @@
+from scripts.bench_ai_pipeline import RequestSample, summarize_samples
+
+
+def test_should_separate_quota_rejections_and_measure_server_overhead() -> None:
+    samples = [
+        RequestSample("transcribe", 200, None, 110.0),
+        RequestSample("transcribe", 200, None, 140.0),
+        RequestSample("summary", 200, None, 130.0, first_item_ms=105.0),
+        RequestSample("transcribe", 429, "QUOTA_EXCEEDED", 5.0),
+        RequestSample("summary", 503, "UPSTREAM_UNAVAILABLE", 101.0),
+    ]
+    baseline = [RequestSample("transcribe", 200, None, 110.0), RequestSample("summary", 200, None, 110.0)]
+
+    report = summarize_samples(samples, elapsed=1.5, provider_latency_ms=100.0, baseline=baseline)
+
+    assert report["ok"] == 3
+    assert report["quota_rejected"] == 1
+    assert report["failed"] == 1
+    assert report["error_rate"] == 0.2
+    assert report["error_codes"] == {"QUOTA_EXCEEDED": 1, "UPSTREAM_UNAVAILABLE": 1}
+    assert report["throughput_rps"] == 2.0
+    assert report["by_kind"]["summary"]["first_item_ms"]["p50"] == 105.0
+    # 대역 지연 100ms를 뺀 서버 처리 시간이 동시성 1일 때(10ms)의 몇 배인지
+    assert report["overhead_ms"]["p50"] == 30.0
+    assert report["contention_ratio"] == 3.0
+
+
+def test_should_skip_overhead_without_known_provider_latency() -> None:
+    report = summarize_samples([RequestSample("transcribe", 200, None, 110.0)], elapsed=1.0)
+
+    assert report["overhead_ms"] is None
+    assert report["contention_ratio"] is None
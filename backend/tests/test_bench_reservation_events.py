@@ -0,0 +1,36 @@
+import json
+
+from scripts.bench_reservation_events import Mutation, SubscriberStats, record_frame, summarize_delivery
+
+
+def test_should_record_single_and_batched_reservation_frames() -> None:
+    stats = SubscriberStats(connected_at=0.0)
+
+    record_frame(stats, "reservation", json.dumps({"reservation_id": "rsv-1", "action": "created"}), 1.0)
+    batch = [{"reservation_id": "rsv-1", "action": "updated"}, {"reservation_id": "rsv-2", "action": "created"}]
+    record_frame(stats, "reservations", json.dumps(batch), 2.0)
+    record_frame(stats, "resync", "{}", 3.0)
+
+    assert stats.arrivals == {("rsv-1", "created"): 1.0, ("rsv-1", "updated"): 2.0, ("rsv-2", "created"): 2.0}
+    assert stats.resyncs == 1
+
+
+def test_should_split_missing_deliveries_into_coalesced_and_dropped() -> None:
+    mutations = [
+        Mutation("rsv-1", "created", 0.0, 0.01),
+        Mutation("rsv-1", "updated", 0.5, 0.51),
+        Mutation("rsv-2", "created", 1.0, 1.01),
+    ]
+    stats = SubscriberStats(connected_at=0.0)
+    # rsv-1 생성/수정이 하나로 합쳐져 도착하고, rsv-2는 도착하지 않은 경우
+    record_frame(stats, "reservation", json.dumps({"reservation_id": "rsv-1", "action": "created"}), 0.1)
+    never_connected = SubscriberStats()
+
+    report = summarize_delivery(mutations, [stats, never_connected])
+
+    assert report["subscribers_connected"] == 1
+    assert report["expected_deliveries"] == 3
+    assert report["delivered"] == 1
+    assert report["coalesced"] == 1
+    assert report["dropped"] == 1
+    assert report["latency_ms"]["p50"] == 100.0
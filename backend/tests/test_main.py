@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infra.db import get_db_session_factory
+from app.main import app, lifespan
+from app.service.ai_usage_rollup import ai_usage_rollup
+from app.service.minutes_lock_sweeper import minutes_lock_sweeper
+from app.service.minutes_room_service import minutes_room_hub
+from app.service.reservation_event_service import reservation_event_broker
+from app.service.transcription_cache_service import transcription_cache
+from app.service.transcription_job_service import transcription_job_queue
+
+
+def test_should_stop_started_services_when_a_later_start_fails(monkeypatch) -> None:
+    stopped: list[str] = []
+
+    async def noop_start(*args: object) -> None:
+        return None
+
+    def recorder(name: str):
+        async def stop() -> None:
+            stopped.append(name)
+
+        return stop
+
+    async def failing_start(session_factory: async_sessionmaker[AsyncSession]) -> None:
+        raise RuntimeError("start failed")
+
+    for name, service in (
+        ("reservation_event_broker", reservation_event_broker),
+        ("minutes_room_hub", minutes_room_hub),
+        ("minutes_lock_sweeper", minutes_lock_sweeper),
+        ("ai_usage_rollup", ai_usage_rollup),
+        ("transcription_cache", transcription_cache),
+    ):
+        monkeypatch.setattr(service, "start", noop_start)
+        monkeypatch.setattr(service, "stop", recorder(name))
+    monkeypatch.setattr("app.main.openai_client.start", lambda: None)
+    monkeypatch.setattr("app.main.openai_client.stop", recorder("openai_client"))
+    monkeypatch.setattr(transcription_job_queue, "start", failing_start)
+    monkeypatch.setitem(app.dependency_overrides, get_db_session_factory, lambda: None)
+
+    async def run() -> None:
+        async with lifespan(app):
+            pass
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+    assert stopped == [
+        "transcription_cache",
+        "openai_client",
+        "ai_usage_rollup",
+        "minutes_lock_sweeper",
+        "minutes_room_hub",
+        "reservation_event_broker",
+    ]
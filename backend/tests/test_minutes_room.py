@@ -0,0 +1,342 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.service.minutes_room_service import (
+    MINUTES_ROOM_HEARTBEAT,
+    MinutesRoomConnection,
+    MinutesRoomHub,
+    MinutesRoomMessage,
+    PgNotifyMinutesRoomHub,
+)
+
+
+class FakeNotifyBus:
+    # 여러 워커가 같은 채널을 LISTEN하는 상황을 흉내 낸다.
+    def __init__(self) -> None:
+        self.payloads: list[str] = []
+        self.handlers: list[Callable[[str], Awaitable[None]]] = []
+
+    def channel(self) -> "FakeNotifyChannel":
+        return FakeNotifyChannel(self)
+
+
+class FakeNotifyChannel:
+    def __init__(self, bus: FakeNotifyBus) -> None:
+        self._bus = bus
+        self._handler: Callable[[str], Awaitable[None]] | None = None
+        self._on_listen: Callable[[], Awaitable[None]] | None = None
+
+    async def notify(self, payload: str) -> None:
+        self._bus.payloads.append(payload)
+        for handler in list(self._bus.handlers):
+            await handler(payload)
+
+    async def start(
+        self,
+        handler: Callable[[str], Awaitable[None]],
+        on_listen: Callable[[], Awaitable[None]] | None = None,
+    ) -> None:
+        self._handler = handler
+        self._on_listen = on_listen
+        self._bus.handlers.append(handler)
+
+    def disconnect(self) -> None:
+        # LISTEN 연결이 끊겨 그동안의 NOTIFY를 놓치는 상황
+        if self._handler is not None:
+            self._bus.handlers.remove(self._handler)
+
+    async def reconnect(self) -> None:
+        if self._handler is not None:
+            self._bus.handlers.append(self._handler)
+        if self._on_listen is not None:
+            await self._on_listen()
+
+    async def stop(self) -> None:
+        if self._handler is not None:
+            self._bus.handlers.remove(self._handler)
+            self._handler = None
+
+
+async def _flush_outbox() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def _login(client: TestClient, email: str, password: str) -> None:
+    response = client.post("/api/auth/login", json={"email": email, "password": password})
+    assert response.status_code == 200
+
+
+def _create_reservation(client: TestClient) -> str:
+    response = client.post(
+        "/api/reservations",
+        json={
+            "room_id": "A",
+            "title": "킥오프",
+            "start_at": "2026-03-01T10:00:00+09:00",
+            "end_at": "2026-03-01T11:00:00+09:00",
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_should_reject_minutes_room_without_login(client: TestClient) -> None:
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with client.websocket_connect("/api/reservations/rsv_missing/minutes-ws"):
+            pass
+    assert exc_info.value.code == 1008
+
+
+def test_should_reject_minutes_room_for_unknown_reservation(client: TestClient) -> None:
+    _login(client, "admin@ecminer.com", "ecminer")
+
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with client.websocket_connect("/api/reservations/rsv_missing/minutes-ws"):
+            pass
+    assert exc_info.value.code == 1008
+
+
+def test_should_push_lock_and_live_state_to_minutes_room_viewers(client: TestClient) -> None:
+    _login(client, "admin@ecminer.com", "ecminer")
+    reservation_id = _create_reservation(client)
+
+    with client.websocket_connect(f"/api/reservations/{reservation_id}/minutes-ws") as editor:
+        snapshot = editor.receive_json()
+        assert snapshot["type"] == "snapshot"
+        assert snapshot["lock"] is None
+        assert snapshot["live_state"]["transcript_text"] == ""
+        presence = editor.receive_json()
+        assert presence["type"] == "presence"
+        assert len(presence["members"]) == 1
+
+        with client.websocket_connect(f"/api/reservations/{reservation_id}/minutes-ws") as viewer:
+            assert viewer.receive_json()["type"] == "snapshot"
+            # 같은 사용자가 두 번 접속해도 접속자 목록에는 한 번만 나온다.
+            assert len(viewer.receive_json()["members"]) == 1
+            assert editor.receive_json()["type"] == "presence"
+
+            editor.send_json({"type": "acquire_lock", "ttl_seconds": 30})
+            lock_message = viewer.receive_json()
+            assert lock_message["type"] == "lock"
+            assert lock_message["lock"]["reservation_id"] == reservation_id
+            assert editor.receive_json()["type"] == "lock"
+
+            editor.send_json({"type": "live_state", "transcript_text": "안녕하세요", "is_recording": True})
+            state_message = viewer.receive_json()
+            assert state_message["type"] == "live_state"
+            assert state_message["live_state"]["transcript_text"] == "안녕하세요"
+            assert state_message["live_state"]["is_recording"] is True
+            assert editor.receive_json()["type"] == "live_state"
+
+            editor.send_json({"type": "transcript_chunk", "text": "\n반갑습니다"})
+            chunk_message = viewer.receive_json()
+            assert chunk_message["type"] == "transcript_chunk"
+            assert chunk_message["chunk"]["seq"] == 2
+            assert chunk_message["chunk"]["text"] == "\n반갑습니다"
+            assert editor.receive_json()["type"] == "transcript_chunk"
+
+            editor.send_json({"type": "release_lock"})
+            assert viewer.receive_json() == {"type": "lock", "lock": None}
+            released_state = viewer.receive_json()["live_state"]
+            assert released_state["is_recording"] is False
+            assert released_state["transcript_text"] == "안녕하세요\n반갑습니다"
+
+
+def test_should_keep_http_acquired_lock_when_room_socket_closes(client: TestClient) -> None:
+    _login(client, "admin@ecminer.com", "ecminer")
+    reservation_id = _create_reservation(client)
+    acquired = client.post(f"/api/reservations/{reservation_id}/minutes-lock", json={"ttl_seconds": 30})
+    assert acquired.status_code == 200
+
+    with client.websocket_connect(f"/api/reservations/{reservation_id}/minutes-ws") as websocket:
+        assert websocket.receive_json()["lock"]["holder_user_id"] == "1"
+
+    # HTTP로 잡은 잠금은 소켓이 닫혀도 풀지 않는다.
+    lock = client.get(f"/api/reservations/{reservation_id}/minutes-lock")
+    assert lock.status_code == 200
+    assert lock.json()["holder_user_id"] == "1"
+
+
+def test_should_reply_error_for_unknown_minutes_room_message(client: TestClient) -> None:
+    _login(client, "admin@ecminer.com", "ecminer")
+    reservation_id = _create_reservation(client)
+
+    with client.websocket_connect(f"/api/reservations/{reservation_id}/minutes-ws") as websocket:
+        websocket.receive_json()
+        websocket.receive_json()
+        websocket.send_text("not-json")
+        assert websocket.receive_json()["error"]["code"] == "INVALID_ARGUMENT"
+        websocket.send_json({"type": "shout"})
+        assert websocket.receive_json()["error"]["code"] == "INVALID_ARGUMENT"
+
+
+def test_should_close_minutes_room_connection_when_send_queue_overflows() -> None:
+    hub = MinutesRoomHub(max_pending=2)
+    slow = hub.join("rsv-1", "1", "관리자")
+
+    for index in range(3):
+        hub.broadcast("rsv-1", {"type": "live_state", "index": index})
+
+    # 밀린 메시지는 버리고 연결 종료 신호만 남긴다.
+    assert slow.qsize() == 1
+    assert asyncio.run(slow.get()) is None
+
+
+def test_should_deliver_room_messages_to_listeners_without_listing_them_as_members() -> None:
+    hub = MinutesRoomHub()
+    editor = hub.join("rsv-1", "1", "관리자")
+    listener = hub.subscribe("rsv-1", "2", "참석자")
+
+    hub.broadcast("rsv-1", {"type": "transcript_chunk", "chunk": {"seq": 1, "text": "안녕하세요"}})
+
+    assert [member.user_id for member in hub.members("rsv-1")] == ["1"]
+    assert hub.is_user_connected("rsv-1", "2") is False
+    assert editor.qsize() == 1
+    assert asyncio.run(listener.get()) == {"type": "transcript_chunk", "chunk": {"seq": 1, "text": "안녕하세요"}}
+
+    hub.leave(listener)
+    hub.broadcast("rsv-1", {"type": "presence", "members": []})
+    assert listener.qsize() == 0
+
+
+@pytest.mark.asyncio
+async def test_should_wake_idle_minutes_room_listeners_from_shared_heartbeat_task() -> None:
+    hub = MinutesRoomHub(heartbeat_seconds=0.01)
+    await hub.start()
+    editor = hub.join("rsv-1", "1", "관리자")
+    listener = hub.subscribe("rsv-1", "2", "참석자")
+
+    assert await listener.get() == MINUTES_ROOM_HEARTBEAT
+    await asyncio.sleep(0.03)
+    # 하트비트는 쌓이지 않고, WebSocket 접속자에게는 보내지 않는다.
+    assert listener.qsize() == 1
+    assert editor.qsize() == 0
+
+    hub.leave(editor)
+    hub.leave(listener)
+    await hub.stop()
+
+
+@pytest.mark.asyncio
+async def test_should_share_minutes_room_messages_and_presence_across_workers() -> None:
+    bus = FakeNotifyBus()
+    first = PgNotifyMinutesRoomHub(bus.channel())
+    second = PgNotifyMinutesRoomHub(bus.channel())
+    await first.start()
+    await second.start()
+    editor = first.join("rsv-1", "1", "관리자")
+    listener = second.subscribe("rsv-1", "2", "참석자")
+
+    first.broadcast("rsv-1", {"type": "transcript_chunk", "chunk": {"seq": 1, "text": "안녕하세요"}})
+    await _flush_outbox()
+
+    assert await listener.get() == {"type": "transcript_chunk", "chunk": {"seq": 1, "text": "안녕하세요"}}
+    assert (await editor.get())["type"] == "transcript_chunk"
+
+    viewer = second.join("rsv-1", "2", "참석자")
+    second.broadcast_presence("rsv-1")
+    await _flush_outbox()
+
+    # 접속자 목록과 접속 여부는 다른 워커의 연결까지 합쳐서 본다.
+    assert first.is_user_connected("rsv-1", "2") is True
+    assert second.is_user_connected("rsv-1", "1") is True
+    # 새 워커는 자기 접속자 목록을 먼저 받고, 다른 워커가 답하면 합쳐진 목록을 받는다.
+    assert [member["user_id"] for member in (await viewer.get())["members"]] == ["2"]
+    assert {member["user_id"] for member in (await viewer.get())["members"]} == {"1", "2"}
+
+    await first.stop()
+    await second.stop()
+
+
+@pytest.mark.asyncio
+async def test_should_resync_other_workers_when_room_message_exceeds_notify_limit() -> None:
+    bus = FakeNotifyBus()
+    first = PgNotifyMinutesRoomHub(bus.channel(), max_payload_bytes=200)
+    second = PgNotifyMinutesRoomHub(bus.channel(), max_payload_bytes=200)
+    await first.start()
+    await second.start()
+    editor = first.join("rsv-1", "1", "관리자")
+    viewer = second.join("rsv-1", "2", "참석자")
+
+    first.broadcast("rsv-1", {"type": "live_state", "live_state": {"transcript_text": "가" * 500}})
+    await _flush_outbox()
+
+    # 큰 메시지는 보낸 워커에만 전달하고, 다른 워커의 연결은 닫아 스냅샷을 다시 받게 한다.
+    assert (await editor.get())["type"] == "live_state"
+    assert await viewer.get() is None
+    assert all("가" not in payload for payload in bus.payloads)
+
+    await first.stop()
+    await second.stop()
+
+
+@pytest.mark.asyncio
+async def test_should_expire_members_of_worker_that_stopped_sending_presence() -> None:
+    bus = FakeNotifyBus()
+    first = PgNotifyMinutesRoomHub(bus.channel(), heartbeat_seconds=0.01)
+    second = PgNotifyMinutesRoomHub(bus.channel(), heartbeat_seconds=0.01)
+    await first.start()
+    await second.start()
+    editor = first.join("rsv-1", "1", "관리자")
+    second.join("rsv-1", "2", "참석자")
+    second.broadcast_presence("rsv-1")
+    await _flush_outbox()
+    assert first.is_user_connected("rsv-1", "2") is True
+
+    # 살아 있는 워커는 하트비트마다 다시 알리므로 목록에 남는다.
+    await asyncio.sleep(0.05)
+    assert first.is_user_connected("rsv-1", "2") is True
+
+    # 두 번째 워커가 퇴장 알림 없이 죽으면 하트비트 세 번 뒤에 접속자 목록에서 빠진다.
+    await second.stop()
+    await asyncio.sleep(0.06)
+    assert first.is_user_connected("rsv-1", "2") is False
+    assert [member.user_id for member in first.members("rsv-1")] == ["1"]
+    messages = [message for message in await _drain(editor) if message and message["type"] == "presence"]
+    assert [member["user_id"] for member in messages[-1]["members"]] == ["1"]
+
+    await first.stop()
+
+
+@pytest.mark.asyncio
+async def test_should_ask_presence_again_after_listen_reconnects() -> None:
+    bus = FakeNotifyBus()
+    first_channel = bus.channel()
+    first = PgNotifyMinutesRoomHub(first_channel)
+    second = PgNotifyMinutesRoomHub(bus.channel())
+    third = PgNotifyMinutesRoomHub(bus.channel())
+    for hub in (first, second, third):
+        await hub.start()
+    first.join("rsv-1", "1", "관리자")
+    leaving = second.join("rsv-1", "2", "참석자")
+    third.join("rsv-1", "3", "외부")
+    for hub in (second, third):
+        hub.broadcast_presence("rsv-1")
+    await _flush_outbox()
+    assert {member.user_id for member in first.members("rsv-1")} == {"1", "2", "3"}
+
+    # 끊긴 동안 놓친 퇴장은 재연결 후 다시 물어 맞춘다.
+    first_channel.disconnect()
+    second.leave(leaving)
+    second.broadcast_presence("rsv-1")
+    await _flush_outbox()
+    assert first.is_user_connected("rsv-1", "2") is True
+    await first_channel.reconnect()
+    await _flush_outbox()
+
+    assert {member.user_id for member in first.members("rsv-1")} == {"1", "3"}
+
+    for hub in (first, second, third):
+        await hub.stop()
+
+
+async def _drain(connection: MinutesRoomConnection) -> list[MinutesRoomMessage | None]:
+    messages: list[MinutesRoomMessage | None] = []
+    while connection.qsize():
+        messages.append(await connection.get())
+    return messages
@@ -1,4 +1,19 @@
+import asyncio
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+
 from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from app.infra.db import get_db_session_factory
+from app.infra.minutes_live_state import find_minutes_live_state
+from app.infra.minutes_lock import MinutesLock, find_minutes_lock
+from app.infra.minutes_transcript_archive import TRANSCRIPT_CODEC_ZLIB, find_minutes_transcript_archive
+from app.infra.minutes_transcript_chunk import list_minutes_transcript_chunks
+from app.main import app
+from app.service import reservation_service
+from app.service.minutes_lock_sweeper import minutes_lock_sweeper
+from app.service.reservation_service import MinutesTranscriptDeltaResult, get_minutes_transcript_delta
 
 
 def _login(client: TestClient, email: str, password: str) -> None:
@@ -178,6 +193,50 @@ def test_should_allow_internal_attendee_to_update_reservation_minutes(client: Te
     assert response.json()["other_notes"] == "후속 의견 정리"
 
 
+def test_should_return_409_with_current_state_when_minutes_version_is_stale(client: TestClient) -> None:
+    _login(client, "admin@ecminer.com", "ecminer")
+    reservation_id = _create_reservation(client, attendees=["user@ecminer.com"])
+    minutes_url = f"/api/reservations/{reservation_id}/minutes"
+    schedule = {"start_at": "2026-03-01T10:00:00+09:00", "end_at": "2026-03-01T11:00:00+09:00"}
+    loaded = client.get(minutes_url).json()
+    assert loaded["version"] == 1
+
+    first = client.patch(minutes_url, json={**schedule, "agenda": "- 관리자 안건", "version": loaded["version"]})
+    assert first.status_code == 200
+    assert first.json()["version"] == 2
+
+    _login(client, "user@ecminer.com", "ecminer2")
+    stale = client.patch(minutes_url, json={**schedule, "agenda": "- 참석자 안건"}, headers={"If-Match": '"1"'})
+
+    assert stale.status_code == 409
+    assert stale.json()["error"]["code"] == "VERSION_CONFLICT"
+    assert stale.json()["current"]["agenda"] == "- 관리자 안건"
+    assert stale.json()["current"]["version"] == 2
+
+    # 참석자만 바꿔도 버전이 올라간다.
+    merged = client.patch(
+        minutes_url,
+        json={**schedule, "attendees": ["user@ecminer.com", "outsider@ecminer.com"], "version": 2},
+    )
+    assert merged.status_code == 200
+    assert merged.json()["version"] == 3
+    # 바뀐 값이 없는 저장은 쓰지 않으므로 버전이 그대로다.
+    unchanged = client.patch(
+        minutes_url,
+        json={
+            **schedule,
+            "agenda": "- 관리자 안건",
+            "attendees": ["outsider@ecminer.com", "user@ecminer.com"],
+            "version": 3,
+        },
+    )
+    assert unchanged.status_code == 200
+    assert unchanged.json()["version"] == 3
+    assert client.get(minutes_url).json()["version"] == 3
+    invalid = client.patch(minutes_url, json={**schedule, "agenda": "x"}, headers={"If-Match": "abc"})
+    assert invalid.status_code == 400
+
+
 def test_should_allow_admin_to_acquire_minutes_lock_for_other_users_reservation(client: TestClient) -> None:
     _login(client, "user@ecminer.com", "ecminer2")
     reservation_id = _create_reservation(client)
@@ -205,3 +264,233 @@ def test_should_return_403_when_non_attendee_acquires_minutes_lock(client: TestC
 
     assert response.status_code == 403
     assert response.json()["error"]["message"] == "예약자 또는 내부 참석자만 회의록을 수정할 수 있습니다."
+
+
+def test_should_return_409_when_another_user_holds_minutes_lock(client: TestClient) -> None:
+    _login(client, "admin@ecminer.com", "ecminer")
+    reservation_id = _create_reservation(client, attendees=["user@ecminer.com"])
+    acquired = client.post(f"/api/reservations/{reservation_id}/minutes-lock", json={"ttl_seconds": 15})
+    assert acquired.status_code == 200
+
+    _login(client, "user@ecminer.com", "ecminer2")
+    response = client.post(f"/api/reservations/{reservation_id}/minutes-lock", json={"ttl_seconds": 15})
+
+    assert response.status_code == 409
+    assert response.json()["error"]["message"] == "admin가 수정하고있습니다."
+
+
+def test_should_renew_minutes_lock_without_reloading_reservation(client: TestClient, monkeypatch) -> None:
+    _login(client, "admin@ecminer.com", "ecminer")
+    reservation_id = _create_reservation(client)
+    first = client.post(f"/api/reservations/{reservation_id}/minutes-lock", json={"ttl_seconds": 15})
+    assert first.status_code == 200
+
+    async def fail_reservation_lookup(*args: object, **kwargs: object) -> None:
+        raise AssertionError("heartbeat should reuse the cached permission")
+
+    monkeypatch.setattr(
+        "app.service.reservation_service.find_reservation_with_timetable_and_creator",
+        fail_reservation_lookup,
+    )
+    renewed = client.post(f"/api/reservations/{reservation_id}/minutes-lock", json={"ttl_seconds": 30})
+
+    assert renewed.status_code == 200
+    assert renewed.json()["holder_user_id"] == "1"
+    assert renewed.json()["expires_at"] > first.json()["expires_at"]
+
+
+def test_should_not_extend_cached_minutes_lock_permission_on_renew(monkeypatch) -> None:
+    monkeypatch.setattr(reservation_service, "_minutes_lock_permission_cache", OrderedDict())
+    first_checked_at = datetime(2026, 3, 1, 10, 0, tzinfo=UTC)
+    ttl = timedelta(seconds=reservation_service.MINUTES_LOCK_PERMISSION_CACHE_TTL_SECONDS)
+
+    reservation_service._remember_minutes_lock_permission("rsv-1", "1", first_checked_at)
+    # 하트비트가 계속 와도 처음 확인한 시각 기준으로 만료된다.
+    reservation_service._remember_minutes_lock_permission("rsv-1", "1", first_checked_at + ttl - timedelta(seconds=1))
+
+    assert reservation_service._has_cached_minutes_lock_permission(
+        "rsv-1", "1", first_checked_at + ttl - timedelta(seconds=1)
+    )
+    assert not reservation_service._has_cached_minutes_lock_permission("rsv-1", "1", first_checked_at + ttl)
+
+
+def test_should_evict_least_recently_used_minutes_lock_permission(monkeypatch) -> None:
+    monkeypatch.setattr(reservation_service, "_minutes_lock_permission_cache", OrderedDict())
+    monkeypatch.setattr(reservation_service, "MINUTES_LOCK_PERMISSION_CACHE_SIZE", 2)
+    now = datetime(2026, 3, 1, 10, 0, tzinfo=UTC)
+
+    reservation_service._remember_minutes_lock_permission("rsv-1", "1", now)
+    reservation_service._remember_minutes_lock_permission("rsv-2", "1", now)
+    assert reservation_service._has_cached_minutes_lock_permission("rsv-1", "1", now)
+    reservation_service._remember_minutes_lock_permission("rsv-3", "1", now)
+
+    # 가득 차면 전부 비우지 않고 가장 오래 안 쓴 항목 하나만 밀어낸다.
+    assert reservation_service._has_cached_minutes_lock_permission("rsv-1", "1", now)
+    assert not reservation_service._has_cached_minutes_lock_permission("rsv-2", "1", now)
+    assert reservation_service._has_cached_minutes_lock_permission("rsv-3", "1", now)
+
+
+def test_should_treat_expired_minutes_lock_as_absent_until_sweeper_removes_it(client: TestClient) -> None:
+    _login(client, "admin@ecminer.com", "ecminer")
+    reservation_id = _create_reservation(client)
+    assert client.post(f"/api/reservations/{reservation_id}/minutes-lock", json={"ttl_seconds": 15}).status_code == 200
+    recording = client.patch(f"/api/reservations/{reservation_id}/minutes-live-state", json={"is_recording": True})
+    assert recording.status_code == 200
+    session_local = app.dependency_overrides[get_db_session_factory]()
+
+    async def expire_lock() -> None:
+        async with session_local() as session:
+            await session.execute(
+                update(MinutesLock)
+                .where(MinutesLock.reservation_id == reservation_id)
+                .values(expires_at=datetime.now(UTC) - timedelta(seconds=1))
+            )
+            await session.commit()
+
+    async def read_state() -> tuple[MinutesLock | None, bool]:
+        async with session_local() as session:
+            lock = await find_minutes_lock(session, reservation_id)
+            state = await find_minutes_live_state(session, reservation_id)
+            return lock, state is not None and state.is_recording
+
+    asyncio.run(expire_lock())
+
+    # 조회는 만료 잠금을 없는 것으로 보되 지우지 않는다.
+    assert client.get(f"/api/reservations/{reservation_id}/minutes-lock").json() is None
+    lock, is_recording = asyncio.run(read_state())
+    assert lock is not None
+    assert is_recording is True
+
+    swept = asyncio.run(minutes_lock_sweeper.sweep_once())
+
+    assert reservation_id in swept
+    lock, is_recording = asyncio.run(read_state())
+    assert lock is None
+    assert is_recording is False
+
+
+def test_should_append_transcript_chunks_and_fold_them_when_recording_stops(client: TestClient) -> None:
+    _login(client, "admin@ecminer.com", "ecminer")
+    reservation_id = _create_reservation(client, attendees=["user@ecminer.com"])
+    assert client.post(f"/api/reservations/{reservation_id}/minutes-lock", json={"ttl_seconds": 15}).status_code == 200
+    recording = client.patch(f"/api/reservations/{reservation_id}/minutes-live-state", json={"is_recording": True})
+    assert recording.status_code == 200
+    chunks_url = f"/api/reservations/{reservation_id}/minutes-transcript-chunks"
+    session_local = app.dependency_overrides[get_db_session_factory]()
+
+    async def read_stored() -> tuple[str, int, list[int]]:
+        async with session_local() as session:
+            state = await find_minutes_live_state(session, reservation_id)
+            chunks = await list_minutes_transcript_chunks(session, reservation_id)
+            assert state is not None
+            return state.transcript_text, state.transcript_seq, [chunk.seq for chunk in chunks]
+
+    first = client.post(chunks_url, json={"text": "안녕하세요"})
+    second = client.post(chunks_url, json={"text": "\n회의를 시작합니다"})
+
+    assert first.status_code == 201
+    assert [first.json()["seq"], second.json()["seq"]] == [1, 2]
+    assert client.post(chunks_url, json={"text": ""}).status_code == 400
+    # 녹음 중에는 전체 전사를 다시 쓰지 않고 조각만 쌓는다.
+    assert asyncio.run(read_stored()) == ("", 0, [1, 2])
+    live_state = client.get(f"/api/reservations/{reservation_id}/minutes-live-state").json()
+    assert live_state["transcript_text"] == "안녕하세요\n회의를 시작합니다"
+    assert live_state["transcript_seq"] == 2
+
+    stopped = client.patch(f"/api/reservations/{reservation_id}/minutes-live-state", json={"is_recording": False})
+
+    assert stopped.json()["transcript_text"] == "안녕하세요\n회의를 시작합니다"
+    assert stopped.json()["transcript_seq"] == 2
+    assert client.post(chunks_url, json={"text": "\n다음 안건"}).status_code == 400
+
+    _login(client, "user@ecminer.com", "ecminer2")
+    assert client.post(chunks_url, json={"text": "끼어들기"}).status_code == 403
+
+
+def test_should_send_only_transcript_chunks_after_viewer_offset(client: TestClient) -> None:
+    _login(client, "admin@ecminer.com", "ecminer")
+    reservation_id = _create_reservation(client)
+    assert client.post(f"/api/reservations/{reservation_id}/minutes-lock", json={"ttl_seconds": 15}).status_code == 200
+    recording = client.patch(f"/api/reservations/{reservation_id}/minutes-live-state", json={"is_recording": True})
+    assert recording.status_code == 200
+    for text in ["하나", "\n둘", "\n셋"]:
+        assert client.post(f"/api/reservations/{reservation_id}/minutes-transcript-chunks", json={"text": text})
+    session_local = app.dependency_overrides[get_db_session_factory]()
+
+    async def read_delta(after_seq: int | None) -> MinutesTranscriptDeltaResult:
+        async with session_local() as session:
+            result = await get_minutes_transcript_delta(reservation_id, after_seq, session)
+            assert isinstance(result, MinutesTranscriptDeltaResult)
+            return result
+
+    resumed = asyncio.run(read_delta(1))
+    assert resumed.snapshot is None
+    assert [(chunk.seq, chunk.text) for chunk in resumed.chunks] == [(2, "\n둘"), (3, "\n셋")]
+    assert resumed.is_recording is True
+    assert resumed.transcript_seq == 3
+
+    fresh = asyncio.run(read_delta(None))
+    assert fresh.snapshot is not None
+    assert fresh.snapshot.transcript_text == "하나\n둘\n셋"
+    assert fresh.chunks == []
+    # 알 수 없는 번호에서 이어 받으려 하면 전체 상태로 대신한다.
+    assert asyncio.run(read_delta(99)).snapshot is not None
+
+    replaced = client.patch(
+        f"/api/reservations/{reservation_id}/minutes-live-state", json={"transcript_text": "정리본"}
+    )
+
+    # 전사 교체는 번호 하나를 써서, 3번까지 받은 뷰어도 전체를 다시 받는다.
+    assert replaced.json()["transcript_seq"] == 4
+    after_replace = asyncio.run(read_delta(3))
+    assert after_replace.snapshot is not None
+    assert after_replace.snapshot.transcript_text == "정리본"
+
+
+def test_should_archive_compressed_transcript_when_recording_stops(client: TestClient) -> None:
+    _login(client, "admin@ecminer.com", "ecminer")
+    reservation_id = _create_reservation(client)
+    live_state_url = f"/api/reservations/{reservation_id}/minutes-live-state"
+    chunks_url = f"/api/reservations/{reservation_id}/minutes-transcript-chunks"
+    assert client.post(f"/api/reservations/{reservation_id}/minutes-lock", json={"ttl_seconds": 15}).status_code == 200
+    assert client.patch(live_state_url, json={"is_recording": True}).status_code == 200
+    transcript = "\n".join(f"{index}번 안건을 논의했습니다." for index in range(200))
+    assert client.post(chunks_url, json={"text": transcript}).status_code == 201
+    session_local = app.dependency_overrides[get_db_session_factory]()
+
+    async def read_stored() -> tuple[bool, tuple[str, int, int, int] | None]:
+        async with session_local() as session:
+            state = await find_minutes_live_state(session, reservation_id)
+            archive = await find_minutes_transcript_archive(session, reservation_id)
+            if archive is None:
+                return state is not None, None
+            stored = (archive.codec, len(archive.transcript_data), archive.transcript_size, archive.transcript_seq)
+            return state is not None, stored
+
+    stopped = client.patch(live_state_url, json={"is_recording": False})
+
+    assert stopped.status_code == 200
+    has_live_state, archived = asyncio.run(read_stored())
+    # 녹음이 끝나면 hot 테이블 행은 지우고 압축본만 남긴다.
+    assert has_live_state is False
+    assert archived is not None
+    codec, stored_size, transcript_size, transcript_seq = archived
+    assert codec == TRANSCRIPT_CODEC_ZLIB
+    assert stored_size * 3 < transcript_size
+    assert transcript_seq == 1
+    restored = client.get(live_state_url).json()
+    assert restored["transcript_text"] == transcript
+    assert restored["is_recording"] is False
+    assert restored["transcript_seq"] == 1
+
+    resumed = client.patch(live_state_url, json={"is_recording": True})
+
+    assert resumed.json()["transcript_text"] == transcript
+    assert asyncio.run(read_stored()) == (True, None)
+    assert client.post(chunks_url, json={"text": "\n마무리"}).json()["seq"] == 2
+
+    assert client.delete(f"/api/reservations/{reservation_id}/minutes-lock").status_code == 204
+    has_live_state, archived = asyncio.run(read_stored())
+    assert has_live_state is False
+    assert archived is not None
+    assert client.get(live_state_url).json()["transcript_text"] == f"{transcript}\n마무리"
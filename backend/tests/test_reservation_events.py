@@ -1,7 +1,35 @@
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
 import pytest
 from fastapi.testclient import TestClient
 
-from app.service.reservation_event_service import ReservationEvent, ReservationEventBroker
+from app.service.reservation_event_service import (
+    PgNotifyReservationEventBroker,
+    ReservationEvent,
+    ReservationEventBroker,
+    ReservationEventFilter,
+    decode_reservation_event,
+    encode_reservation_event,
+    merge_reservation_events,
+)
+
+
+class FakeNotifyChannel:
+    def __init__(self) -> None:
+        self.payloads: list[str] = []
+        self._handler: Callable[[str], Awaitable[None]] | None = None
+
+    async def notify(self, payload: str) -> None:
+        self.payloads.append(payload)
+        if self._handler is not None:
+            await self._handler(payload)
+
+    async def start(self, handler: Callable[[str], Awaitable[None]]) -> None:
+        self._handler = handler
+
+    async def stop(self) -> None:
+        self._handler = None
 
 
 def test_should_require_auth_for_reservation_event_stream(client: TestClient) -> None:
@@ -23,3 +51,333 @@ async def test_should_deliver_published_reservation_event_to_subscriber() -> Non
     assert event.reservation_id == "rsv-1"
 
     await broker.unsubscribe(subscriber)
+
+
+@pytest.mark.asyncio
+async def test_should_deliver_reservation_event_through_notify_channel() -> None:
+    channel = FakeNotifyChannel()
+    broker = PgNotifyReservationEventBroker(channel)
+    await broker.start()
+    subscriber = await broker.subscribe()
+
+    await broker.publish(ReservationEvent(action="deleted", reservation_id="rsv-2"))
+
+    sent = decode_reservation_event(channel.payloads[0])
+    assert sent is not None
+    assert (sent.action, sent.reservation_id) == ("deleted", "rsv-2")
+    event = await subscriber.get()
+    assert event.action == "deleted"
+    assert event.reservation_id == "rsv-2"
+    # 발행한 워커가 매긴 ID를 그대로 쓴다.
+    assert sent.event_id is not None
+    assert event.event_id == sent.event_id
+
+    await broker.unsubscribe(subscriber)
+    await broker.stop()
+
+
+def test_should_ignore_malformed_reservation_event_payload() -> None:
+    assert decode_reservation_event("not-json") is None
+    assert decode_reservation_event('{"action": "moved", "reservation_id": "rsv-1"}') is None
+
+
+@pytest.mark.asyncio
+async def test_should_route_reservation_event_only_to_matching_room_and_window() -> None:
+    broker = ReservationEventBroker()
+    room_a_march = await broker.subscribe(
+        ReservationEventFilter(
+            room_ids=frozenset({"A"}),
+            start_at=datetime(2026, 3, 1, tzinfo=UTC),
+            end_at=datetime(2026, 4, 1, tzinfo=UTC),
+        )
+    )
+    room_a_april = await broker.subscribe(
+        ReservationEventFilter(
+            room_ids=frozenset({"A"}),
+            start_at=datetime(2026, 4, 1, tzinfo=UTC),
+            end_at=datetime(2026, 5, 1, tzinfo=UTC),
+        )
+    )
+    room_b = await broker.subscribe(ReservationEventFilter(room_ids=frozenset({"B"})))
+    everything = await broker.subscribe()
+
+    await broker.publish(
+        ReservationEvent(
+            action="created",
+            reservation_id="rsv-1",
+            room_id="A",
+            start_at=datetime(2026, 3, 10, 1, tzinfo=UTC),
+            end_at=datetime(2026, 3, 10, 2, tzinfo=UTC),
+        )
+    )
+
+    assert room_a_march.qsize() == 1
+    assert room_a_april.empty()
+    assert room_b.empty()
+    assert everything.qsize() == 1
+
+    await broker.publish(
+        ReservationEvent(
+            action="updated",
+            reservation_id="rsv-2",
+            room_id="B",
+            start_at=datetime(2026, 3, 10, 1, tzinfo=UTC),
+            end_at=datetime(2026, 3, 10, 2, tzinfo=UTC),
+            previous_room_id="A",
+            previous_start_at=datetime(2026, 3, 10, 1, tzinfo=UTC),
+            previous_end_at=datetime(2026, 3, 10, 2, tzinfo=UTC),
+        )
+    )
+
+    assert room_a_march.qsize() == 2
+    assert room_a_april.empty()
+    assert room_b.qsize() == 1
+    assert everything.qsize() == 2
+
+    for queue in (room_a_march, room_a_april, room_b, everything):
+        await broker.unsubscribe(queue)
+
+
+def test_should_round_trip_reservation_event_metadata_through_payload() -> None:
+    event = ReservationEvent(
+        action="deleted",
+        reservation_id="rsv-3",
+        previous_room_id="A",
+        previous_start_at=datetime(2026, 3, 10, 1, tzinfo=UTC),
+        previous_end_at=datetime(2026, 3, 10, 2, tzinfo=UTC),
+        event_id="a1b2c3d4-7",
+    )
+
+    assert decode_reservation_event(encode_reservation_event(event)) == event
+
+
+def test_should_reject_reservation_event_stream_with_inverted_window(client: TestClient) -> None:
+    client.post("/api/auth/login", json={"email": "admin@ecminer.com", "password": "ecminer"})
+
+    response = client.get(
+        "/api/reservations/events",
+        params={"start_at": "2026-03-02T00:00:00+09:00", "end_at": "2026-03-01T00:00:00+09:00"},
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_should_replay_only_events_missed_since_last_event_id() -> None:
+    broker = ReservationEventBroker(log_size=10)
+    subscriber = await broker.subscribe()
+    for reservation_id in ("rsv-1", "rsv-2", "rsv-3"):
+        await broker.publish(ReservationEvent(action="created", reservation_id=reservation_id))
+    first = await subscriber.get()
+    await broker.unsubscribe(subscriber)
+
+    assert first.event_id is not None
+    subscription = await broker.open_subscription(last_event_id=first.event_id)
+
+    assert subscription.reset is False
+    assert [event.reservation_id for event in subscription.replay] == ["rsv-2", "rsv-3"]
+    assert subscription.last_event_id == subscription.replay[-1].event_id
+
+    await broker.unsubscribe(subscription.queue)
+
+
+@pytest.mark.asyncio
+async def test_should_replay_missed_events_after_reconnecting_to_another_worker() -> None:
+    handlers: list[Callable[[str], Awaitable[None]]] = []
+
+    class SharedNotifyChannel:
+        # 같은 채널을 LISTEN하는 여러 워커에 같은 순서로 전달한다.
+        async def notify(self, payload: str) -> None:
+            for handler in list(handlers):
+                await handler(payload)
+
+        async def start(self, handler: Callable[[str], Awaitable[None]]) -> None:
+            handlers.append(handler)
+
+        async def stop(self) -> None:
+            pass
+
+    first = PgNotifyReservationEventBroker(SharedNotifyChannel())
+    second = PgNotifyReservationEventBroker(SharedNotifyChannel())
+    await first.start()
+    await second.start()
+    subscriber = await first.subscribe()
+    for reservation_id in ("rsv-1", "rsv-2", "rsv-3"):
+        await second.publish(ReservationEvent(action="created", reservation_id=reservation_id))
+    seen = await subscriber.get()
+    await first.unsubscribe(subscriber)
+
+    # 첫 워커에서 받은 이벤트 ID로 두 번째 워커에 재연결해도 빠진 이벤트만 받는다.
+    subscription = await second.open_subscription(last_event_id=seen.event_id)
+
+    assert subscription.reset is False
+    assert [event.reservation_id for event in subscription.replay] == ["rsv-2", "rsv-3"]
+
+    await second.unsubscribe(subscription.queue)
+    await first.stop()
+    await second.stop()
+
+
+@pytest.mark.asyncio
+async def test_should_request_reset_when_missed_events_exceed_event_log() -> None:
+    broker = ReservationEventBroker(log_size=2)
+    baseline = await broker.open_subscription()
+    await broker.unsubscribe(baseline.queue)
+    for reservation_id in ("rsv-1", "rsv-2", "rsv-3"):
+        await broker.publish(ReservationEvent(action="created", reservation_id=reservation_id))
+
+    overflowed = await broker.open_subscription(last_event_id=baseline.last_event_id)
+    foreign = await broker.open_subscription(last_event_id="otherepoch-1")
+
+    assert overflowed.reset is True
+    assert overflowed.replay == []
+    assert foreign.reset is True
+
+    await broker.unsubscribe(overflowed.queue)
+    await broker.unsubscribe(foreign.queue)
+
+
+def test_should_publish_reservation_summary_with_events(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    published: list[ReservationEvent] = []
+
+    async def record(event: ReservationEvent) -> None:
+        published.append(event)
+
+    monkeypatch.setattr("app.router.reservation.reservation_event_broker.publish", record)
+    client.post("/api/auth/login", json={"email": "admin@ecminer.com", "password": "ecminer"})
+
+    create_response = client.post(
+        "/api/reservations",
+        json={
+            "room_id": "A",
+            "title": "주간 회의",
+            "label": "없음",
+            "start_at": "2026-03-01T10:00:00+09:00",
+            "end_at": "2026-03-01T11:00:00+09:00",
+        },
+    )
+    reservation_id = create_response.json()["id"]
+    client.patch(
+        f"/api/reservations/{reservation_id}",
+        json={
+            "room_id": "B",
+            "title": "장소 변경",
+            "start_at": "2026-03-01T10:00:00+09:00",
+            "end_at": "2026-03-01T11:00:00+09:00",
+        },
+    )
+    client.delete(f"/api/reservations/{reservation_id}")
+
+    created, updated, deleted = published
+    assert (created.action, created.room_id, created.room_name) == ("created", "A", "회의실")
+    assert (created.title, created.label, created.created_by_name) == ("주간 회의", "없음", "admin")
+    assert (updated.room_id, updated.previous_room_id, updated.title) == ("B", "A", "장소 변경")
+    assert (deleted.action, deleted.room_id, deleted.previous_room_id) == ("deleted", None, "B")
+    assert deleted.previous_start_at is not None
+
+
+def test_should_not_publish_event_for_unchanged_reservation_update(
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    published: list[ReservationEvent] = []
+
+    async def record(event: ReservationEvent) -> None:
+        published.append(event)
+
+    monkeypatch.setattr("app.router.reservation.reservation_event_broker.publish", record)
+    client.post("/api/auth/login", json={"email": "admin@ecminer.com", "password": "ecminer"})
+    body = {
+        "room_id": "A",
+        "title": "주간 회의",
+        "start_at": "2026-03-01T10:00:00+09:00",
+        "end_at": "2026-03-01T11:00:00+09:00",
+    }
+    reservation_id = client.post("/api/reservations", json=body).json()["id"]
+
+    unchanged = client.patch(f"/api/reservations/{reservation_id}", json=body)
+    unchanged_minutes = client.patch(f"/api/reservations/{reservation_id}/minutes", json={**body, "title": "주간 회의"})
+
+    assert unchanged.status_code == 200
+    assert unchanged_minutes.status_code == 200
+    assert [event.action for event in published] == ["created"]
+
+
+@pytest.mark.asyncio
+async def test_should_coalesce_burst_of_events_for_same_reservation() -> None:
+    broker = ReservationEventBroker()
+    subscriber = await broker.subscribe()
+
+    await broker.publish(
+        ReservationEvent(
+            action="updated",
+            reservation_id="rsv-1",
+            room_id="A",
+            title="첫 수정",
+            previous_room_id="B",
+        )
+    )
+    await broker.publish(ReservationEvent(action="created", reservation_id="rsv-2", room_id="A"))
+    await broker.publish(
+        ReservationEvent(
+            action="updated",
+            reservation_id="rsv-1",
+            room_id="A",
+            title="두번째 수정",
+            previous_room_id="A",
+        )
+    )
+
+    batch = await subscriber.get_batch()
+
+    assert batch.resync is False
+    assert [event.reservation_id for event in batch.events] == ["rsv-2", "rsv-1"]
+    merged = batch.events[1]
+    assert (merged.title, merged.previous_room_id) == ("두번째 수정", "B")
+    assert batch.last_event_id == merged.event_id
+    assert subscriber.empty()
+
+    await broker.unsubscribe(subscriber)
+
+
+@pytest.mark.asyncio
+async def test_should_send_resync_instead_of_dropping_events_when_subscriber_falls_behind() -> None:
+    broker = ReservationEventBroker(max_pending=2)
+    subscriber = await broker.subscribe()
+
+    for reservation_id in ("rsv-1", "rsv-2", "rsv-3", "rsv-4"):
+        await broker.publish(ReservationEvent(action="created", reservation_id=reservation_id))
+
+    batch = await subscriber.get_batch()
+
+    assert batch.resync is True
+    assert batch.events == []
+    assert batch.last_event_id is not None
+    assert batch.last_event_id.endswith("-4")
+
+    await broker.unsubscribe(subscriber)
+
+
+def test_should_drop_previous_slot_when_created_event_is_coalesced_with_update() -> None:
+    merged = merge_reservation_events(
+        ReservationEvent(action="created", reservation_id="rsv-1", room_id="A"),
+        ReservationEvent(action="updated", reservation_id="rsv-1", room_id="B", previous_room_id="A"),
+    )
+
+    assert (merged.action, merged.room_id, merged.previous_room_id) == ("created", "B", None)
+
+
+@pytest.mark.asyncio
+async def test_should_wake_idle_subscribers_from_shared_heartbeat_task() -> None:
+    broker = ReservationEventBroker(heartbeat_seconds=0.01)
+    await broker.start()
+    subscriber = await broker.subscribe()
+
+    batch = await subscriber.get_batch()
+
+    assert batch.heartbeat is True
+    assert batch.events == []
+    assert batch.resync is False
+
+    await broker.unsubscribe(subscriber)
+    await broker.stop()
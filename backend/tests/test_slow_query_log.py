@@ -0,0 +1,111 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.request_context import current_route
+from app.infra.db import get_db_session_factory
+from app.infra.slow_query_log import SlowQueryLog, _redact_parameters, slow_query_log
+from app.main import app
+
+
+def _login(client: TestClient, email: str, password: str) -> None:
+    response = client.post("/api/auth/login", json={"email": email, "password": password})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_should_record_slow_query_with_route_and_redacted_parameters() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    log = SlowQueryLog(threshold_ms=0, max_entries=2, explain_enabled=True)
+    log.install(engine)
+
+    token = current_route.set("GET /api/timetable")
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT :secret"), {"secret": "top-secret"})
+            await connection.execute(text("SELECT 2"))
+            await connection.execute(text("SELECT 3"))
+    finally:
+        current_route.reset(token)
+        await engine.dispose()
+
+    entries = log.entries()
+    assert [entry.statement for entry in entries] == ["SELECT 3", "SELECT 2"]
+    assert all(entry.route == "GET /api/timetable" for entry in entries)
+    assert all(entry.explain_plan is None for entry in entries)
+
+
+@pytest.mark.asyncio
+async def test_should_not_leave_start_time_behind_when_statement_fails() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    log = SlowQueryLog(threshold_ms=0, max_entries=10, explain_enabled=False)
+    log.install(engine)
+
+    try:
+        async with engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                await connection.execute(text("SELECT * FROM missing_table"))
+            await connection.execute(text("SELECT 1"))
+            raw = await connection.get_raw_connection()
+            assert "slow_query_started_at" not in raw.info
+    finally:
+        log.uninstall(engine)
+        await engine.dispose()
+
+    assert [entry.statement for entry in log.entries()] == ["SELECT 1"]
+
+
+def test_should_redact_slow_query_parameters() -> None:
+    assert _redact_parameters(("top-secret", 3), False) == ["<str>", "<int>"]
+    assert _redact_parameters({"email": "a@b.c"}, False) == ["email=<str>"]
+    assert _redact_parameters([("a",), ("b",)], True) == ["<2 rows>"]
+
+
+def test_should_return_403_when_non_admin_fetches_slow_queries(client: TestClient) -> None:
+    _login(client, "user@ecminer.com", "ecminer2")
+
+    response = client.get("/api/diagnostics/slow-queries")
+
+    assert response.status_code == 403
+
+
+def test_should_return_slow_queries_for_admin(client: TestClient, monkeypatch) -> None:
+    # 모든 쿼리를 슬로우 쿼리로 기록하도록 테스트 DB 엔진에 설치한다.
+    engine = app.dependency_overrides[get_db_session_factory]().kw["bind"]
+    monkeypatch.setattr(slow_query_log, "threshold_ms", 0)
+    monkeypatch.setattr(slow_query_log, "explain_enabled", False)
+    slow_query_log.clear()
+    slow_query_log.install(engine)
+    try:
+        _assert_admin_sees_slow_queries(client)
+    finally:
+        # 공유 테스트 엔진에 붙인 훅은 다음 테스트로 넘기지 않는다.
+        slow_query_log.uninstall(engine)
+        slow_query_log.clear()
+
+
+def _assert_admin_sees_slow_queries(client: TestClient) -> None:
+    _login(client, "admin@ecminer.com", "ecminer")
+    created = client.post(
+        "/api/reservations",
+        json={
+            "room_id": "A",
+            "title": "슬로우 쿼리",
+            "start_at": "2026-03-01T10:00:00+09:00",
+            "end_at": "2026-03-01T11:00:00+09:00",
+        },
+    )
+    assert created.status_code == 201
+    assert client.get(f"/api/reservations/{created.json()['id']}").status_code == 200
+
+    response = client.get("/api/diagnostics/slow-queries")
+
+    assert response.status_code == 200
+    # 경로 변수 대신 라우트 템플릿으로 기록한다.
+    detail_entries = [entry for entry in response.json() if entry["route"] == "GET /api/reservations/{reservation_id}"]
+    assert detail_entries
+    assert any("FROM reservations" in entry["statement"] for entry in detail_entries)
+    assert all(entry["duration_ms"] >= 0 for entry in detail_entries)
+    assert all(created.json()["id"] not in (entry["route"] or "") for entry in response.json())
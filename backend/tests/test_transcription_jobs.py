@@ -0,0 +1,193 @@
+import asyncio
+import time
+from decimal import Decimal
+from typing import IO
+
+from fastapi.testclient import TestClient
+
+from app.service.ai_service import TranscriptionResult
+from app.service.domain import DomainError
+from app.service.transcription_job_service import transcription_job_queue
+
+
+def _start_recording(client: TestClient) -> str:
+    login = client.post("/api/auth/login", json={"email": "admin@ecminer.com", "password": "ecminer"})
+    assert login.status_code == 200
+    created = client.post(
+        "/api/reservations",
+        json={
+            "room_id": "A",
+            "title": "전사 작업",
+            "start_at": "2026-03-01T10:00:00+09:00",
+            "end_at": "2026-03-01T11:00:00+09:00",
+        },
+    )
+    assert created.status_code == 201
+    reservation_id = created.json()["id"]
+    assert client.post(f"/api/reservations/{reservation_id}/minutes-lock", json={"ttl_seconds": 60}).status_code == 200
+    recording = client.patch(f"/api/reservations/{reservation_id}/minutes-live-state", json={"is_recording": True})
+    assert recording.status_code == 200
+    return reservation_id
+
+
+def _submit(client: TestClient, reservation_id: str, audio: bytes) -> dict[str, object]:
+    response = client.post(
+        "/api/ai/transcription-jobs",
+        params={"reservation_id": reservation_id},
+        content=audio,
+        headers={"Content-Type": "audio/wav"},
+    )
+    assert response.status_code == 202
+    return response.json()
+
+
+def _wait_for_transcript(client: TestClient, reservation_id: str, expected: str) -> str:
+    deadline = time.monotonic() + 5
+    transcript = ""
+    while time.monotonic() < deadline:
+        transcript = client.get(f"/api/reservations/{reservation_id}/minutes-live-state").json()["transcript_text"]
+        if transcript == expected:
+            break
+        time.sleep(0.05)
+    return transcript
+
+
+def test_should_commit_transcription_jobs_in_submission_order(client: TestClient, monkeypatch) -> None:
+    async def fake_transcribe_audio(
+        audio: IO[bytes],
+        audio_size: int,
+        mime_type: str | None,
+        previous_text: str | None,
+    ) -> TranscriptionResult:
+        text = audio.read().decode()
+        # 먼저 제출한 청크가 늦게 끝나도 전사에는 제출 순서대로 붙어야 한다.
+        if text == "첫 번째":
+            await asyncio.sleep(0.3)
+        return TranscriptionResult(text=text, usd_cost=Decimal("0"))
+
+    monkeypatch.setattr("app.service.transcription_job_service.transcribe_audio", fake_transcribe_audio)
+    reservation_id = _start_recording(client)
+
+    with client.websocket_connect(f"/api/reservations/{reservation_id}/minutes-ws") as viewer:
+        assert viewer.receive_json()["type"] == "snapshot"
+        first = _submit(client, reservation_id, "첫 번째".encode())
+        second = _submit(client, reservation_id, "두 번째".encode())
+        assert (first["seq"], second["seq"]) == (1, 2)
+
+        chunks: list[str] = []
+        jobs: list[tuple[int, str]] = []
+        while len(jobs) < 2:
+            message = viewer.receive_json()
+            if message["type"] == "transcript_chunk":
+                chunks.append(message["chunk"]["text"])
+            elif message["type"] == "transcription":
+                jobs.append((message["job"]["seq"], message["job"]["status"]))
+        transcript = _wait_for_transcript(client, reservation_id, "첫 번째\n두 번째")
+
+    assert chunks == ["첫 번째", "\n두 번째"]
+    assert jobs == [(1, "done"), (2, "done")]
+    assert transcript == "첫 번째\n두 번째"
+
+
+def test_should_retry_transcription_job_when_upstream_is_unavailable(client: TestClient, monkeypatch) -> None:
+    calls: list[int] = []
+
+    async def flaky_transcribe_audio(
+        audio: IO[bytes],
+        audio_size: int,
+        mime_type: str | None,
+        previous_text: str | None,
+    ) -> TranscriptionResult | DomainError:
+        calls.append(audio_size)
+        if len(calls) == 1:
+            return DomainError(code="UPSTREAM_UNAVAILABLE", message="전사에 실패했습니다: timeout")
+        return TranscriptionResult(text=audio.read().decode(), usd_cost=Decimal("0"))
+
+    monkeypatch.setattr("app.service.transcription_job_service.transcribe_audio", flaky_transcribe_audio)
+    monkeypatch.setattr(transcription_job_queue, "retry_base_seconds", 0)
+    reservation_id = _start_recording(client)
+
+    with client.websocket_connect(f"/api/reservations/{reservation_id}/minutes-ws") as viewer:
+        assert viewer.receive_json()["type"] == "snapshot"
+        _submit(client, reservation_id, "다시 시도".encode())
+        # 전사 작업이 끝난 뒤에 읽어야 테스트 DB의 공유 커넥션에서 작업 트랜잭션과 겹치지 않는다.
+        message = viewer.receive_json()
+        while message["type"] != "transcription":
+            message = viewer.receive_json()
+        transcript = _wait_for_transcript(client, reservation_id, "다시 시도")
+
+    assert message["job"]["status"] == "done"
+    assert transcript == "다시 시도"
+    assert len(calls) == 2
+
+
+def test_should_append_and_charge_job_result_that_arrives_after_recording_stops(
+    client: TestClient, monkeypatch
+) -> None:
+    async def slow_transcribe_audio(
+        audio: IO[bytes],
+        audio_size: int,
+        mime_type: str | None,
+        previous_text: str | None,
+    ) -> TranscriptionResult:
+        await asyncio.sleep(0.3)
+        return TranscriptionResult(text=audio.read().decode(), usd_cost=Decimal("0.01"))
+
+    monkeypatch.setattr("app.service.transcription_job_service.transcribe_audio", slow_transcribe_audio)
+    reservation_id = _start_recording(client)
+
+    with client.websocket_connect(f"/api/reservations/{reservation_id}/minutes-ws") as viewer:
+        assert viewer.receive_json()["type"] == "snapshot"
+        _submit(client, reservation_id, "마지막 청크".encode())
+        # 녹음 종료가 전사 결과보다 먼저 와서 전사는 이미 보관 테이블로 옮겨진 상태다.
+        stopped = client.patch(f"/api/reservations/{reservation_id}/minutes-live-state", json={"is_recording": False})
+        assert stopped.status_code == 200
+        message = viewer.receive_json()
+        while message["type"] != "transcription":
+            message = viewer.receive_json()
+        transcript = _wait_for_transcript(client, reservation_id, "마지막 청크")
+
+    assert message["job"]["status"] == "done"
+    assert transcript == "마지막 청크"
+    usage = client.get("/api/users/ai-usage").json()
+    admin_row = next(item for item in usage["items"] if item["email"] == "admin@ecminer.com")
+    assert admin_row["used_usd"] == 0.01
+
+
+def test_should_broadcast_fixed_message_when_transcription_job_raises(client: TestClient, monkeypatch) -> None:
+    async def broken_transcribe_audio(
+        audio: IO[bytes],
+        audio_size: int,
+        mime_type: str | None,
+        previous_text: str | None,
+    ) -> TranscriptionResult:
+        raise RuntimeError("secret upstream detail")
+
+    monkeypatch.setattr("app.service.transcription_job_service.transcribe_audio", broken_transcribe_audio)
+    reservation_id = _start_recording(client)
+
+    with client.websocket_connect(f"/api/reservations/{reservation_id}/minutes-ws") as viewer:
+        assert viewer.receive_json()["type"] == "snapshot"
+        _submit(client, reservation_id, "실패".encode())
+        message = viewer.receive_json()
+        while message["type"] != "transcription":
+            message = viewer.receive_json()
+
+    assert message["job"]["status"] == "failed"
+    assert message["job"]["error"]["code"] == "UPSTREAM_UNAVAILABLE"
+    assert "secret" not in message["job"]["error"]["message"]
+
+
+def test_should_reject_transcription_job_without_minutes_lock(client: TestClient) -> None:
+    reservation_id = _start_recording(client)
+    assert client.delete(f"/api/reservations/{reservation_id}/minutes-lock").status_code == 204
+
+    response = client.post(
+        "/api/ai/transcription-jobs",
+        params={"reservation_id": reservation_id},
+        content=b"audio",
+        headers={"Content-Type": "audio/wav"},
+    )
+
+    assert response.status_code == 403
+    assert response.json()["error"]["code"] == "FORBIDDEN"
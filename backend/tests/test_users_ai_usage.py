@@ -3,11 +3,23 @@ from datetime import datetime
 from decimal import Decimal
 
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 
-from app.infra.db import get_db_session
+from app.infra.ai_usage_ledger import AiUsageLedgerEntry, list_pending_ai_usage_ledger_entries
+from app.infra.db import get_db_session, get_db_session_factory
 from app.infra.global_ai_quota import GlobalAiQuota
 from app.infra.user_ai_quota import UserAiQuota
 from app.main import app
+from app.service.ai_quota_service import (
+    AiQuotaReservation,
+    AiUsageCache,
+    ai_usage_cache,
+    release_ai_quota,
+    reserve_ai_quota,
+    rollup_ai_usage_ledger,
+    settle_ai_quota,
+)
+from app.service.domain import DomainError
 
 
 def _login(client: TestClient, email: str, password: str) -> None:
@@ -129,3 +141,149 @@ def test_should_use_user_usage_sum_when_global_summary_is_stale(client: TestClie
         "remaining_usd": 8.9405,
         "period_month": period_month,
     }
+
+
+async def _record_usage_and_roll_up() -> tuple[list[Decimal], int, int, Decimal, int]:
+    session_factory = app.dependency_overrides[get_db_session_factory]()
+    async with session_factory() as session:
+        for usd_cost in (Decimal("0.100000"), Decimal("0.025000")):
+            quota = await reserve_ai_quota("2", usd_cost, session)
+            assert not isinstance(quota, DomainError)
+            await settle_ai_quota(quota, usd_cost, session)
+    async with session_factory() as session:
+        # 롤업 전에는 원장에만 쌓이고 합계 행은 건드리지 않는다.
+        pending = [entry.usd_cost for entry in await list_pending_ai_usage_ledger_entries(session, 10)]
+        rolled_up_before = len(list((await session.execute(select(UserAiQuota))).scalars()))
+    async with session_factory() as session:
+        rolled_up = await rollup_ai_usage_ledger(session)
+    async with session_factory() as session:
+        user_quota = await session.get(UserAiQuota, "2")
+        assert user_quota is not None
+        rolled_up_again = await rollup_ai_usage_ledger(session)
+    return pending, rolled_up_before, rolled_up, Decimal(str(user_quota.used_usd)), rolled_up_again
+
+
+def test_should_record_usage_in_ledger_and_roll_up_into_quota_rows(client: TestClient) -> None:
+    _login(client, "admin@ecminer.com", "ecminer")
+
+    pending, quota_rows_before, rolled_up, user_used_usd, rolled_up_again = asyncio.run(_record_usage_and_roll_up())
+
+    assert pending == [Decimal("0.100000"), Decimal("0.025000")]
+    assert quota_rows_before == 0
+    assert rolled_up == 2
+    assert user_used_usd == Decimal("0.125000")
+    assert rolled_up_again == 0
+
+    response = client.get("/api/users/ai-usage")
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["summary"]["used_usd"] == 0.125
+    assert next(row for row in payload["items"] if row["user_id"] == "2")["used_usd"] == 0.125
+
+
+async def _record_usage_without_roll_up() -> None:
+    session_factory = app.dependency_overrides[get_db_session_factory]()
+    async with session_factory() as session:
+        quota = await reserve_ai_quota("2", Decimal("0.300000"), session)
+        assert not isinstance(quota, DomainError)
+        applied = await settle_ai_quota(quota, Decimal("0.300000"), session)
+        assert applied.user_used_usd == Decimal("0.300000")
+
+
+def test_should_include_pending_ledger_usage_in_admin_overview(client: TestClient) -> None:
+    _login(client, "admin@ecminer.com", "ecminer")
+    asyncio.run(_record_usage_without_roll_up())
+
+    response = client.get("/api/users/ai-usage")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["summary"]["used_usd"] == 0.3
+    user_row = next(row for row in payload["items"] if row["user_id"] == "2")
+    assert user_row["used_usd"] == 0.3
+    assert user_row["updated_at"] is not None
+
+
+async def _reserve_until_exhausted(period_month: str) -> tuple[list[bool], bool, Decimal, Decimal]:
+    session_factory = app.dependency_overrides[get_db_session_factory]()
+    async with session_factory() as session:
+        session.add(
+            GlobalAiQuota(
+                quota_key="global",
+                monthly_limit_usd=Decimal("0.0100"),
+                used_usd=Decimal("0"),
+                period_month=period_month,
+            )
+        )
+        await session.commit()
+    async with session_factory() as session:
+        # 동시에 들어온 호출들이 같은 잔액을 보지 않도록 예약이 잔액을 먼저 깎는다.
+        reservations = [await reserve_ai_quota("2", Decimal("0.005"), session) for _ in range(3)]
+        accepted = [not isinstance(reservation, DomainError) for reservation in reservations]
+        first, second = (reservation for reservation in reservations if isinstance(reservation, AiQuotaReservation))
+        release_ai_quota(second)
+        reopened = not isinstance(await reserve_ai_quota("2", Decimal("0.005"), session), DomainError)
+        applied = await settle_ai_quota(first, Decimal("0.002"), session)
+    return accepted, reopened, applied.global_used_usd, applied.user_used_usd
+
+
+def test_should_hold_estimated_cost_until_settled(client: TestClient) -> None:
+    period_month = datetime.now().strftime("%Y-%m")
+
+    accepted, reopened, global_used_usd, user_used_usd = asyncio.run(_reserve_until_exhausted(period_month))
+
+    assert accepted == [True, True, False]
+    assert reopened is True
+    assert global_used_usd == Decimal("0.002")
+    assert user_used_usd == Decimal("0.002")
+
+
+async def _load_global_status_with_pending_usage(period_month: str) -> Decimal:
+    session_factory = app.dependency_overrides[get_db_session_factory]()
+    async with session_factory() as session:
+        session.add(
+            GlobalAiQuota(
+                quota_key="global",
+                monthly_limit_usd=Decimal("10.0000"),
+                used_usd=Decimal("0.200000"),
+                period_month=period_month,
+            )
+        )
+        session.add(AiUsageLedgerEntry(user_id="2", usd_cost=Decimal("0.050000"), period_month=period_month))
+        await session.commit()
+    ai_usage_cache.clear()
+    async with session_factory() as session:
+        status = await ai_usage_cache.get_global_status(session, period_month)
+    return status.used_usd
+
+
+def test_should_load_global_usage_from_rolled_up_total_and_pending_ledger(client: TestClient) -> None:
+    period_month = datetime.now().strftime("%Y-%m")
+
+    used_usd = asyncio.run(_load_global_status_with_pending_usage(period_month))
+
+    assert used_usd == Decimal("0.250000")
+
+
+async def _hold_and_sweep(monkeypatch, period_month: str) -> tuple[Decimal, Decimal]:
+    now = [1000.0]
+    monkeypatch.setattr("app.service.ai_quota_service.time.monotonic", lambda: now[0])
+    cache = AiUsageCache(hold_ttl_seconds=60)
+    # 스트림 본문을 보내기 전에 끊겨 정산/취소되지 않은 예약이다.
+    cache.hold(period_month, Decimal("0.010000"))
+    session_factory = app.dependency_overrides[get_db_session_factory]()
+    async with session_factory() as session:
+        await cache.get_global_status(session, period_month)
+        held_before = cache.held_usd(period_month)
+        now[0] += 61
+        await cache.get_global_status(session, period_month)
+    return held_before, cache.held_usd(period_month)
+
+
+def test_should_drop_unsettled_hold_after_ttl(client: TestClient, monkeypatch) -> None:
+    period_month = datetime.now().strftime("%Y-%m")
+
+    held_before, held_after = asyncio.run(_hold_and_sweep(monkeypatch, period_month))
+
+    assert held_before == Decimal("0.010000")
+    assert held_after == Decimal("0")
@@ -5,6 +5,23 @@ type ApiErrorPayload = {
   };
 };
 
+export class ApiError extends Error {
+  readonly status: number;
+  readonly code?: string;
+
+  constructor(message: string, status: number, code?: string) {
+    super(message);
+    this.name = 'ApiError';
+    this.status = status;
+    this.code = code;
+  }
+}
+
+// 다른 사용자가 먼저 저장해 version이 맞지 않을 때(409 VERSION_CONFLICT)
+export function isVersionConflictError(error: unknown): error is ApiError {
+  return error instanceof ApiError && error.status === 409 && error.code === 'VERSION_CONFLICT';
+}
+
 export type UserDto = {
   id: string;
   name: string;
@@ -85,6 +102,7 @@ export type ReservationDto = {
     name: string;
     email: string;
   }>;
+  version?: number;
 };
 
 type ReservationUpsertPayload = {
@@ -100,6 +118,7 @@ type ReservationUpsertPayload = {
   meeting_result?: string;
   other_notes?: string;
   minutes_attachment?: string;
+  version?: number;
 };
 
 type ReservationQuery = {
@@ -125,23 +144,53 @@ export type MinutesLiveStateDto = {
   updated_by_user_id?: string | null;
   updated_by_name?: string | null;
   updated_at: string;
+  transcript_seq?: number;
+};
+
+export type MinutesTranscriptChunkDto = {
+  reservation_id: string;
+  seq: number;
+  text: string;
+  created_at: string;
 };
 
+export type MinutesRoomMessage =
+  | { type: 'snapshot'; lock: MinutesLockDto | null; live_state: MinutesLiveStateDto }
+  | { type: 'presence'; members: { user_id: string; name: string }[] }
+  | { type: 'lock'; lock: MinutesLockDto | null }
+  | { type: 'live_state'; live_state: MinutesLiveStateDto }
+  | { type: 'transcript_chunk'; chunk: MinutesTranscriptChunkDto }
+  | { type: 'transcription'; job: TranscriptionJobEventDto }
+  | { type: 'error'; error: { code: string; message: string } };
+
 type UpdateMinutesLiveStatePayload = {
   transcript_text?: string;
   is_recording?: boolean;
 };
 
-type TranscribeChunkPayload = {
-  audio_base64: string;
-  mime_type?: string;
-  previous_text?: string;
-};
+export type MinutesRoomClientMessage =
+  | { type: 'acquire_lock' | 'heartbeat'; ttl_seconds: number }
+  | { type: 'release_lock' }
+  | ({ type: 'live_state' } & UpdateMinutesLiveStatePayload);
 
 export type TranscribeChunkResult = {
   text: string;
 };
 
+export type TranscriptionJobDto = {
+  reservation_id: string;
+  seq: number;
+  pending: number;
+};
+
+export type TranscriptionJobEventDto = {
+  seq: number;
+  user_id: string;
+  status: 'done' | 'failed';
+  transcript_seq?: number | null;
+  error?: { code: string; message: string };
+};
+
 type MinutesSuggestionPayload = {
   transcript: string;
   existing_agenda?: string;
@@ -155,6 +204,13 @@ export type MinutesSuggestionResult = {
   meeting_result: string[];
 };
 
+export type MinutesSuggestionSection = keyof MinutesSuggestionResult;
+
+type MinutesSuggestionStreamEvent =
+  | { type: 'item'; section: MinutesSuggestionSection; text: string }
+  | ({ type: 'done' } & MinutesSuggestionResult)
+  | ({ type: 'error' } & ApiErrorPayload);
+
 export type ReservationEventDto = {
   action: 'created' | 'updated' | 'deleted';
   reservation_id: string;
@@ -179,13 +235,15 @@ async function requestJson<T>(path: string, init?: RequestInit): Promise<T> {
   if (!response.ok) {
     const fallbackMessage = `요청 실패 (${response.status})`;
     let message = fallbackMessage;
+    let code: string | undefined;
     try {
       const payload = (await response.json()) as ApiErrorPayload;
       message = payload.error?.message ?? fallbackMessage;
+      code = payload.error?.code;
     } catch {
       message = fallbackMessage;
     }
-    throw new Error(message);
+    throw new ApiError(message, response.status, code);
   }
 
   if (response.status === 204) {
@@ -364,24 +422,24 @@ export async function deleteReservation(reservationId: string): Promise<void> {
   });
 }
 
-export function openReservationEvents(): EventSource {
-  return new EventSource(`${API_BASE}/reservations/events`, { withCredentials: true });
-}
-
-export async function getMinutesLock(reservationId: string): Promise<MinutesLockDto | null> {
-  return requestJson<MinutesLockDto | null>(`/reservations/${reservationId}/minutes-lock`, {
-    method: 'GET',
+export function openReservationEvents(filter?: {
+  roomIds?: string[];
+  startAt?: string;
+  endAt?: string;
+}): EventSource {
+  const params = new URLSearchParams();
+  filter?.roomIds?.forEach((roomId) => params.append('room_id', roomId));
+  if (filter?.startAt) params.set('start_at', filter.startAt);
+  if (filter?.endAt) params.set('end_at', filter.endAt);
+  const query = params.toString();
+  return new EventSource(`${API_BASE}/reservations/events${query ? `?${query}` : ''}`, {
+    withCredentials: true,
   });
 }
 
-export async function acquireMinutesLock(
-  reservationId: string,
-  ttlSeconds = 15
-): Promise<MinutesLockDto> {
-  return requestJson<MinutesLockDto>(`/reservations/${reservationId}/minutes-lock`, {
-    method: 'POST',
-    body: JSON.stringify({ ttl_seconds: ttlSeconds }),
-  });
+export function openMinutesRoom(reservationId: string): WebSocket {
+  const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+  return new WebSocket(`${protocol}//${window.location.host}${API_BASE}/reservations/${reservationId}/minutes-ws`);
 }
 
 export async function releaseMinutesLock(reservationId: string): Promise<void> {
@@ -396,22 +454,45 @@ export async function getMinutesLiveState(reservationId: string): Promise<Minute
   });
 }
 
-export async function updateMinutesLiveState(
-  reservationId: string,
-  payload: UpdateMinutesLiveStatePayload
-): Promise<MinutesLiveStateDto> {
-  return requestJson<MinutesLiveStateDto>(`/reservations/${reservationId}/minutes-live-state`, {
-    method: 'PATCH',
-    body: JSON.stringify(payload),
+// 서버도 직전 전사는 마지막 1000자만 힌트로 쓴다.
+const PREVIOUS_TEXT_MAX_CHARS = 1000;
+
+function encodePreviousTextHeader(previousText: string): string {
+  // 헤더는 ASCII만 허용하므로 UTF-8 바이트를 base64로 감싼다.
+  const bytes = new TextEncoder().encode(previousText.slice(-PREVIOUS_TEXT_MAX_CHARS));
+  let binary = '';
+  bytes.forEach((byte) => {
+    binary += String.fromCharCode(byte);
   });
+  return btoa(binary);
 }
 
-export async function transcribeChunk(
-  payload: TranscribeChunkPayload
+export async function transcribeAudio(
+  audio: Blob,
+  previousText?: string
 ): Promise<TranscribeChunkResult> {
-  return requestJson<TranscribeChunkResult>('/ai/transcribe-chunk', {
+  // base64로 감싸지 않고 녹음 Blob을 그대로 올린다. 직전 전사는 URL 길이 제한을 피해 헤더로 보낸다.
+  const headers: Record<string, string> = { 'Content-Type': audio.type || 'audio/webm' };
+  if (previousText) headers['X-Previous-Text'] = encodePreviousTextHeader(previousText);
+  return requestJson<TranscribeChunkResult>('/ai/transcribe-audio', {
     method: 'POST',
-    body: JSON.stringify(payload),
+    headers,
+    body: audio,
+  });
+}
+
+export async function submitTranscriptionJob(
+  reservationId: string,
+  audio: Blob,
+  options?: { paragraphBreak?: boolean }
+): Promise<TranscriptionJobDto> {
+  // 접수만 받고 바로 돌아온다. 결과는 회의록 실시간 이벤트(transcript/transcription)로 온다.
+  const params = new URLSearchParams({ reservation_id: reservationId });
+  if (options?.paragraphBreak) params.set('paragraph_break', 'true');
+  return requestJson<TranscriptionJobDto>(`/ai/transcription-jobs?${params.toString()}`, {
+    method: 'POST',
+    headers: { 'Content-Type': audio.type || 'audio/webm' },
+    body: audio,
   });
 }
 
@@ -423,3 +504,49 @@ export async function suggestMinutesFromTranscript(
     body: JSON.stringify(payload),
   });
 }
+
+export async function streamMinutesSuggestion(
+  payload: MinutesSuggestionPayload,
+  onItem: (section: MinutesSuggestionSection, text: string) => void
+): Promise<MinutesSuggestionResult> {
+  // 항목은 파싱되는 대로 onItem으로 넘기고, 마지막 done 줄의 전체 결과를 돌려준다.
+  const response = await fetch(`${API_BASE}/ai/suggest-minutes/stream`, {
+    method: 'POST',
+    credentials: 'include',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(payload),
+  });
+  if (!response.ok || !response.body) {
+    const fallbackMessage = `요청 실패 (${response.status})`;
+    let message = fallbackMessage;
+    try {
+      const errorPayload = (await response.json()) as ApiErrorPayload;
+      message = errorPayload.error?.message ?? fallbackMessage;
+    } catch {
+      message = fallbackMessage;
+    }
+    throw new Error(message);
+  }
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffered = '';
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (value) buffered += value;
+    const lines = buffered.split('\n');
+    buffered = done ? '' : (lines.pop() ?? '');
+    for (const line of lines) {
+      if (!line.trim()) continue;
+      const event = JSON.parse(line) as MinutesSuggestionStreamEvent;
+      if (event.type === 'item') {
+        onItem(event.section, event.text);
+      } else if (event.type === 'done') {
+        return event;
+      } else {
+        throw new Error(event.error?.message ?? 'AI 제안 생성에 실패했습니다.');
+      }
+    }
+    if (done) break;
+  }
+  throw new Error('AI 제안 생성이 중간에 끊겼습니다.');
+}
@@ -41,6 +41,7 @@ type ReservationStatus = {
   end: Date;
   creatorEmail: string;
   creatorName?: string;
+  version?: number;
 };
 
 type RoomOption = {
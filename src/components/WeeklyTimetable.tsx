@@ -38,6 +38,7 @@ export type TimetableReservation = CalendarEvent & {
   minutesAttachment: string;
   creatorEmail: string;
   creatorName?: string;
+  version?: number;
 };
 
 type WeeklyTimetableProps = {
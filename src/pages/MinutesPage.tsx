@@ -17,15 +17,18 @@ import {
   serializeExternalAttendees,
 } from '../utils/externalAttendees';
 import {
-  acquireMinutesLock as acquireMinutesLockApi,
   getMinutesLiveState as getMinutesLiveStateApi,
-  getMinutesLock as getMinutesLockApi,
+  isVersionConflictError,
+  openMinutesRoom,
   releaseMinutesLock as releaseMinutesLockApi,
-  suggestMinutesFromTranscript,
-  transcribeChunk,
-  updateMinutesLiveState as updateMinutesLiveStateApi,
+  streamMinutesSuggestion,
+  submitTranscriptionJob,
+  type MinutesLiveStateDto,
   type MinutesLockDto,
+  type MinutesRoomClientMessage,
+  type MinutesRoomMessage,
   type MinutesSuggestionResult,
+  type TranscriptionJobEventDto,
 } from '../api';
 
 type MinutesDraft = {
@@ -50,7 +53,14 @@ type EditLock = {
   updatedAt: number;
 };
 
+type PendingLockRequest = {
+  resolve: (acquired: boolean) => void;
+  timer: number;
+};
+
+const LOCK_TTL_SECONDS = 15;
 const LOCK_HEARTBEAT_MS = 3000;
+const LOCK_REQUEST_TIMEOUT_MS = 5000;
 const LIVE_SYNC_MS = 5000;
 const SILENCE_PARAGRAPH_MS = 1200;
 const AUDIO_LEVEL_THRESHOLD = 0.018;
@@ -60,6 +70,7 @@ const BULLET_SYMBOLS = ['•', '◦', '▪', '▫'] as const;
 const BULLET_PATTERN = /^(\t{0,3})([•◦▪▫])\s?(.*)$/;
 const RECORDING_SEGMENT_SECONDS = 15;
 const MIN_FINAL_SEGMENT_SECONDS = 0.75;
+const TRANSCRIPTION_DRAIN_TIMEOUT_MS = 30000;
 const LEAVE_EDIT_CONFIRM_MESSAGE =
   '수정완료를 누르지 않고 나가면 변경사항이 저장되지 않습니다. 이동하시겠습니까?';
 const GENERATING_SUMMARY_BLOCK_MESSAGE =
@@ -349,6 +360,7 @@ function MinutesPage() {
   const [sharedIsRecording, setSharedIsRecording] = useState(false);
   const [sharedRecorderName, setSharedRecorderName] = useState('');
   const [sharedRecorderUserId, setSharedRecorderUserId] = useState('');
+  const [roomMembers, setRoomMembers] = useState<{ user_id: string; name: string }[]>([]);
   const [summaryGeneratedAt, setSummaryGeneratedAt] = useState<number | null>(null);
   const [summarySuggestion, setSummarySuggestion] = useState<MinutesSuggestionResult>({
     agenda: [],
@@ -356,6 +368,11 @@ function MinutesPage() {
     meeting_result: [],
   });
   const activeLockRef = useRef<EditLock | null>(null);
+  const isEditingRef = useRef(false);
+  const roomSocketRef = useRef<WebSocket | null>(null);
+  const pendingLockRequestRef = useRef<PendingLockRequest | null>(null);
+  const transcriptSeqRef = useRef(0);
+  const handleRoomMessageRef = useRef<(message: MinutesRoomMessage) => void>(() => undefined);
   const historyRef = useRef<MinutesDraft[]>([]);
   const lastSavedKeyRef = useRef('');
   const isSavingRef = useRef(false);
@@ -373,11 +390,9 @@ function MinutesPage() {
   const segmentSampleRateRef = useRef(0);
   const segmentChunksRef = useRef<Float32Array[]>([]);
   const segmentSampleCountRef = useRef(0);
-  const recordingSessionBaseTextRef = useRef('');
-  const recordingSessionTextRef = useRef('');
-  const transcriptTextRef = useRef('');
-  const transcriptQueueRef = useRef(Promise.resolve());
+  const recordingSessionChunkCountRef = useRef(0);
   const transcribePendingCountRef = useRef(0);
+  const transcriptionDrainResolversRef = useRef<(() => void)[]>([]);
 
   const agendaRef = useRef<HTMLTextAreaElement>(null);
   const meetingContentRef = useRef<HTMLTextAreaElement>(null);
@@ -419,37 +434,54 @@ function MinutesPage() {
     };
   }, []);
 
-  const readLock = useCallback(async (): Promise<EditLock | null> => {
-    if (!reservationId) return null;
-    const result = await getMinutesLockApi(reservationId);
-    if (!result) return null;
-    return toEditLock(result);
-  }, [reservationId, toEditLock]);
+  const sendRoomMessage = useCallback((message: MinutesRoomClientMessage) => {
+    const socket = roomSocketRef.current;
+    if (!socket || socket.readyState !== WebSocket.OPEN) return false;
+    socket.send(JSON.stringify(message));
+    return true;
+  }, []);
+
+  const settleLockRequest = useCallback((acquired: boolean, message?: string) => {
+    const pending = pendingLockRequestRef.current;
+    if (!pending) return;
+    pendingLockRequestRef.current = null;
+    window.clearTimeout(pending.timer);
+    if (message) setSaveMessage(message);
+    pending.resolve(acquired);
+  }, []);
 
   const releaseLock = useCallback(async () => {
     if (!reservationId) return;
     try {
-      await releaseMinutesLockApi(reservationId);
+      // 채널이 끊겨 있을 때만 HTTP로 푼다.
+      if (!sendRoomMessage({ type: 'release_lock' })) {
+        await releaseMinutesLockApi(reservationId);
+      }
     } finally {
       setActiveLock(null);
     }
-  }, [reservationId]);
-
-  const acquireLock = useCallback(async () => {
-    if (!reservationId) return false;
-    try {
-      const result = await acquireMinutesLockApi(reservationId, 15);
-      setActiveLock(toEditLock(result));
-      return true;
-    } catch (error) {
-      const message =
-        error instanceof Error ? error.message : '회의록 수정 권한을 확인할 수 없습니다.';
-      setSaveMessage(message);
-      const current = await readLock();
-      setActiveLock(current);
-      return false;
-    }
-  }, [readLock, reservationId, toEditLock]);
+  }, [reservationId, sendRoomMessage]);
+
+  // 잠금은 협업 채널로 잡고, 결과는 같은 채널의 lock/error 메시지로 확인한다.
+  const acquireLock = useCallback(
+    () =>
+      new Promise<boolean>((resolve) => {
+        if (!reservationId || pendingLockRequestRef.current) {
+          resolve(false);
+          return;
+        }
+        if (!sendRoomMessage({ type: 'acquire_lock', ttl_seconds: LOCK_TTL_SECONDS })) {
+          setSaveMessage('회의록 협업 채널에 연결하는 중입니다. 잠시 후 다시 시도하세요.');
+          resolve(false);
+          return;
+        }
+        const timer = window.setTimeout(() => {
+          settleLockRequest(false, '회의록 수정 권한을 확인할 수 없습니다.');
+        }, LOCK_REQUEST_TIMEOUT_MS);
+        pendingLockRequestRef.current = { resolve, timer };
+      }),
+    [reservationId, sendRoomMessage, settleLockRequest]
+  );
 
   const loadLatestMinutesSnapshot = useCallback(async () => {
     if (!reservationId) return;
@@ -468,36 +500,42 @@ function MinutesPage() {
     }
   }, [getReservationMinutes, reservationId]);
 
+  const applyReservationToDraft = useCallback(
+    (item: AppReservation) => {
+      const nextDraft: MinutesDraft = {
+        label: item.label ?? reservationLabels[0] ?? '',
+        title: item.title ?? '',
+        dateInput: format(item.start, 'yyyy-MM-dd'),
+        startTimeInput: format(item.start, 'HH:mm'),
+        endTimeInput: format(item.end, 'HH:mm'),
+        externalAttendees: item.externalAttendees ?? '',
+        agenda: item.agenda ?? '',
+        meetingContent: item.meetingContent ?? '',
+        meetingResult: item.meetingResult ?? '',
+        otherNotes: item.otherNotes ?? '',
+      };
+
+      setDraft(nextDraft);
+      setSelectedAttendees(item.attendees ?? []);
+      setExternalAttendeeTokens(parseExternalAttendees(item.externalAttendees ?? ''));
+      setExternalAttendeeQuery('');
+      setAttendeeQuery('');
+      historyRef.current = [];
+      setSaveMessage('');
+      lastSavedKeyRef.current = JSON.stringify({
+        draft: nextDraft,
+        attendees: (item.attendees ?? []).map((attendee) => attendee.id),
+      });
+    },
+    [reservationLabels]
+  );
+
   useEffect(() => {
     if (!activeReservation || isEditing) {
       return;
     }
-
-    const nextDraft: MinutesDraft = {
-      label: activeReservation.label ?? reservationLabels[0] ?? '',
-      title: activeReservation.title ?? '',
-      dateInput: format(activeReservation.start, 'yyyy-MM-dd'),
-      startTimeInput: format(activeReservation.start, 'HH:mm'),
-      endTimeInput: format(activeReservation.end, 'HH:mm'),
-      externalAttendees: activeReservation.externalAttendees ?? '',
-      agenda: activeReservation.agenda ?? '',
-      meetingContent: activeReservation.meetingContent ?? '',
-      meetingResult: activeReservation.meetingResult ?? '',
-      otherNotes: activeReservation.otherNotes ?? '',
-    };
-
-    setDraft(nextDraft);
-    setSelectedAttendees(activeReservation.attendees ?? []);
-    setExternalAttendeeTokens(parseExternalAttendees(activeReservation.externalAttendees ?? ''));
-    setExternalAttendeeQuery('');
-    setAttendeeQuery('');
-    historyRef.current = [];
-    setSaveMessage('');
-    lastSavedKeyRef.current = JSON.stringify({
-      draft: nextDraft,
-      attendees: (activeReservation.attendees ?? []).map((attendee) => attendee.id),
-    });
-  }, [activeReservation, reservationLabels, isEditing]);
+    applyReservationToDraft(activeReservation);
+  }, [activeReservation, applyReservationToDraft, isEditing]);
 
   useEffect(() => {
     setExternalAttendeeTokens(parseExternalAttendees(draft.externalAttendees));
@@ -531,37 +569,29 @@ function MinutesPage() {
   }, [draft.otherNotes]);
 
   useEffect(() => {
+    isEditingRef.current = isEditing;
     if (!isEditing) return;
+    // 채널이 끊겨 있으면 건너뛰고, 재접속 스냅샷을 받을 때 잠금을 다시 잡는다.
     const heartbeat = window.setInterval(() => {
-      void (async () => {
-        if (!reservationId) return;
-        try {
-          const result = await acquireMinutesLockApi(reservationId, 15);
-          setActiveLock(toEditLock(result));
-        } catch {
-          setIsEditing(false);
-        }
-      })();
+      sendRoomMessage({ type: 'heartbeat', ttl_seconds: LOCK_TTL_SECONDS });
     }, LOCK_HEARTBEAT_MS);
     return () => window.clearInterval(heartbeat);
-  }, [isEditing, reservationId, toEditLock]);
+  }, [isEditing, sendRoomMessage]);
 
   useEffect(() => {
     const handlePageHide = () => {
-      if (isEditing) {
+      if (isEditingRef.current) {
         void releaseLock();
       }
     };
     window.addEventListener('pagehide', handlePageHide);
     return () => {
       window.removeEventListener('pagehide', handlePageHide);
-      void releaseLock();
+      if (isEditingRef.current) {
+        void releaseLock();
+      }
     };
-  }, [isEditing, releaseLock]);
-
-  useEffect(() => {
-    transcriptTextRef.current = transcriptText;
-  }, [transcriptText]);
+  }, [releaseLock]);
 
   useEffect(() => {
     activeLockRef.current = activeLock;
@@ -923,6 +953,7 @@ function MinutesPage() {
           meetingResult: draft.meetingResult,
           otherNotes: draft.otherNotes,
           minutesAttachment: activeReservation.minutesAttachment,
+          version: activeReservation.version,
         });
         setMinutesReservation(updated);
         lastSavedKeyRef.current = currentKey;
@@ -930,6 +961,18 @@ function MinutesPage() {
         if (notice === 'completed') setSaveMessage('수정완료되었습니다.');
         return true;
       } catch (error) {
+        if (isVersionConflictError(error)) {
+          // 다른 곳에서 먼저 저장했으면 최신 회의록으로 다시 맞추고 알린다.
+          const latest = await getReservationMinutes(activeReservation.id);
+          if (latest) {
+            setMinutesReservation(latest);
+            applyReservationToDraft(latest);
+          }
+          setSaveMessage(
+            '다른 사용자가 먼저 저장해 최신 회의록을 다시 불러왔습니다. 내용을 확인한 뒤 다시 수정하세요.'
+          );
+          return false;
+        }
         const message = error instanceof Error ? error.message : '저장에 실패했습니다.';
         setSaveMessage(message);
         return false;
@@ -939,9 +982,11 @@ function MinutesPage() {
     },
     [
       activeReservation,
+      applyReservationToDraft,
       draft,
       externalAttendeeQuery,
       externalAttendeeTokens,
+      getReservationMinutes,
       isEditing,
       saveReservationMinutes,
       selectedAttendees,
@@ -961,24 +1006,6 @@ function MinutesPage() {
     })();
   }, [getReservationMinutes, isEditing, reservationId]);
 
-  useEffect(() => {
-    if (!reservationId) return;
-    if (isEditing) return;
-    const syncLock = () => {
-      void (async () => {
-        const previousLock = activeLockRef.current;
-        const lock = await readLock();
-        setActiveLock(lock);
-        if (previousLock && previousLock.holderUserId !== viewerId && lock === null) {
-          await loadLatestMinutesSnapshot();
-        }
-      })();
-    };
-    syncLock();
-    const intervalId = window.setInterval(syncLock, LOCK_HEARTBEAT_MS);
-    return () => window.clearInterval(intervalId);
-  }, [isEditing, loadLatestMinutesSnapshot, readLock, reservationId, viewerId]);
-
   useEffect(() => {
     void loadLatestMinutesSnapshot();
   }, [loadLatestMinutesSnapshot]);
@@ -1014,6 +1041,7 @@ function MinutesPage() {
       void (async () => {
         const saved = await persistDraft('completed', { commitPendingExternalAttendees: true });
         if (!saved) return;
+        isEditingRef.current = false;
         setIsEditing(false);
         await releaseLock();
       })();
@@ -1046,18 +1074,6 @@ function MinutesPage() {
     URL.revokeObjectURL(url);
   };
 
-  const blobToBase64 = async (blob: Blob): Promise<string> => {
-    const buffer = await blob.arrayBuffer();
-    let binary = '';
-    const bytes = new Uint8Array(buffer);
-    const chunkSize = 0x8000;
-    for (let i = 0; i < bytes.length; i += chunkSize) {
-      const chunk = bytes.subarray(i, i + chunkSize);
-      binary += String.fromCharCode(...chunk);
-    }
-    return window.btoa(binary);
-  };
-
   const stopAudioResources = useCallback(() => {
     recordingActiveRef.current = false;
     if (rafIdRef.current !== null) {
@@ -1075,51 +1091,155 @@ function MinutesPage() {
     mediaStreamRef.current = null;
   }, []);
 
+  const finishTranscriptionJob = useCallback(() => {
+    transcribePendingCountRef.current = Math.max(0, transcribePendingCountRef.current - 1);
+    if (transcribePendingCountRef.current > 0) return;
+    setIsTranscribing(false);
+    transcriptionDrainResolversRef.current.splice(0).forEach((resolve) => resolve());
+  }, []);
+
+  useEffect(() => {
+    const applyLiveState = (state: MinutesLiveStateDto) => {
+      transcriptSeqRef.current = state.transcript_seq ?? 0;
+      setTranscriptText(state.transcript_text ?? '');
+      setSharedIsRecording(state.is_recording);
+      setSharedRecorderName(state.updated_by_name ?? '');
+      setSharedRecorderUserId(state.updated_by_user_id ?? '');
+    };
+
+    const applyLock = (item: MinutesLockDto | null) => {
+      const previousLock = activeLockRef.current;
+      setActiveLock(item ? toEditLock(item) : null);
+      if (item?.holder_user_id === viewerId) {
+        settleLockRequest(true);
+        return;
+      }
+      if (isEditingRef.current) {
+        // 잠금을 잃었으면 더 고치지 못하게 수정 모드를 끝낸다.
+        isEditingRef.current = false;
+        setIsEditing(false);
+        setSaveMessage(
+          item
+            ? `${item.holder_name}가 수정하고있습니다.`
+            : '수정 권한이 만료되어 수정 모드를 종료했습니다.'
+        );
+      }
+      if (previousLock && previousLock.holderUserId !== viewerId && item === null) {
+        void loadLatestMinutesSnapshot();
+      }
+    };
+
+    handleRoomMessageRef.current = (message: MinutesRoomMessage) => {
+      if (message.type === 'snapshot') {
+        applyLiveState(message.live_state);
+        if (isEditingRef.current && (!message.lock || message.lock.holder_user_id === viewerId)) {
+          // 수정 중에 재접속했으면 이 연결로 잠금을 다시 잡는다.
+          setActiveLock(message.lock ? toEditLock(message.lock) : null);
+          sendRoomMessage({ type: 'heartbeat', ttl_seconds: LOCK_TTL_SECONDS });
+          return;
+        }
+        applyLock(message.lock);
+      } else if (message.type === 'presence') {
+        setRoomMembers(message.members);
+      } else if (message.type === 'lock') {
+        applyLock(message.lock);
+      } else if (message.type === 'live_state') {
+        applyLiveState(message.live_state);
+      } else if (message.type === 'transcript_chunk') {
+        // 이미 스냅샷에 포함된 조각은 건너뛴다.
+        if (message.chunk.seq <= transcriptSeqRef.current) return;
+        transcriptSeqRef.current = message.chunk.seq;
+        setTranscriptText((previous) => previous + message.chunk.text);
+      } else if (message.type === 'transcription') {
+        const job: TranscriptionJobEventDto = message.job;
+        if (job.user_id !== viewerId) return;
+        const errorMessage = job.error?.message ?? '';
+        if (
+          job.status === 'failed' &&
+          !errorMessage.includes('Audio file might be corrupted or unsupported')
+        ) {
+          setSaveMessage(errorMessage || '전사 중 오류가 발생했습니다.');
+        }
+        finishTranscriptionJob();
+      } else if (message.type === 'error') {
+        if (pendingLockRequestRef.current) {
+          settleLockRequest(false, message.error.message);
+          return;
+        }
+        setSaveMessage(message.error.message);
+      }
+    };
+  }, [
+    finishTranscriptionJob,
+    loadLatestMinutesSnapshot,
+    sendRoomMessage,
+    settleLockRequest,
+    toEditLock,
+    viewerId,
+  ]);
+
+  useEffect(() => {
+    if (!reservationId) return;
+    // 잠금/하트비트/녹음 상태/전사 결과를 모두 협업 채널 하나로 주고받는다.
+    // 수정 중에도 연결을 유지한다. 서버는 이 연결로 잡은 잠금만 연결이 끊길 때 푼다.
+    let reconnectTimer: number | undefined;
+    let closed = false;
+
+    const connect = () => {
+      const socket = openMinutesRoom(reservationId);
+      roomSocketRef.current = socket;
+      socket.onmessage = (event: MessageEvent<string>) => {
+        handleRoomMessageRef.current(JSON.parse(event.data) as MinutesRoomMessage);
+      };
+      socket.onclose = () => {
+        if (roomSocketRef.current === socket) roomSocketRef.current = null;
+        settleLockRequest(false, '회의록 협업 채널 연결이 끊겼습니다.');
+        if (closed) return;
+        reconnectTimer = window.setTimeout(connect, LOCK_HEARTBEAT_MS);
+      };
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      window.clearTimeout(reconnectTimer);
+      roomSocketRef.current?.close();
+      roomSocketRef.current = null;
+    };
+  }, [reservationId, settleLockRequest]);
+
+  const waitForTranscriptionJobs = useCallback(
+    () =>
+      new Promise<void>((resolve) => {
+        if (transcribePendingCountRef.current === 0) {
+          resolve();
+          return;
+        }
+        transcriptionDrainResolversRef.current.push(resolve);
+        // 결과 이벤트를 놓쳐도 녹음 종료가 멈추지 않게 한다.
+        window.setTimeout(resolve, TRANSCRIPTION_DRAIN_TIMEOUT_MS);
+      }),
+    []
+  );
+
   const queueTranscriptionChunk = useCallback(
     async (blob: Blob) => {
       if (blob.size === 0 || !reservationId) return;
-      transcriptQueueRef.current = transcriptQueueRef.current
-        .then(async () => {
-          transcribePendingCountRef.current += 1;
-          setIsTranscribing(true);
-          const base64 = await blobToBase64(blob);
-          const result = await transcribeChunk({
-            audio_base64: base64,
-            mime_type: blob.type || 'audio/webm',
-          });
-          const nextText = result.text.trim();
-          if (!nextText) return;
-          const baseText = recordingSessionBaseTextRef.current.trim();
-          const sessionText = recordingSessionTextRef.current.trim();
-          const separator = insertParagraphBreakRef.current ? '\n\n' : '\n';
-          const nextSessionText = sessionText ? `${sessionText}${separator}${nextText}` : nextText;
-          recordingSessionTextRef.current = nextSessionText;
-          const mergedText = baseText ? `${baseText}\n\n${nextSessionText}` : nextSessionText;
-          insertParagraphBreakRef.current = false;
-          const liveState = await updateMinutesLiveStateApi(reservationId, {
-            transcript_text: mergedText,
-          });
-          setTranscriptText(liveState.transcript_text ?? '');
-          setSharedIsRecording(liveState.is_recording);
-          setSharedRecorderName(liveState.updated_by_name ?? '');
-          setSharedRecorderUserId(liveState.updated_by_user_id ?? '');
-        })
-        .catch((error: unknown) => {
-          const message = error instanceof Error ? error.message : '전사 중 오류가 발생했습니다.';
-          if (message.includes('Audio file might be corrupted or unsupported')) {
-            return;
-          }
-          setSaveMessage(message);
-        })
-        .finally(() => {
-          transcribePendingCountRef.current = Math.max(0, transcribePendingCountRef.current - 1);
-          if (transcribePendingCountRef.current === 0) {
-            setIsTranscribing(false);
-          }
-        });
-      await transcriptQueueRef.current;
+      // 첫 청크는 기존 전사와 문단을 나눈다. 서버가 전사가 비어 있으면 구분자를 생략한다.
+      const paragraphBreak = recordingSessionChunkCountRef.current === 0 || insertParagraphBreakRef.current;
+      recordingSessionChunkCountRef.current += 1;
+      insertParagraphBreakRef.current = false;
+      transcribePendingCountRef.current += 1;
+      setIsTranscribing(true);
+      try {
+        // 접수만 하고 넘어간다. 전사 결과는 제출 순서대로 회의록 실시간 이벤트로 돌아온다.
+        await submitTranscriptionJob(reservationId, blob, { paragraphBreak });
+      } catch (error) {
+        setSaveMessage(error instanceof Error ? error.message : '전사 중 오류가 발생했습니다.');
+        finishTranscriptionJob();
+      }
     },
-    [reservationId]
+    [finishTranscriptionJob, reservationId]
   );
 
   const flushPcmSegment = useCallback(
@@ -1148,8 +1268,7 @@ function MinutesPage() {
 
   const startSingleRecording = useCallback(
     async (stream: MediaStream) => {
-      recordingSessionBaseTextRef.current = transcriptTextRef.current.trim();
-      recordingSessionTextRef.current = '';
+      recordingSessionChunkCountRef.current = 0;
       mediaStreamRef.current = stream;
       recordingActiveRef.current = true;
       segmentChunksRef.current = [];
@@ -1221,23 +1340,12 @@ function MinutesPage() {
       setIsRecording(true);
       setIsStoppingRecording(false);
       setSaveMessage('녹음을 시작했습니다. 약 15초 단위로 음성 청크를 전사해 반영합니다.');
-      if (reservationId) {
-        try {
-          const liveState = await updateMinutesLiveStateApi(reservationId, {
-            is_recording: true,
-          });
-          setSharedIsRecording(liveState.is_recording);
-          setSharedRecorderName(liveState.updated_by_name ?? '');
-          setSharedRecorderUserId(liveState.updated_by_user_id ?? '');
-          setTranscriptText(liveState.transcript_text ?? '');
-        } catch (error) {
-          const message =
-            error instanceof Error ? error.message : '녹음 상태 동기화에 실패했습니다.';
-          setSaveMessage(message);
-        }
+      // 녹음 상태는 채널로 보내고, 되돌아오는 live_state 메시지로 화면을 맞춘다.
+      if (!sendRoomMessage({ type: 'live_state', is_recording: true })) {
+        setSaveMessage('녹음 상태 동기화에 실패했습니다.');
       }
     },
-    [flushPcmSegment, reservationId]
+    [flushPcmSegment, sendRoomMessage]
   );
 
   const handleStartRecording = useCallback(() => {
@@ -1295,27 +1403,20 @@ function MinutesPage() {
     setIsRecording(false);
     void (async () => {
       try {
-        await transcriptQueueRef.current;
-        if (reservationId) {
-          const liveState = await updateMinutesLiveStateApi(reservationId, {
-            is_recording: false,
-          });
-          setSharedIsRecording(liveState.is_recording);
-          setSharedRecorderName(liveState.updated_by_name ?? '');
-          setSharedRecorderUserId(liveState.updated_by_user_id ?? '');
-          setTranscriptText(liveState.transcript_text ?? '');
+        await waitForTranscriptionJobs();
+        if (!sendRoomMessage({ type: 'live_state', is_recording: false })) {
+          throw new Error('녹음 상태 동기화에 실패했습니다.');
         }
         setSaveMessage('녹음이 종료되었습니다.');
       } catch {
         setSaveMessage('녹음은 종료되었지만 마지막 전사 반영에 실패했습니다.');
       } finally {
-        recordingSessionBaseTextRef.current = '';
-        recordingSessionTextRef.current = '';
+        recordingSessionChunkCountRef.current = 0;
         setIsStoppingRecording(false);
       }
     })();
     setSaveMessage('녹음을 종료하는 중입니다...');
-  }, [flushPcmSegment, isStoppingRecording, reservationId, stopAudioResources]);
+  }, [flushPcmSegment, isStoppingRecording, sendRoomMessage, stopAudioResources, waitForTranscriptionJobs]);
 
   const handleGenerateMinutes = useCallback(() => {
     if (isGeneratingSummaryRef.current) {
@@ -1338,12 +1439,18 @@ function MinutesPage() {
           });
           setSaveMessage('회의록 자동생성 중입니다...');
         });
-        const result = await suggestMinutesFromTranscript({
-          transcript: transcriptText,
-          existing_agenda: draft.agenda,
-          existing_meeting_content: draft.meetingContent,
-          existing_meeting_result: draft.meetingResult,
-        });
+        // 항목이 파싱되는 대로 제안 목록에 먼저 보여주고, 끝나면 최종 결과로 맞춘다.
+        const result = await streamMinutesSuggestion(
+          {
+            transcript: transcriptText,
+            existing_agenda: draft.agenda,
+            existing_meeting_content: draft.meetingContent,
+            existing_meeting_result: draft.meetingResult,
+          },
+          (section, text) => {
+            setSummarySuggestion((prev) => ({ ...prev, [section]: [...prev[section], text] }));
+          }
+        );
         setSummarySuggestion(result);
         setSummaryGeneratedAt(Date.now());
         if (
@@ -1488,6 +1595,11 @@ function MinutesPage() {
                   {activeLock?.holderName}가 수정중입니다.
                 </p>
               )}
+              {roomMembers.length > 1 && (
+                <p className="status-info-value" style={{ margin: 0 }}>
+                  함께 보는 중: {roomMembers.map((member) => member.name).join(', ')}
+                </p>
+              )}
               {!lockByOther && saveMessage && (
                 <p
                   className="status-info-value"
@@ -1874,23 +1986,11 @@ function MinutesPage() {
                     setSaveMessage('수정 모드에서만 전사를 초기화할 수 있습니다.');
                     return;
                   }
-                  void (async () => {
-                    try {
-                      const liveState = await updateMinutesLiveStateApi(reservationId, {
-                        transcript_text: '',
-                      });
-                      recordingSessionBaseTextRef.current = '';
-                      recordingSessionTextRef.current = '';
-                      setTranscriptText(liveState.transcript_text ?? '');
-                      setSharedIsRecording(liveState.is_recording);
-                      setSharedRecorderName(liveState.updated_by_name ?? '');
-                      setSharedRecorderUserId(liveState.updated_by_user_id ?? '');
-                    } catch (error) {
-                      const message =
-                        error instanceof Error ? error.message : '전사 초기화에 실패했습니다.';
-                      setSaveMessage(message);
-                    }
-                  })();
+                  if (!sendRoomMessage({ type: 'live_state', transcript_text: '' })) {
+                    setSaveMessage('전사 초기화에 실패했습니다.');
+                    return;
+                  }
+                  recordingSessionChunkCountRef.current = 0;
                 }}
                 disabled={isRecording || isTranscribing || !isEditing}
                 style={{
@@ -132,11 +132,17 @@ function TimetablePage() {
     };
 
     eventSource.addEventListener('reservation', handleReservationEvent);
+    eventSource.addEventListener('reservations', handleReservationEvent);
+    eventSource.addEventListener('reset', handleReservationEvent);
+    eventSource.addEventListener('resync', handleReservationEvent);
     window.addEventListener('focus', handleFocus);
 
     return () => {
       isActive = false;
       eventSource.removeEventListener('reservation', handleReservationEvent);
+      eventSource.removeEventListener('reservations', handleReservationEvent);
+      eventSource.removeEventListener('reset', handleReservationEvent);
+      eventSource.removeEventListener('resync', handleReservationEvent);
       eventSource.close();
       window.removeEventListener('focus', handleFocus);
     };
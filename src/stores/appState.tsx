@@ -147,6 +147,7 @@ function mapReservationDtoToAppReservation(
     creatorName: item.created_by?.name ?? '',
     roomId: item.room_id,
     roomName: item.room_name || item.room_id,
+    version: item.version,
   };
 }
 
@@ -392,6 +393,7 @@ function AppStateProvider({ children }: { children: ReactNode }) {
         meeting_result: payload.meetingResult,
         other_notes: payload.otherNotes,
         minutes_attachment: payload.minutesAttachment,
+        version: payload.version,
       });
       const mapped = mapReservationWithCurrentUsers(updated);
       setReservations((prev) => upsertReservation(prev, mapped));